@@ -46,7 +46,7 @@ async def process_comic_background(
         
         # Start metrics tracking
         if metrics_collector:
-            await metrics_collector.start_job_tracking(job_id)
+            metrics_collector.start_job_tracking(job_id)
         
         # Process the comic
         logger.info(f"Calling pipeline_orchestrator.process_comic for job {job_id}")
@@ -64,7 +64,7 @@ async def process_comic_background(
         
         # Update metrics
         if metrics_collector:
-            await metrics_collector.complete_job_tracking(job_id, result)
+            metrics_collector.complete_job_tracking(job_id, result)
         
     except Exception as e:
         import traceback
@@ -77,7 +77,7 @@ async def process_comic_background(
             await cost_monitor.error_job_tracking(job_id, str(e))
         
         if metrics_collector:
-            await metrics_collector.error_job_tracking(job_id, str(e))
+            metrics_collector.error_job_tracking(job_id, str(e))
         
         raise
     finally:
@@ -1,6 +1,7 @@
 """AWS SDK client initialization and management"""
 
 import boto3
+from botocore.config import Config
 from typing import Optional, Dict, Any
 from .config import settings
 
@@ -35,12 +36,26 @@ class AWSClients:
         
         return kwargs
 
+    def _client_config(self, max_pool_connections: int, **kwargs) -> Config:
+        """Get the connection settings shared by all service clients"""
+        return Config(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=settings.aws_tcp_keepalive,
+            **kwargs,
+        )
+
     @property
     def bedrock(self):
         """Get or create Bedrock client"""
         if self._bedrock_client is None:
+            # One pooled client is shared by every analyzer, so keep-alive
+            # connections are reused across concurrent batch requests
             self._bedrock_client = boto3.client(
                 "bedrock-runtime",
+                config=self._client_config(
+                    settings.bedrock_max_pool_connections,
+                    retries={"mode": settings.bedrock_retry_mode},
+                ),
                 **self._get_credentials_kwargs(),
             )
         return self._bedrock_client
@@ -51,6 +66,7 @@ class AWSClients:
         if self._polly_client is None:
             self._polly_client = boto3.client(
                 "polly",
+                config=self._client_config(settings.aws_max_pool_connections),
                 **self._get_credentials_kwargs(),
             )
         return self._polly_client
@@ -61,6 +77,7 @@ class AWSClients:
         if self._s3_client is None:
             self._s3_client = boto3.client(
                 "s3",
+                config=self._client_config(settings.aws_max_pool_connections),
                 **self._get_credentials_kwargs(),
             )
         return self._s3_client
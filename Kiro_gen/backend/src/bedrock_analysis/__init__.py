@@ -5,6 +5,7 @@ from .models import (
     Scene,
     PanelNarrative,
     VisualAnalysis,
+    BatchVisualAnalysis,
     DialogueLine,
     VoiceProfile,
     BedrockAnalysisContext,
@@ -17,6 +18,7 @@ __all__ = [
     "Scene",
     "PanelNarrative",
     "VisualAnalysis",
+    "BatchVisualAnalysis",
     "DialogueLine",
     "VoiceProfile",
     "BedrockAnalysisContext",
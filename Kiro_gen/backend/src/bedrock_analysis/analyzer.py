@@ -1,8 +1,9 @@
 """Bedrock vision-based panel analysis module"""
 
+import asyncio
 import json
 import base64
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from .models import (
     Character,
     Scene,
@@ -12,8 +13,14 @@ from .models import (
     BedrockAnalysisContext,
     VoiceProfile,
 )
+from .response_cache import ResponseCache
 from ..aws_clients import aws_clients
 
+# Converse responses shared by all analyzers. Retries and fallbacks that resend
+# an identical request are served from here instead of paying for the tokens
+# again.
+_response_cache = ResponseCache(max_size=1024, ttl_seconds=3600)
+
 
 class BedrockPanelAnalyzer:
     """Analyzes comic panels using Bedrock vision capabilities"""
@@ -34,14 +41,18 @@ class BedrockPanelAnalyzer:
         self.context = BedrockAnalysisContext()
 
     def analyze_panel(
-        self, panel_id: str, image_data: str, image_format: str = 'png', context=None
+        self,
+        panel_id: str,
+        image_data: Union[bytes, str],
+        image_format: str = 'png',
+        context=None,
     ) -> dict:
         """
         Analyze a single panel image using Bedrock vision capabilities.
 
         Args:
             panel_id: Unique identifier for the panel
-            image_data: Base64-encoded image data
+            image_data: Raw image bytes (base64-encoded strings are also accepted)
             image_format: Image format (png, jpeg)
             context: Optional analysis context
 
@@ -69,8 +80,6 @@ class BedrockPanelAnalyzer:
         Returns:
             List of dictionaries with visual analysis results for each panel
         """
-        import base64
-        
         results = []
         context = context_manager.get_context() if context_manager else None
         
@@ -84,10 +93,6 @@ class BedrockPanelAnalyzer:
                 else:
                     image_data = panel
                 
-                # Encode to base64 if needed
-                if isinstance(image_data, bytes):
-                    image_data = base64.b64encode(image_data).decode('utf-8')
-                
                 # Get panel ID
                 if hasattr(panel, 'id'):
                     panel_id = panel.id
@@ -174,12 +179,14 @@ Format your response as JSON with these exact keys:
 
         return prompt
 
-    def _call_bedrock_vision(self, image_base64: str, prompt: str, image_format: str = 'png') -> dict:
+    def _call_bedrock_vision(
+        self, image_data: Union[bytes, str], prompt: str, image_format: str = 'png'
+    ) -> dict:
         """
         Call Bedrock with vision analysis request.
 
         Args:
-            image_base64: Base64-encoded image data
+            image_data: Raw image bytes (base64-encoded strings are also accepted)
             prompt: Analysis prompt for the model
             image_format: Image format (png, jpeg)
 
@@ -187,37 +194,55 @@ Format your response as JSON with these exact keys:
             Dictionary with visual analysis results
         """
         try:
-            # Determine media type
-            media_type = f"image/{image_format}" if image_format else "image/png"
+            # The Converse API takes raw bytes and encodes them on the wire itself
+            if isinstance(image_data, str):
+                image_data = base64.b64decode(image_data)
+
+            # Determine image format
+            image_format = (image_format or "png").lower()
+            if image_format == "jpg":
+                image_format = "jpeg"
             
-            # Prepare message with image
-            message = {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": media_type,
-                            "data": image_base64,
-                        },
-                    },
-                    {"type": "text", "text": prompt},
-                ],
-            }
-
-            # Call Bedrock
-            response = self.bedrock_client.converse(
-                modelId=self.model_id,
-                messages=[message],
-                inferenceConfig={"maxTokens": 2048, "temperature": 0.7},
+            # Identical requests reuse the cached response text; it is parsed
+            # again on every hit so callers never share the result dict
+            cache_key = ResponseCache.make_key(
+                self.model_id, prompt, image_format, image_data
             )
+            response_text = _response_cache.get(cache_key)
+            cached = response_text is not None
+
+            if not cached:
+                # Prepare message with image
+                message = {
+                    "role": "user",
+                    "content": [
+                        {
+                            "image": {
+                                "format": image_format,
+                                "source": {"bytes": image_data},
+                            },
+                        },
+                        {"text": prompt},
+                    ],
+                }
+
+                # Call Bedrock
+                response = self.bedrock_client.converse(
+                    modelId=self.model_id,
+                    messages=[message],
+                    inferenceConfig={"maxTokens": 2048, "temperature": 0.7},
+                )
 
-            # Extract response text
-            response_text = response["output"]["message"]["content"][0]["text"]
+                # Extract response text
+                response_text = response["output"]["message"]["content"][0]["text"]
 
             # Parse JSON response
             analysis = json.loads(response_text)
+
+            # Only cache text that parsed, so a malformed reply is asked for
+            # again rather than pinned to the fallback for the whole TTL
+            if not cached:
+                _response_cache.set(cache_key, response_text)
             return analysis
 
         except json.JSONDecodeError:
@@ -292,14 +317,6 @@ Format your response as JSON with these exact keys:
         Returns:
             Dictionary with visual analysis results
         """
-        import base64
-        
-        # Encode image data to base64
-        if isinstance(panel_data, bytes):
-            image_base64 = base64.b64encode(panel_data).decode('utf-8')
-        else:
-            image_base64 = panel_data
-        
         # Use simplified prompt for reliability
         simplified_prompt = """Analyze this comic panel image briefly.
 
@@ -312,7 +329,11 @@ Provide a JSON response with:
 }"""
         
         try:
-            result = self._call_bedrock_vision(image_base64, simplified_prompt, 'png')
+            # Run the blocking Bedrock call off the event loop so concurrent
+            # fallback attempts overlap
+            result = await asyncio.to_thread(
+                self._call_bedrock_vision, panel_data, simplified_prompt, 'png'
+            )
             return result
         except Exception as e:
             # Return minimal fallback
@@ -1,7 +1,7 @@
 """Character identification and tracking for comic panels."""
 
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -10,7 +10,7 @@ from .models import Character, VoiceProfile
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterAppearance:
     """Record of a character's appearance in a panel."""
     character_id: str
@@ -26,8 +26,12 @@ class CharacterTracker:
     def __init__(self):
         """Initialize character tracker."""
         self.characters: Dict[str, Character] = {}
+        # Lowercased name -> first character registered with that name
+        self._characters_by_name: Dict[str, Character] = {}
         self.appearances: List[CharacterAppearance] = []
         self.character_counter = 0
+        # character_id -> (voice profile, serialized voice profile)
+        self._voice_profile_dicts: Dict[str, Tuple[VoiceProfile, Dict[str, str]]] = {}
 
     def register_character(
         self,
@@ -66,7 +70,9 @@ class CharacterTracker:
         )
         
         self.characters[character_id] = character
-        logger.info(f"Registered new character: {name} (ID: {character_id})")
+        self._characters_by_name.setdefault(name.lower(), character)
+        self._cache_voice_profile_dict(character_id, voice_profile)
+        logger.info("Registered new character: %s (ID: %s)", name, character_id)
         
         return character
 
@@ -90,11 +96,11 @@ class CharacterTracker:
         Returns:
             CharacterAppearance object, or None if character not found
         """
-        if character_id not in self.characters:
-            logger.warning(f"Character {character_id} not found")
+        character = self.characters.get(character_id)
+        if character is None:
+            logger.warning("Character %s not found", character_id)
             return None
         
-        character = self.characters[character_id]
         character.last_seen = panel_number
         
         # Update visual description if provided
@@ -110,7 +116,7 @@ class CharacterTracker:
         )
         
         self.appearances.append(appearance)
-        logger.info(f"Recorded appearance of {character.name} in panel {panel_number}")
+        logger.info("Recorded appearance of %s in panel %s", character.name, panel_number)
         
         return appearance
 
@@ -134,10 +140,7 @@ class CharacterTracker:
         Returns:
             Character object, or None if not found
         """
-        for character in self.characters.values():
-            if character.name.lower() == name.lower():
-                return character
-        return None
+        return self._characters_by_name.get(name.lower())
 
     def get_all_characters(self) -> List[Character]:
         """Get all registered characters.
@@ -195,10 +198,10 @@ class CharacterTracker:
         Returns:
             True if character introduced by this panel
         """
-        if character_id not in self.characters:
+        character = self.characters.get(character_id)
+        if character is None:
             return False
         
-        character = self.characters[character_id]
         return character.first_introduced <= panel_number
 
     def get_introduced_characters(self, panel_number: int) -> List[Character]:
@@ -239,12 +242,14 @@ class CharacterTracker:
         Returns:
             True if update successful
         """
-        if character_id not in self.characters:
-            logger.warning(f"Character {character_id} not found")
+        character = self.characters.get(character_id)
+        if character is None:
+            logger.warning("Character %s not found", character_id)
             return False
         
-        self.characters[character_id].voice_profile = voice_profile
-        logger.info(f"Updated voice profile for character {character_id}")
+        character.voice_profile = voice_profile
+        self._cache_voice_profile_dict(character_id, voice_profile)
+        logger.info("Updated voice profile for character %s", character_id)
         return True
 
     def add_visual_signature(self, character_id: str, signature: str) -> bool:
@@ -257,14 +262,14 @@ class CharacterTracker:
         Returns:
             True if added successfully
         """
-        if character_id not in self.characters:
-            logger.warning(f"Character {character_id} not found")
+        character = self.characters.get(character_id)
+        if character is None:
+            logger.warning("Character %s not found", character_id)
             return False
         
-        character = self.characters[character_id]
         if signature not in character.visual_signatures:
             character.visual_signatures.append(signature)
-            logger.info(f"Added visual signature to character {character_id}")
+            logger.info("Added visual signature to character %s", character_id)
         
         return True
 
@@ -277,10 +282,10 @@ class CharacterTracker:
         Returns:
             Dictionary with character summary, or None if not found
         """
-        if character_id not in self.characters:
+        character = self.characters.get(character_id)
+        if character is None:
             return None
         
-        character = self.characters[character_id]
         appearances = self.get_character_appearances(character_id)
         
         return {
@@ -288,21 +293,58 @@ class CharacterTracker:
             'name': character.name,
             'visual_description': character.visual_description,
             'personality': character.personality,
-            'voice_profile': {
-                'voice_id': character.voice_profile.voice_id,
-                'gender': character.voice_profile.gender,
-                'age': character.voice_profile.age,
-                'tone': character.voice_profile.tone,
-            },
+            'voice_profile': self._get_voice_profile_dict(character),
             'first_introduced': character.first_introduced,
             'last_seen': character.last_seen,
             'appearance_count': len(appearances),
             'visual_signatures': character.visual_signatures,
         }
 
+    def _cache_voice_profile_dict(
+        self,
+        character_id: str,
+        voice_profile: VoiceProfile
+    ) -> Dict[str, str]:
+        """Serialize a voice profile once and cache it for summaries.
+        
+        Args:
+            character_id: Character ID
+            voice_profile: Voice profile to serialize
+            
+        Returns:
+            Serialized voice profile
+        """
+        voice_profile_dict = {
+            'voice_id': voice_profile.voice_id,
+            'gender': voice_profile.gender,
+            'age': voice_profile.age,
+            'tone': voice_profile.tone,
+        }
+        self._voice_profile_dicts[character_id] = (voice_profile, voice_profile_dict)
+        return voice_profile_dict
+
+    def _get_voice_profile_dict(self, character: Character) -> Dict[str, str]:
+        """Get the cached serialization of a character's voice profile.
+        
+        The cache entry is rebuilt if the character's voice profile object was
+        replaced without going through update_character_voice.
+        
+        Args:
+            character: Character object
+            
+        Returns:
+            Serialized voice profile
+        """
+        cached = self._voice_profile_dicts.get(character.id)
+        if cached is not None and cached[0] is character.voice_profile:
+            return cached[1]
+        return self._cache_voice_profile_dict(character.id, character.voice_profile)
+
     def reset(self) -> None:
         """Reset tracker for new comic."""
         self.characters.clear()
+        self._characters_by_name.clear()
         self.appearances.clear()
+        self._voice_profile_dicts.clear()
         self.character_counter = 0
         logger.info("Character tracker reset")
@@ -90,8 +90,9 @@ class ContextManager:
             character_id: Character identifier
             panel_number: Current panel number
         """
-        if character_id in self.context.characters:
-            self.context.characters[character_id].last_seen = panel_number
+        character = self.context.characters.get(character_id)
+        if character is not None:
+            character.last_seen = panel_number
 
     def add_scene(
         self,
@@ -158,8 +159,9 @@ class ContextManager:
         Returns:
             Scene object or None if not found
         """
+        target = location.casefold()
         for scene in self.context.scenes.values():
-            if scene.location.lower() == location.lower():
+            if scene.location_key == target:
                 return scene
         return None
 
@@ -171,8 +173,9 @@ class ContextManager:
             scene_id: Scene identifier
             panel_number: Current panel number
         """
-        if scene_id in self.context.scenes:
-            self.context.scenes[scene_id].last_seen = panel_number
+        scene = self.context.scenes.get(scene_id)
+        if scene is not None:
+            scene.last_seen = panel_number
 
     def get_all_characters(self) -> Dict[str, Character]:
         """Get all characters in context"""
@@ -1,11 +1,12 @@
 """Data models for Bedrock analysis module"""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceProfile:
     """Voice profile for a character"""
 
@@ -15,7 +16,7 @@ class VoiceProfile:
     tone: str  # e.g., 'heroic', 'comedic', 'mysterious'
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """Represents a character in the comic"""
 
@@ -27,9 +28,27 @@ class Character:
     first_introduced: int  # panel number
     last_seen: int
     visual_signatures: List[str] = field(default_factory=list)
-
-
-@dataclass
+    # (visual_description, lowercased) pair backing visual_description_lower
+    _visual_description_lower: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (name, visual_description, personality, introduction) memoized by
+    # NarrativeGenerator._generate_character_introduction
+    _introduction: Optional[Tuple[str, str, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def visual_description_lower(self) -> str:
+        """Lowercased visual description, recomputed only when it changes"""
+        cached = self._visual_description_lower
+        if cached is None or cached[0] is not self.visual_description:
+            cached = (self.visual_description, self.visual_description.lower())
+            self._visual_description_lower = cached
+        return cached[1]
+
+
+@dataclass(slots=True)
 class Scene:
     """Represents a scene/location in the comic"""
 
@@ -42,9 +61,22 @@ class Scene:
     atmosphere: Optional[str] = None
     color_palette: List[str] = field(default_factory=list)
     lighting: Optional[str] = None
-
-
-@dataclass
+    # (location, case-folded) pair backing location_key
+    _location_key: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def location_key(self) -> str:
+        """Interned case-folded location, recomputed only when it changes"""
+        cached = self._location_key
+        if cached is None or cached[0] is not self.location:
+            cached = (self.location, sys.intern(self.location.casefold()))
+            self._location_key = cached
+        return cached[1]
+
+
+@dataclass(slots=True)
 class DialogueLine:
     """Represents a line of dialogue in a panel"""
 
@@ -53,7 +85,7 @@ class DialogueLine:
     emotion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualAnalysis:
     """Visual analysis results from Bedrock"""
 
@@ -64,7 +96,49 @@ class VisualAnalysis:
     mood: str  # Emotional tone
 
 
-@dataclass
+@dataclass(slots=True)
+class BatchVisualAnalysis:
+    """Visual analysis results for a batch of panels, stored as parallel lists"""
+
+    panel_ids: List[str] = field(default_factory=list)
+    characters: List[List[str]] = field(default_factory=list)
+    objects: List[List[str]] = field(default_factory=list)
+    spatial_layouts: List[str] = field(default_factory=list)
+    colors: List[List[str]] = field(default_factory=list)
+    moods: List[str] = field(default_factory=list)
+
+    def append(
+        self,
+        panel_id: str,
+        characters: List[str],
+        objects: List[str],
+        spatial_layout: str,
+        colors: List[str],
+        mood: str,
+    ) -> None:
+        """Append one panel's visual analysis to the batch"""
+        self.panel_ids.append(panel_id)
+        self.characters.append(characters)
+        self.objects.append(objects)
+        self.spatial_layouts.append(spatial_layout)
+        self.colors.append(colors)
+        self.moods.append(mood)
+
+    def __len__(self) -> int:
+        return len(self.panel_ids)
+
+    def get_visual_analysis(self, index: int) -> VisualAnalysis:
+        """Materialize a single panel's VisualAnalysis"""
+        return VisualAnalysis(
+            characters=self.characters[index],
+            objects=self.objects[index],
+            spatial_layout=self.spatial_layouts[index],
+            colors=self.colors[index],
+            mood=self.moods[index],
+        )
+
+
+@dataclass(slots=True)
 class PanelNarrative:
     """Generated narrative for a single panel"""
 
@@ -77,7 +151,7 @@ class PanelNarrative:
     audio_description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BedrockAnalysisContext:
     """Context maintained throughout comic processing"""
 
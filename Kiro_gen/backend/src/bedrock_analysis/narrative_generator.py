@@ -1,13 +1,57 @@
 """Narrative generation following professional audio description standards."""
 
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import re
 
+try:
+    import re2  # google-re2: linear-time automaton matching
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
 from .models import PanelNarrative, Character, Scene, DialogueLine
 
 logger = logging.getLogger(__name__)
 
+# Regex engine for the narrative text patterns. Flags are written inline as
+# (?i) because both engines accept that syntax.
+_regex = re2 if HAS_RE2 else re
+
+# Common past tense verbs and their present tense replacements
+_PRESENT_TENSE_MAP = {
+    'walked': 'walks',
+    'ran': 'runs',
+    'jumped': 'jumps',
+    'sat': 'sits',
+    'stood': 'stands',
+    'laid': 'lies',
+    'spoke': 'speaks',
+    'shouted': 'shouts',
+    'whispered': 'whispers',
+    'looked': 'looks',
+    'saw': 'sees',
+    'watched': 'watches',
+    'was': 'is',
+    'were': 'are',
+    'had': 'has',
+}
+
+# Single alternation so the text is scanned once for every past tense verb
+_PAST_TENSE_VERB_RE = _regex.compile(
+    r'(?i)\b(' + '|'.join(map(re.escape, _PRESENT_TENSE_MAP)) + r')\b'
+)
+
+# Narrative validation patterns
+_PAST_TENSE_RE = _regex.compile(r'(?i)\b(was|were|had|walked|ran|jumped)\b')
+_PASSIVE_VOICE_RE = _regex.compile(r'(?i)\bwas\s+\w+ed\b')
+_SPATIAL_KEYWORD_RE = _regex.compile(r'(?i)\b(left|right|center|above|below|behind|front)\b')
+
+
+def _to_present_tense(match) -> str:
+    """Substitution callback mapping a past tense verb match to present tense"""
+    return _PRESENT_TENSE_MAP[match.group(0).lower()]
+
 
 class NarrativeGenerator:
     """Generates audio descriptions following professional standards."""
@@ -45,14 +89,14 @@ class NarrativeGenerator:
         if is_first_appearance is None:
             is_first_appearance = {}
         
-        narrative_parts = []
-        
         # Add scene description if new scene
+        scene_intro = None
         if panel_narrative.scene_description:
             scene_intro = self._generate_scene_introduction(
                 panel_narrative.scene_description
             )
-            narrative_parts.append(scene_intro)
+        
+        narrative_parts = []
         
         # Add character introductions if new characters
         for char_id in panel_narrative.visual_analysis.characters:
@@ -80,13 +124,18 @@ class NarrativeGenerator:
             narrative_parts.append(dialogue_text)
         
         # Combine all parts
-        full_narrative = ' '.join(filter(None, narrative_parts))
+        full_narrative = ' '.join(narrative_parts)
         
-        # Ensure present tense and active voice
+        # Ensure present tense and active voice. The scene introduction is
+        # already in present tense, so it is not scanned a second time.
         full_narrative = self._enforce_present_tense(full_narrative)
+        if scene_intro:
+            full_narrative = (
+                f"{scene_intro} {full_narrative}" if full_narrative else scene_intro
+            )
         
         self.generated_narratives.append(full_narrative)
-        logger.info(f"Generated narrative for panel {panel_narrative.panel_id}")
+        logger.info("Generated narrative for panel %s", panel_narrative.panel_id)
         
         return full_narrative
 
@@ -114,15 +163,34 @@ class NarrativeGenerator:
         Returns:
             Formatted character introduction
         """
-        intro = f"{character.name} appears"
+        # Reuse the cached introduction while the fields it was built from
+        # are unchanged; tracker updates replace them with new objects.
+        cached = character._introduction
+        if (
+            cached is not None
+            and cached[0] is character.name
+            and cached[1] is character.visual_description
+            and cached[2] is character.personality
+        ):
+            return cached[3]
+        
+        parts = [f"{character.name} appears"]
         
         if character.visual_description:
-            intro += f", {character.visual_description.lower()}"
+            parts.append(f", {character.visual_description_lower}")
         
         if character.personality:
-            intro += f". {character.personality}"
-        
-        return intro + "."
+            parts.append(f". {character.personality}")
+        
+        parts.append(".")
+        introduction = ''.join(parts)
+        character._introduction = (
+            character.name,
+            character.visual_description,
+            character.personality,
+            introduction,
+        )
+        return introduction
 
     def _enhance_action_description(
         self,
@@ -138,22 +206,22 @@ class NarrativeGenerator:
         Returns:
             Enhanced action description with spatial details
         """
-        enhanced = action_description
+        parts = [action_description]
         
         # Add spatial layout if available
         if visual_analysis.spatial_layout:
-            enhanced += f" {visual_analysis.spatial_layout}"
+            parts.append(f" {visual_analysis.spatial_layout}")
         
         # Add color context if available
         if visual_analysis.colors:
             colors_str = ', '.join(visual_analysis.colors[:3])
-            enhanced += f" The scene is dominated by {colors_str}."
+            parts.append(f" The scene is dominated by {colors_str}.")
         
         # Add mood/emotion if available
         if visual_analysis.mood:
-            enhanced += f" The mood is {visual_analysis.mood}."
+            parts.append(f" The mood is {visual_analysis.mood}.")
         
-        return enhanced
+        return ''.join(parts)
 
     def _integrate_dialogue(
         self,
@@ -169,21 +237,22 @@ class NarrativeGenerator:
         Returns:
             Integrated dialogue text
         """
-        dialogue_parts = []
-        
+        # Resolve each speaker's display name once
+        char_names = {}
         for line in dialogue_lines:
-            character = characters.get(line.character_id)
-            char_name = character.name if character else line.character_id
-            
-            # Format dialogue with emotion if available
-            if line.emotion:
-                dialogue_parts.append(
-                    f"{char_name} says, {line.emotion}, \"{line.text}\""
+            if line.character_id not in char_names:
+                character = characters.get(line.character_id)
+                char_names[line.character_id] = (
+                    character.name if character else line.character_id
                 )
-            else:
-                dialogue_parts.append(f"{char_name} says, \"{line.text}\"")
-        
-        return ' '.join(dialogue_parts)
+
+        # Format dialogue with emotion if available
+        return ' '.join([
+            f"{char_names[line.character_id]} says, {line.emotion}, \"{line.text}\""
+            if line.emotion
+            else f"{char_names[line.character_id]} says, \"{line.text}\""
+            for line in dialogue_lines
+        ])
 
     def _enforce_present_tense(self, text: str) -> str:
         """Enforce present tense and active voice.
@@ -194,30 +263,8 @@ class NarrativeGenerator:
         Returns:
             Text in present tense
         """
-        # Replace common past tense with present
-        replacements = {
-            r'\bwalked\b': 'walks',
-            r'\bran\b': 'runs',
-            r'\bjumped\b': 'jumps',
-            r'\bsat\b': 'sits',
-            r'\bstood\b': 'stands',
-            r'\blaid\b': 'lies',
-            r'\bspoke\b': 'speaks',
-            r'\bshouted\b': 'shouts',
-            r'\bwhispered\b': 'whispers',
-            r'\blooked\b': 'looks',
-            r'\bsaw\b': 'sees',
-            r'\bwatched\b': 'watches',
-            r'\bwas\b': 'is',
-            r'\bwere\b': 'are',
-            r'\bhad\b': 'has',
-        }
-        
-        result = text
-        for past, present in replacements.items():
-            result = re.sub(past, present, result, flags=re.IGNORECASE)
-        
-        return result
+        # Text without past tense verbs is returned as-is after a single scan
+        return _PAST_TENSE_VERB_RE.sub(_to_present_tense, text)
 
     def generate_transition(
         self,
@@ -258,6 +305,14 @@ class NarrativeGenerator:
         """
         return self.generated_narratives.copy()
 
+    def iter_narratives(self) -> Iterator[str]:
+        """Iterate over generated narratives without copying them.
+        
+        Returns:
+            Iterator over the live list of generated narrative strings
+        """
+        return iter(self.generated_narratives)
+
     def validate_narrative(self, narrative: str) -> dict:
         """Validate narrative against audio description standards.
         
@@ -270,18 +325,17 @@ class NarrativeGenerator:
         issues = []
         
         # Check for present tense
-        past_tense_words = re.findall(r'\b(was|were|had|walked|ran|jumped)\b', narrative, re.IGNORECASE)
+        past_tense_words = _PAST_TENSE_RE.findall(narrative)
         if past_tense_words:
             issues.append(f"Found past tense words: {set(past_tense_words)}")
         
         # Check for passive voice indicators
-        passive_indicators = re.findall(r'\bwas\s+\w+ed\b', narrative, re.IGNORECASE)
+        passive_indicators = _PASSIVE_VOICE_RE.findall(narrative)
         if passive_indicators:
             issues.append(f"Found passive voice: {passive_indicators}")
         
         # Check for spatial details
-        spatial_keywords = ['left', 'right', 'center', 'above', 'below', 'behind', 'front']
-        has_spatial = any(keyword in narrative.lower() for keyword in spatial_keywords)
+        has_spatial = _SPATIAL_KEYWORD_RE.search(narrative) is not None
         
         return {
             'is_valid': len(issues) == 0,
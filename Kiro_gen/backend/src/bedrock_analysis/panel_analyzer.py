@@ -1,11 +1,19 @@
 """Bedrock vision-based panel analysis for comic narratives."""
 
 import logging
-import base64
-from typing import Optional, List
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Optional, List, Tuple
 import json
 
-from .models import PanelNarrative, VisualAnalysis, DialogueLine, Character, Scene
+from .models import (
+    PanelNarrative,
+    VisualAnalysis,
+    BatchVisualAnalysis,
+    DialogueLine,
+    Character,
+    Scene,
+)
 from .character_tracker import CharacterTracker
 from .scene_tracker import SceneTracker
 from .character_identifier import CharacterIdentifier
@@ -14,11 +22,45 @@ from .analyzer import BedrockPanelAnalyzer
 logger = logging.getLogger(__name__)
 
 
+def _intern_label(value):
+    """Intern a short vocabulary string such as a mood or color name.
+    
+    Moods and colors repeat across panels, so interning lets every panel
+    share one string object per label. Non-string values pass through.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_labels(values):
+    """Intern each string in a list of vocabulary labels."""
+    return [_intern_label(value) for value in values] if isinstance(values, list) else values
+
+
+def _visual_fields(analysis_result: dict) -> Tuple[list, str, list, str]:
+    """Read the visual analysis fields from a Bedrock result in one pass.
+    
+    Returns:
+        Tuple of (objects, spatial_layout, colors, mood)
+    """
+    get = analysis_result.get
+    return (
+        get('objects', []),
+        get('spatial_layout', ''),
+        _intern_labels(get('colors', [])),
+        _intern_label(get('mood', '')),
+    )
+
+
 class PanelAnalysisPipeline:
     """Orchestrates Bedrock vision-based panel analysis with character and scene tracking."""
 
-    def __init__(self):
-        """Initialize panel analysis pipeline."""
+    def __init__(self, max_workers: int = 8):
+        """Initialize panel analysis pipeline.
+        
+        Args:
+            max_workers: Maximum concurrent Bedrock requests for batch analysis
+        """
+        self.max_workers = max_workers
         self.bedrock_analyzer = BedrockPanelAnalyzer()
         self.character_tracker = CharacterTracker()
         self.scene_tracker = SceneTracker()
@@ -44,57 +86,133 @@ class PanelAnalysisPipeline:
             PanelNarrative object with analysis results
         """
         try:
-            # Encode image for Bedrock
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
-            
-            # Call Bedrock for vision analysis
-            analysis_result = self.bedrock_analyzer.analyze_panel(
-                panel_id=panel_id,
-                image_data=image_base64,
-                image_format=image_format,
-                context=self.bedrock_analyzer.get_context()
-            )
-            
-            if not analysis_result:
-                logger.error(f"Failed to analyze panel {panel_id}")
+            analysis_result = self._request_analysis(panel_id, image_data, image_format)
+            if analysis_result is None:
                 return None
+            return self._build_panel_narrative(panel_id, panel_number, analysis_result)
             
-            # Process character information
-            characters_in_panel = self._process_characters(
-                panel_number,
-                analysis_result.get('characters', [])
-            )
-            
-            # Process scene information
-            scene_id = self._process_scene(
-                panel_number,
-                analysis_result.get('scene', {})
-            )
+        except Exception as e:
+            logger.error("Failed to analyze panel %s: %s", panel_id, e)
+            return None
+
+    def _request_analysis(
+        self,
+        panel_id: str,
+        image_data: bytes,
+        image_format: str
+    ) -> Optional[dict]:
+        """Run Bedrock vision analysis for a panel.
+        
+        Only reads shared state, so it is safe to call from worker threads.
+        
+        Args:
+            panel_id: Unique panel identifier
+            image_data: Panel image as bytes
+            image_format: Image format (png, jpeg)
             
-            # Create panel narrative
-            panel_narrative = PanelNarrative(
-                panel_id=panel_id,
-                visual_analysis=VisualAnalysis(
-                    characters=characters_in_panel,
-                    objects=analysis_result.get('objects', []),
-                    spatial_layout=analysis_result.get('spatial_layout', ''),
-                    colors=analysis_result.get('colors', []),
-                    mood=analysis_result.get('mood', '')
-                ),
-                action_description=analysis_result.get('action_description', ''),
-                dialogue=self._process_dialogue(analysis_result.get('dialogue', [])),
-                scene_description=analysis_result.get('scene_description') if scene_id else None,
-                audio_description=analysis_result.get('audio_description', '')
-            )
+        Returns:
+            Raw analysis result, or None if Bedrock returned no analysis
+        """
+        # Call Bedrock for vision analysis with the raw image bytes
+        analysis_result = self.bedrock_analyzer.analyze_panel(
+            panel_id=panel_id,
+            image_data=image_data,
+            image_format=image_format,
+            context=self.bedrock_analyzer.get_context()
+        )
+        
+        if not analysis_result:
+            logger.error("Failed to analyze panel %s", panel_id)
+            return None
+        
+        return analysis_result
+
+    def _request_analyses(self, panels: List[tuple]) -> List[Future]:
+        """Submit Bedrock vision analysis for several panels concurrently.
+        
+        Args:
+            panels: List of (panel_id, panel_number, image_data, image_format) tuples
             
-            self.panel_narratives.append(panel_narrative)
-            logger.info(f"Successfully analyzed panel {panel_id}")
+        Returns:
+            Futures resolving to _request_analysis results, in panel order
+        """
+        if not panels:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(panels))) as executor:
+            return [
+                executor.submit(self._request_analysis, panel_id, image_data, image_format)
+                for panel_id, _, image_data, image_format in panels
+            ]
+
+    def _track_analysis(
+        self,
+        panel_number: int,
+        analysis_result: dict
+    ) -> Tuple[List[str], Optional[str]]:
+        """Update character and scene tracking from an analysis result.
+        
+        Args:
+            panel_number: Sequential panel number
+            analysis_result: Raw analysis result from Bedrock
             
-            return panel_narrative
+        Returns:
+            Tuple of (character IDs in panel, scene ID)
+        """
+        # Process character information
+        characters_in_panel = self._process_characters(
+            panel_number,
+            analysis_result.get('characters', [])
+        )
+        
+        # Process scene information
+        scene_id = self._process_scene(
+            panel_number,
+            analysis_result.get('scene', {})
+        )
+        
+        return characters_in_panel, scene_id
+
+    def _build_panel_narrative(
+        self,
+        panel_id: str,
+        panel_number: int,
+        analysis_result: dict
+    ) -> PanelNarrative:
+        """Track an analysis result and record its panel narrative.
+        
+        Args:
+            panel_id: Unique panel identifier
+            panel_number: Sequential panel number
+            analysis_result: Raw analysis result from Bedrock
             
-        except Exception as e:
-            logger.error(f"Failed to analyze panel {panel_id}: {e}")
-            return None
+        Returns:
+            PanelNarrative object with analysis results
+        """
+        characters_in_panel, scene_id = self._track_analysis(panel_number, analysis_result)
+        objects, spatial_layout, colors, mood = _visual_fields(analysis_result)
+        get = analysis_result.get
+        
+        # Create panel narrative
+        panel_narrative = PanelNarrative(
+            panel_id=panel_id,
+            visual_analysis=VisualAnalysis(
+                characters=characters_in_panel,
+                objects=objects,
+                spatial_layout=spatial_layout,
+                colors=colors,
+                mood=mood
+            ),
+            action_description=get('action_description', ''),
+            dialogue=self._process_dialogue(get('dialogue', [])),
+            scene_description=get('scene_description') if scene_id else None,
+            audio_description=get('audio_description', '')
+        )
+        
+        self.panel_narratives.append(panel_narrative)
+        logger.info("Successfully analyzed panel %s", panel_id)
+        
+        return panel_narrative
 
     def _process_characters(self, panel_number: int, characters_data: List[dict]) -> List[str]:
         """Process character information from Bedrock analysis.
@@ -197,15 +315,21 @@ class PanelAnalysisPipeline:
         """
         dialogue_lines = []
         
+        # Resolve each speaker once; the same character often has several
+        # lines in a panel.
+        name_to_id = {}
+        for line_data in dialogue_data:
+            character_name = line_data.get('character', '')
+            if character_name not in name_to_id:
+                character = self.character_tracker.get_character_by_name(character_name)
+                name_to_id[character_name] = character.id if character else character_name
+        
         for line_data in dialogue_data:
             character_name = line_data.get('character', '')
             text = line_data.get('text', '')
             emotion = line_data.get('emotion')
-            
-            # Find character ID by name
-            character = self.character_tracker.get_character_by_name(character_name)
-            character_id = character.id if character else character_name
-            
+            character_id = name_to_id[character_name]
+
             dialogue_line = DialogueLine(
                 character_id=character_id,
                 text=text,
@@ -227,13 +351,61 @@ class PanelAnalysisPipeline:
         Returns:
             List of PanelNarrative objects
         """
-        narratives = []
-        for panel_id, panel_number, image_data, image_format in panels:
-            narrative = self.analyze_panel(panel_id, panel_number, image_data, image_format)
-            narratives.append(narrative)
+        futures = self._request_analyses(panels)
+        
+        # Merge results sequentially so tracking stays in panel order
+        # Results are sized up front; failed panels keep their None slot
+        narratives: List[Optional[PanelNarrative]] = [None] * len(panels)
+        for index, ((panel_id, panel_number, _, _), future) in enumerate(zip(panels, futures)):
+            try:
+                analysis_result = future.result()
+                if analysis_result is not None:
+                    narratives[index] = self._build_panel_narrative(
+                        panel_id, panel_number, analysis_result
+                    )
+            except Exception as e:
+                logger.error("Failed to analyze panel %s: %s", panel_id, e)
         
         return narratives
 
+    def analyze_panel_batch_visuals(self, panels: List[tuple]) -> BatchVisualAnalysis:
+        """Analyze multiple panels, keeping only their visual analysis.
+        
+        Characters and scenes are tracked as in analyze_panel_batch, but no
+        PanelNarrative or VisualAnalysis objects are created. Use this when only
+        aggregate visual statistics across the batch are needed.
+        
+        Args:
+            panels: List of (panel_id, panel_number, image_data, image_format) tuples
+            
+        Returns:
+            BatchVisualAnalysis with one entry per successfully analyzed panel
+        """
+        futures = self._request_analyses(panels)
+        
+        batch = BatchVisualAnalysis()
+        for (panel_id, panel_number, _, _), future in zip(panels, futures):
+            try:
+                analysis_result = future.result()
+                if analysis_result is None:
+                    continue
+                characters_in_panel, _ = self._track_analysis(panel_number, analysis_result)
+            except Exception as e:
+                logger.error("Failed to analyze panel %s: %s", panel_id, e)
+                continue
+            
+            objects, spatial_layout, colors, mood = _visual_fields(analysis_result)
+            batch.append(
+                panel_id=panel_id,
+                characters=characters_in_panel,
+                objects=objects,
+                spatial_layout=spatial_layout,
+                colors=colors,
+                mood=mood
+            )
+        
+        return batch
+
     def get_all_characters(self) -> List[Character]:
         """Get all characters identified in comic.
         
@@ -258,6 +430,14 @@ class PanelAnalysisPipeline:
         """
         return self.panel_narratives.copy()
 
+    def iter_panel_narratives(self) -> Iterator[PanelNarrative]:
+        """Iterate over panel narratives without copying them.
+        
+        Returns:
+            Iterator over the live list of PanelNarrative objects
+        """
+        return iter(self.panel_narratives)
+
     def reset(self) -> None:
         """Reset pipeline for new comic."""
         self.character_tracker.reset()
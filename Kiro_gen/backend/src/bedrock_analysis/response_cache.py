@@ -0,0 +1,94 @@
+"""Response cache for idempotent Bedrock requests."""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with a per-entry time to live.
+
+    Entries are keyed by a digest of the request, so large prompts and
+    images are hashed once rather than being held as dictionary keys.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600.0):
+        """Initialize response cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Seconds a response stays valid
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from request parts.
+
+        Args:
+            *parts: Request parts; bytes are hashed as-is, anything else as str
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            data = part if isinstance(part, bytes) else str(part).encode()
+            # Length prefix keeps ("ab", "c") and ("a", "bc") apart
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a response, evicting the least recently used if full.
+
+        Args:
+            key: Key from make_key()
+            value: Response to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+        logger.info("Response cache cleared")
@@ -1,15 +1,33 @@
 """Scene detection and context management for comic panels."""
 
 import logging
-from typing import Dict, List, Optional
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional, Set
 from dataclasses import dataclass
 
 from .models import Scene
 
 logger = logging.getLogger(__name__)
 
+# Scene fields reported by get_scene_summary, in output order
+_SUMMARY_FIELDS = (
+    'id',
+    'location',
+    'visual_description',
+    'time_of_day',
+    'atmosphere',
+    'color_palette',
+    'lighting',
+    'first_introduced',
+    'last_seen',
+)
+_summary_values = attrgetter(*_SUMMARY_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class SceneChange:
     """Record of a scene change between panels."""
     from_scene_id: Optional[str]
@@ -24,9 +42,26 @@ class SceneTracker:
     def __init__(self):
         """Initialize scene tracker."""
         self.scenes: Dict[str, Scene] = {}
+        # Case-folded location -> first scene registered at that location
+        self._scenes_by_location: Dict[str, Scene] = {}
+        # Scenes ordered by first_introduced (ties in registration order),
+        # with their panel numbers kept alongside for bisect
+        self._first_introduced_panels: List[int] = []
+        self._scenes_by_first_introduced: List[Scene] = []
+        self._new_scenes_by_panel: Dict[int, List[Scene]] = defaultdict(list)
+        # Scene ID -> colors in the scene's palette, for O(1) dedup
+        self._palette_colors: Dict[str, Set[str]] = {}
         self.scene_counter = 0
         self.scene_changes: List[SceneChange] = []
+        # Scene changes ordered by panel number (ties in recording order),
+        # with their panel numbers kept alongside for bisect
+        self._change_panels: List[int] = []
+        self._changes_by_panel: List[SceneChange] = []
         self.current_scene_id: Optional[str] = None
+        # Snapshots returned by get_all_scenes/get_scene_changes, rebuilt
+        # only after scenes are registered or a scene change is recorded
+        self._all_scenes_snapshot: Optional[List[Scene]] = None
+        self._scene_changes_snapshot: Optional[List[SceneChange]] = None
 
     def register_scene(
         self,
@@ -55,12 +90,14 @@ class SceneTracker:
         scene_id = f"scene_{self.scene_counter}"
         self.scene_counter += 1
         
+        # Recurring locations and atmospheres are interned so repeated
+        # comparisons can short-circuit on identity
         scene = Scene(
             id=scene_id,
-            location=location,
+            location=sys.intern(location),
             visual_description=visual_description,
             time_of_day=time_of_day,
-            atmosphere=atmosphere,
+            atmosphere=sys.intern(atmosphere) if atmosphere else atmosphere,
             color_palette=color_palette or [],
             lighting=lighting,
             first_introduced=panel_number,
@@ -68,7 +105,14 @@ class SceneTracker:
         )
         
         self.scenes[scene_id] = scene
-        logger.info(f"Registered new scene: {location} (ID: {scene_id})")
+        self._scenes_by_location.setdefault(scene.location_key, scene)
+        index = bisect_right(self._first_introduced_panels, panel_number)
+        self._first_introduced_panels.insert(index, panel_number)
+        self._scenes_by_first_introduced.insert(index, scene)
+        self._new_scenes_by_panel[panel_number].append(scene)
+        self._palette_colors[scene_id] = set(scene.color_palette)
+        self._all_scenes_snapshot = None
+        logger.info("Registered new scene: %s (ID: %s)", location, scene_id)
         
         return scene
 
@@ -88,11 +132,11 @@ class SceneTracker:
         Returns:
             Scene object, or None if scene not found
         """
-        if scene_id not in self.scenes:
-            logger.warning(f"Scene {scene_id} not found")
+        scene = self.scenes.get(scene_id)
+        if scene is None:
+            logger.warning("Scene %s not found", scene_id)
             return None
         
-        scene = self.scenes[scene_id]
         scene.last_seen = panel_number
         
         # Update visual description if provided
@@ -108,8 +152,12 @@ class SceneTracker:
                 reason="Scene change detected"
             )
             self.scene_changes.append(change)
+            index = bisect_right(self._change_panels, panel_number)
+            self._change_panels.insert(index, panel_number)
+            self._changes_by_panel.insert(index, change)
+            self._scene_changes_snapshot = None
             self.current_scene_id = scene_id
-            logger.info(f"Scene changed to {scene.location} in panel {panel_number}")
+            logger.info("Scene changed to %s in panel %s", scene.location, panel_number)
         
         return scene
 
@@ -133,18 +181,20 @@ class SceneTracker:
         Returns:
             Scene object, or None if not found
         """
-        for scene in self.scenes.values():
-            if scene.location.lower() == location.lower():
-                return scene
-        return None
+        return self._scenes_by_location.get(location.casefold())
 
     def get_all_scenes(self) -> List[Scene]:
         """Get all registered scenes.
         
+        The list is cached until the next scene is registered, so callers
+        share it and must copy it before modifying.
+        
         Returns:
             List of Scene objects
         """
-        return list(self.scenes.values())
+        if self._all_scenes_snapshot is None:
+            self._all_scenes_snapshot = list(self.scenes.values())
+        return self._all_scenes_snapshot
 
     def get_scenes_in_panel_range(self, start_panel: int, end_panel: int) -> List[Scene]:
         """Get all scenes appearing in a panel range.
@@ -157,17 +207,30 @@ class SceneTracker:
             List of Scene objects
         """
         return [
-            scene for scene in self.scenes.values()
-            if scene.first_introduced <= end_panel and scene.last_seen >= start_panel
+            scene for scene in self._introduced_by(end_panel)
+            if scene.last_seen >= start_panel
         ]
 
     def get_scene_changes(self) -> List[SceneChange]:
         """Get all scene changes.
         
+        The list is cached until the next scene change is recorded, so
+        callers share it and must copy it before modifying.
+        
         Returns:
             List of SceneChange objects
         """
-        return self.scene_changes.copy()
+        if self._scene_changes_snapshot is None:
+            self._scene_changes_snapshot = self.scene_changes.copy()
+        return self._scene_changes_snapshot
+
+    def iter_scene_changes(self) -> Iterator[SceneChange]:
+        """Iterate over scene changes without copying them.
+        
+        Returns:
+            Iterator over the live list of SceneChange objects
+        """
+        return iter(self.scene_changes)
 
     def get_scene_changes_in_range(self, start_panel: int, end_panel: int) -> List[SceneChange]:
         """Get scene changes in a panel range.
@@ -179,10 +242,9 @@ class SceneTracker:
         Returns:
             List of SceneChange objects
         """
-        return [
-            change for change in self.scene_changes
-            if start_panel <= change.panel_number <= end_panel
-        ]
+        start = bisect_left(self._change_panels, start_panel)
+        end = bisect_right(self._change_panels, end_panel)
+        return self._changes_by_panel[start:end]
 
     def is_scene_introduced(self, scene_id: str, panel_number: int) -> bool:
         """Check if scene has been introduced by a given panel.
@@ -194,11 +256,8 @@ class SceneTracker:
         Returns:
             True if scene introduced by this panel
         """
-        if scene_id not in self.scenes:
-            return False
-        
-        scene = self.scenes[scene_id]
-        return scene.first_introduced <= panel_number
+        scene = self.scenes.get(scene_id)
+        return scene is not None and scene.first_introduced <= panel_number
 
     def get_introduced_scenes(self, panel_number: int) -> List[Scene]:
         """Get all scenes introduced up to a given panel.
@@ -209,10 +268,7 @@ class SceneTracker:
         Returns:
             List of Scene objects
         """
-        return [
-            scene for scene in self.scenes.values()
-            if scene.first_introduced <= panel_number
-        ]
+        return self._introduced_by(panel_number)
 
     def get_new_scenes_in_panel(self, panel_number: int) -> List[Scene]:
         """Get scenes first appearing in a specific panel.
@@ -223,10 +279,19 @@ class SceneTracker:
         Returns:
             List of Scene objects
         """
-        return [
-            scene for scene in self.scenes.values()
-            if scene.first_introduced == panel_number
-        ]
+        return list(self._new_scenes_by_panel.get(panel_number, ()))
+
+    def _introduced_by(self, panel_number: int) -> List[Scene]:
+        """Get scenes first introduced at or before a panel.
+        
+        Args:
+            panel_number: Panel number
+            
+        Returns:
+            List of Scene objects ordered by first introduction
+        """
+        end = bisect_right(self._first_introduced_panels, panel_number)
+        return self._scenes_by_first_introduced[:end]
 
     def update_scene_atmosphere(self, scene_id: str, atmosphere: str) -> bool:
         """Update scene atmosphere/mood.
@@ -238,12 +303,13 @@ class SceneTracker:
         Returns:
             True if update successful
         """
-        if scene_id not in self.scenes:
-            logger.warning(f"Scene {scene_id} not found")
+        scene = self.scenes.get(scene_id)
+        if scene is None:
+            logger.warning("Scene %s not found", scene_id)
             return False
         
-        self.scenes[scene_id].atmosphere = atmosphere
-        logger.info(f"Updated atmosphere for scene {scene_id}")
+        scene.atmosphere = sys.intern(atmosphere) if atmosphere else atmosphere
+        logger.info("Updated atmosphere for scene %s", scene_id)
         return True
 
     def add_color_to_palette(self, scene_id: str, color: str) -> bool:
@@ -256,14 +322,18 @@ class SceneTracker:
         Returns:
             True if added successfully
         """
-        if scene_id not in self.scenes:
-            logger.warning(f"Scene {scene_id} not found")
+        scene = self.scenes.get(scene_id)
+        if scene is None:
+            logger.warning("Scene %s not found", scene_id)
             return False
         
-        scene = self.scenes[scene_id]
-        if color not in scene.color_palette:
+        palette_colors = self._palette_colors.get(scene_id)
+        if palette_colors is None:
+            palette_colors = self._palette_colors[scene_id] = set(scene.color_palette)
+        if color not in palette_colors:
+            palette_colors.add(color)
             scene.color_palette.append(color)
-            logger.info(f"Added color to scene {scene_id}")
+            logger.info("Added color to scene %s", scene_id)
         
         return True
 
@@ -276,23 +346,13 @@ class SceneTracker:
         Returns:
             Dictionary with scene summary, or None if not found
         """
-        if scene_id not in self.scenes:
+        scene = self.scenes.get(scene_id)
+        if scene is None:
             return None
         
-        scene = self.scenes[scene_id]
-        
-        return {
-            'id': scene.id,
-            'location': scene.location,
-            'visual_description': scene.visual_description,
-            'time_of_day': scene.time_of_day,
-            'atmosphere': scene.atmosphere,
-            'color_palette': scene.color_palette,
-            'lighting': scene.lighting,
-            'first_introduced': scene.first_introduced,
-            'last_seen': scene.last_seen,
-            'appearance_span': scene.last_seen - scene.first_introduced + 1,
-        }
+        summary = dict(zip(_SUMMARY_FIELDS, _summary_values(scene)))
+        summary['appearance_span'] = scene.last_seen - scene.first_introduced + 1
+        return summary
 
     def get_current_scene(self) -> Optional[Scene]:
         """Get the current scene.
@@ -307,7 +367,16 @@ class SceneTracker:
     def reset(self) -> None:
         """Reset tracker for new comic."""
         self.scenes.clear()
+        self._scenes_by_location.clear()
+        self._first_introduced_panels.clear()
+        self._scenes_by_first_introduced.clear()
+        self._new_scenes_by_panel.clear()
+        self._palette_colors.clear()
         self.scene_changes.clear()
+        self._change_panels.clear()
+        self._changes_by_panel.clear()
+        self._all_scenes_snapshot = None
+        self._scene_changes_snapshot = None
         self.current_scene_id = None
         self.scene_counter = 0
         logger.info("Scene tracker reset")
@@ -1,5 +1,6 @@
 """Configuration management for Comic Audio Narrator backend"""
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -13,6 +14,8 @@ class Settings(BaseSettings):
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
     aws_session_token: Optional[str] = None
+    aws_max_pool_connections: int = 50  # Per-client keep-alive connection pool
+    aws_tcp_keepalive: bool = True
 
     @property
     def effective_aws_region(self) -> str:
@@ -22,6 +25,8 @@ class Settings(BaseSettings):
     # Bedrock Configuration
     bedrock_model_id_vision: str = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
     bedrock_model_id_analysis: str = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
+    bedrock_max_pool_connections: int = 32  # Covers concurrent batch panel analysis
+    bedrock_retry_mode: str = "adaptive"
 
     # Polly Configuration
     polly_engine: str = "neural"
@@ -34,6 +39,7 @@ class Settings(BaseSettings):
     # Local Storage Configuration
     local_storage_path: str = "./storage/audio"
     local_storage_quota_gb: int = 100
+    ocr_cache_dir: str = "./storage/ocr_cache"  # Used with the diskcache extra
 
     # API Configuration
     api_host: str = "0.0.0.0"
@@ -51,5 +57,11 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings, loading the environment only once"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
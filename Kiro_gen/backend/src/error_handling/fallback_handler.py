@@ -1,15 +1,116 @@
 """Fallback mechanisms for service failures."""
 
 import logging
-from typing import Dict, Any, Optional, List, Callable
+import hashlib
+from typing import Dict, Any, Optional, List, Callable, Sequence, Tuple, Union
 from enum import Enum
 import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
 
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
 
+def content_key(data: Union[bytes, str]) -> str:
+    """Compute a stable cache key for panel bytes or synthesis text.
+    
+    Uses xxh3 when xxhash is installed and BLAKE2b otherwise. Unlike the
+    builtin hash(), the key is the same across processes and restarts.
+    
+    Args:
+        data: Raw bytes or text to key
+        
+    Returns:
+        Hex digest of the content
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _fallback_order(candidates: Sequence[str]) -> Dict[str, Tuple[str, ...]]:
+    """Map each candidate to the other candidates, in their original order.
+    
+    Args:
+        candidates: Ordered fallback candidates
+        
+    Returns:
+        Dictionary of failed candidate to the candidates to try instead
+    """
+    return {
+        failed: tuple(candidate for candidate in candidates if candidate != failed)
+        for failed in candidates
+    }
+
+
+@lru_cache(maxsize=8)
+def _get_bedrock_analyzer(model_id: str):
+    """Get a shared Bedrock analyzer for a fallback model.
+    
+    Args:
+        model_id: Bedrock model ID
+        
+    Returns:
+        BedrockPanelAnalyzer bound to the model
+    """
+    # Import here to avoid circular imports
+    from ..bedrock_analysis.analyzer import BedrockPanelAnalyzer
+    
+    return BedrockPanelAnalyzer(model_id=model_id)
+
+
+@lru_cache(maxsize=4)
+def _get_polly_generator(use_neural: bool):
+    """Get a shared Polly generator for an engine.
+    
+    Args:
+        use_neural: Whether the generator uses neural voices
+        
+    Returns:
+        PollyAudioGenerator for the engine
+    """
+    # Import here to avoid circular imports
+    from ..polly_generation.generator import PollyAudioGenerator
+    
+    return PollyAudioGenerator(use_neural=use_neural)
+
+
+# Fallback candidates in preference order
+_BEDROCK_FALLBACK_MODELS: Tuple[str, ...] = (
+    "us.anthropic.claude-sonnet-4-5-20250929-v1:0",
+    "us.anthropic.claude-3-haiku-20240307-v1:0",
+    "us.amazon.nova-pro-v1:0",
+    "us.amazon.nova-lite-v1:0",
+)
+_NEURAL_FALLBACK_VOICES: Tuple[str, ...] = (
+    "Joanna", "Matthew", "Amy", "Brian", "Emma", "Justin"
+)
+_STANDARD_FALLBACK_VOICES: Tuple[str, ...] = (
+    "Joanna", "Matthew", "Amy", "Brian", "Kimberly", "Kendra"
+)
+
+# Bedrock fallback models attempted concurrently; kept small so failover
+# does not burst past provider rate limits
+_CONCURRENT_FALLBACK_MODELS = 2
+
+# Fallback sequences that already exclude the failed model or voice
+_BEDROCK_FALLBACK_ORDER = _fallback_order(_BEDROCK_FALLBACK_MODELS)
+_VOICE_FALLBACK_ORDER = {
+    "neural": _fallback_order(_NEURAL_FALLBACK_VOICES),
+    "standard": _fallback_order(_STANDARD_FALLBACK_VOICES),
+}
+
+
 class FallbackStrategy(Enum):
     """Available fallback strategies."""
     ALTERNATIVE_MODEL = "alternative_model"
@@ -25,24 +126,20 @@ class FallbackHandler:
     def __init__(self):
         """Initialize fallback handler."""
         self.fallback_models = {
-            "bedrock": [
-                "us.anthropic.claude-sonnet-4-5-20250929-v1:0",
-                "us.anthropic.claude-3-haiku-20240307-v1:0",
-                "us.amazon.nova-pro-v1:0",
-                "us.amazon.nova-lite-v1:0"
-            ]
+            "bedrock": _BEDROCK_FALLBACK_MODELS
         }
         
         self.fallback_voices = {
-            "neural": [
-                "Joanna", "Matthew", "Amy", "Brian", "Emma", "Justin"
-            ],
-            "standard": [
-                "Joanna", "Matthew", "Amy", "Brian", "Kimberly", "Kendra"
-            ]
+            "neural": _NEURAL_FALLBACK_VOICES,
+            "standard": _STANDARD_FALLBACK_VOICES
         }
         
-        self.cache = {}
+        self._bedrock_fallback_order = _BEDROCK_FALLBACK_ORDER
+        self._voice_fallback_order = _VOICE_FALLBACK_ORDER
+        
+        # LRU cache of successful responses, oldest first
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.max_cache_size = 1000
         self.fallback_stats = {
             "bedrock_fallbacks": 0,
             "polly_fallbacks": 0,
@@ -68,48 +165,104 @@ class FallbackHandler:
         Returns:
             Fallback analysis result or None if all fallbacks fail
         """
-        logger.warning(f"Bedrock fallback triggered for model {original_model}: {error}")
+        logger.warning("Bedrock fallback triggered for model %s: %s", original_model, error)
         
-        # Try alternative models
-        for fallback_model in self.fallback_models["bedrock"]:
-            if fallback_model == original_model:
-                continue
-                
+        # Try alternative models, a few at a time. Models in a wave run
+        # concurrently and the first full analysis wins, so a slow timeout
+        # no longer delays the next candidate.
+        fallback_order = self._bedrock_fallback_order.get(
+            original_model, self.fallback_models["bedrock"]
+        )
+        degraded_result = None
+        for start in range(0, len(fallback_order), _CONCURRENT_FALLBACK_MODELS):
+            wave = fallback_order[start:start + _CONCURRENT_FALLBACK_MODELS]
+            tasks = {
+                asyncio.create_task(
+                    self._try_bedrock_model(fallback_model, panel_data, context)
+                ): fallback_model
+                for fallback_model in wave
+            }
+            pending = set(tasks)
             try:
-                logger.info(f"Trying fallback model: {fallback_model}")
-                
-                # Import here to avoid circular imports
-                from ..bedrock_analysis.panel_analyzer import BedrockPanelAnalyzer
-                
-                # Create analyzer with fallback model
-                analyzer = BedrockPanelAnalyzer(model_id=fallback_model)
-                
-                # Attempt analysis with simplified prompt for reliability
-                result = await analyzer.analyze_panel_with_fallback(
-                    panel_data=panel_data,
-                    context=context
-                )
-                
-                self.fallback_stats["bedrock_fallbacks"] += 1
-                self.fallback_stats["total_fallbacks"] += 1
-                
-                logger.info(f"Bedrock fallback successful with model {fallback_model}")
-                return result
-                
-            except Exception as fallback_error:
-                logger.warning(f"Fallback model {fallback_model} also failed: {fallback_error}")
-                continue
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    # Tasks finishing in the same tick are taken in wave
+                    # order, so the preferred model wins a tie
+                    for task in sorted(done, key=list(tasks).index):
+                        fallback_model = tasks[task]
+                        try:
+                            result = task.result()
+                        except Exception as fallback_error:
+                            logger.warning("Fallback model %s also failed: %s", fallback_model, fallback_error)
+                            continue
+                        
+                        # The analyzer reports its own failures as a minimal
+                        # result; keep the first one in case nothing better arrives
+                        if isinstance(result, dict) and result.get("fallback_used"):
+                            if degraded_result is None:
+                                degraded_result = result
+                            continue
+                        
+                        self.fallback_stats["bedrock_fallbacks"] += 1
+                        self.fallback_stats["total_fallbacks"] += 1
+                        
+                        logger.info("Bedrock fallback successful with model %s", fallback_model)
+                        return result
+            finally:
+                # Stop the rest of the wave once a model wins, and every
+                # model in flight if the caller is cancelled; each is a
+                # billable call whose result would be thrown away
+                for task in tasks:
+                    task.cancel()
         
         # If all models fail, try cached response
-        cache_key = f"bedrock_{hash(panel_data)}"
+        cache_key = f"bedrock_{content_key(panel_data)}"
         if cache_key in self.cache:
             logger.info("Using cached Bedrock response as fallback")
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
         
+        # Otherwise settle for a minimal analysis from one of the models
+        if degraded_result is not None:
+            self.fallback_stats["bedrock_fallbacks"] += 1
+            self.fallback_stats["total_fallbacks"] += 1
+            
+            logger.info("Bedrock fallback returned a minimal analysis")
+            return degraded_result
+        
         # Last resort: return simplified analysis
         logger.warning("All Bedrock fallbacks failed, using simplified analysis")
         return await self._create_simplified_analysis(panel_data, context)
 
+    async def _try_bedrock_model(
+        self,
+        model_id: str,
+        panel_data: bytes,
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Attempt a fallback analysis with a single Bedrock model.
+        
+        Args:
+            model_id: Fallback model to use
+            panel_data: Panel image data
+            context: Analysis context
+            
+        Returns:
+            Analysis result from the model
+        """
+        logger.info("Trying fallback model: %s", model_id)
+        
+        # Reuse the pooled analyzer for the fallback model
+        analyzer = _get_bedrock_analyzer(model_id)
+        
+        # Attempt analysis with simplified prompt for reliability
+        return await analyzer.analyze_panel_with_fallback(
+            panel_data=panel_data,
+            context=context
+        )
+
     async def handle_polly_fallback(
         self,
         text: str,
@@ -128,24 +281,18 @@ class FallbackHandler:
         Returns:
             Fallback audio data or None if all fallbacks fail
         """
-        logger.warning(f"Polly fallback triggered for voice {original_voice}: {error}")
+        logger.warning("Polly fallback triggered for voice %s: %s", original_voice, error)
         
         # Try alternative voices with same engine first
-        engine_voices = self.fallback_voices.get(original_engine, [])
+        engine_voices = self._voice_fallback_order.get(original_engine, {}).get(
+            original_voice, self.fallback_voices.get(original_engine, ())
+        )
         for fallback_voice in engine_voices:
-            if fallback_voice == original_voice:
-                continue
-                
             try:
-                logger.info(f"Trying fallback voice: {fallback_voice}")
+                logger.info("Trying fallback voice: %s", fallback_voice)
                 
-                # Import here to avoid circular imports
-                from ..polly_generation.generator import PollyAudioGenerator
-                
-                # Create generator with fallback voice
-                generator = PollyAudioGenerator(
-                    use_neural=(original_engine == "neural")
-                )
+                # Reuse the pooled generator for the engine
+                generator = _get_polly_generator(original_engine == "neural")
                 
                 # Attempt synthesis
                 audio_data = await generator.synthesize_with_fallback(
@@ -157,11 +304,11 @@ class FallbackHandler:
                 self.fallback_stats["polly_fallbacks"] += 1
                 self.fallback_stats["total_fallbacks"] += 1
                 
-                logger.info(f"Polly fallback successful with voice {fallback_voice}")
+                logger.info("Polly fallback successful with voice %s", fallback_voice)
                 return audio_data
                 
             except Exception as fallback_error:
-                logger.warning(f"Fallback voice {fallback_voice} also failed: {fallback_error}")
+                logger.warning("Fallback voice %s also failed: %s", fallback_voice, fallback_error)
                 continue
         
         # Try switching to standard engine if neural failed
@@ -169,9 +316,7 @@ class FallbackHandler:
             try:
                 logger.info("Trying standard engine as fallback")
                 
-                from ..polly_generation.generator import PollyAudioGenerator
-                
-                generator = PollyAudioGenerator(use_neural=False)
+                generator = _get_polly_generator(False)
                 
                 # Use first available standard voice
                 fallback_voice = self.fallback_voices["standard"][0]
@@ -188,12 +333,13 @@ class FallbackHandler:
                 return audio_data
                 
             except Exception as fallback_error:
-                logger.warning(f"Standard engine fallback also failed: {fallback_error}")
+                logger.warning("Standard engine fallback also failed: %s", fallback_error)
         
         # Check cache for similar text
-        cache_key = f"polly_{hash(text)}"
+        cache_key = f"polly_{content_key(text)}"
         if cache_key in self.cache:
             logger.info("Using cached Polly response as fallback")
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
         
         logger.error("All Polly fallbacks failed")
@@ -217,7 +363,7 @@ class FallbackHandler:
         Returns:
             Fallback storage location or None if all fallbacks fail
         """
-        logger.warning(f"S3 fallback triggered for bucket {bucket}: {error}")
+        logger.warning("S3 fallback triggered for bucket %s: %s", bucket, error)
         
         # Try local storage as fallback
         try:
@@ -237,16 +383,16 @@ class FallbackHandler:
             self.fallback_stats["s3_fallbacks"] += 1
             self.fallback_stats["total_fallbacks"] += 1
             
-            logger.info(f"S3 fallback successful, stored locally at {local_path}")
+            logger.info("S3 fallback successful, stored locally at %s", local_path)
             return local_path
             
         except Exception as fallback_error:
-            logger.warning(f"Local storage fallback also failed: {fallback_error}")
+            logger.warning("Local storage fallback also failed: %s", fallback_error)
         
         # Try alternative S3 bucket if configured
         fallback_bucket = f"{bucket}-fallback"
         try:
-            logger.info(f"Trying fallback bucket: {fallback_bucket}")
+            logger.info("Trying fallback bucket: %s", fallback_bucket)
             
             from ..storage.s3_manager import S3StorageManager
             
@@ -259,11 +405,11 @@ class FallbackHandler:
             self.fallback_stats["s3_fallbacks"] += 1
             self.fallback_stats["total_fallbacks"] += 1
             
-            logger.info(f"S3 fallback successful with bucket {fallback_bucket}")
+            logger.info("S3 fallback successful with bucket %s", fallback_bucket)
             return s3_url
             
         except Exception as fallback_error:
-            logger.warning(f"Fallback bucket also failed: {fallback_error}")
+            logger.warning("Fallback bucket also failed: %s", fallback_error)
         
         logger.error("All S3 fallbacks failed")
         return None
@@ -303,18 +449,16 @@ class FallbackHandler:
         
         Args:
             service: Service name (bedrock, polly, s3)
-            key: Cache key
+            key: Cache key, normally content_key() of the request payload
             response: Response to cache
         """
         cache_key = f"{service}_{key}"
         self.cache[cache_key] = response
+        self.cache.move_to_end(cache_key)
         
-        # Limit cache size
-        if len(self.cache) > 1000:
-            # Remove oldest entries
-            oldest_keys = list(self.cache.keys())[:100]
-            for old_key in oldest_keys:
-                del self.cache[old_key]
+        # Limit cache size by evicting least recently used entries
+        while len(self.cache) > self.max_cache_size:
+            self.cache.popitem(last=False)
 
     def get_fallback_stats(self) -> Dict[str, int]:
         """Get fallback usage statistics.
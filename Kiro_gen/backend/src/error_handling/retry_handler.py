@@ -2,13 +2,426 @@
 
 import asyncio
 import logging
-from typing import Callable, Any, Optional, Type, Union, List
-from functools import wraps
+import math
+import threading
+from enum import Enum
+from collections import deque
+from typing import Awaitable, Callable, Any, Deque, Dict, Literal, Optional, Tuple, Type, Union, List
+from functools import partial, wraps
 import random
 import time
 
+from botocore.exceptions import (
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
 logger = logging.getLogger(__name__)
 
+# AWS error codes signalling that the caller is sending too fast
+_THROTTLING_ERROR_CODES = frozenset({
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ThrottledException',
+    'RequestLimitExceeded',
+    'SlowDown',
+})
+
+
+# AWS error codes of transient ClientErrors; anything else is terminal
+_RETRYABLE_ERROR_CODES = _THROTTLING_ERROR_CODES | {
+    'ServiceUnavailable',
+    'ServiceUnavailableException',
+    'InternalServerError',
+    'InternalServerException',
+    'InternalFailure',
+    'ServiceFailureException',
+    'RequestTimeout',
+    'RequestTimeoutException',
+}
+
+# Transport errors that are worth retrying against any AWS service
+_TRANSIENT_AWS_EXCEPTIONS = (
+    EndpointConnectionError,
+    ReadTimeoutError,
+    ConnectTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def _is_throttling_error(exception: Exception) -> bool:
+    """Check whether an exception is an AWS throttling error."""
+    response = getattr(exception, 'response', None)
+    if not isinstance(response, dict):
+        return False
+    return response.get('Error', {}).get('Code', '') in _THROTTLING_ERROR_CODES
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited by an open circuit breaker."""
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calling a failing service until a cool-down has passed.
+    
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    rejects calls with CircuitOpenError. Once ``half_open_after`` seconds have
+    elapsed a single probe call is let through; its outcome closes the
+    breaker again or re-opens it. The cool-down doubles with every trip
+    that is not followed by a recovery, with full jitter, so a long outage
+    is probed less and less often.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cool_down_base: float = 5.0,
+        cool_down_cap: float = 600.0
+    ):
+        """Initialize circuit breaker.
+        
+        Args:
+            name: Service name used in log and error messages
+            failure_threshold: Consecutive failures before the breaker opens
+            cool_down_base: Upper bound in seconds of the first cool-down
+            cool_down_cap: Maximum cool-down in seconds
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cool_down_base = cool_down_base
+        self.cool_down_cap = cool_down_cap
+        self.half_open_after = cool_down_base
+        self.consecutive_trips = 0
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        # Transitions never await, so a thread lock also covers callers
+        # running outside the event loop
+        self._lock = threading.Lock()
+    
+    def before_call(self) -> None:
+        """Check whether a call may proceed.
+        
+        Raises:
+            CircuitOpenError: If the breaker is open, or a half-open probe is
+                already in flight
+        """
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return
+            
+            if self.state == CircuitState.OPEN:
+                assert self.opened_at is not None
+                if time.monotonic() - self.opened_at < self.half_open_after:
+                    raise CircuitOpenError(f"Circuit breaker for {self.name} is open")
+                self.state = CircuitState.HALF_OPEN
+                logger.info("Circuit breaker for %s is half-open", self.name)
+            
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"Circuit breaker for {self.name} is half-open")
+            self._probe_in_flight = True
+    
+    def release_probe(self) -> None:
+        """Give up a half-open probe without an outcome, e.g. when cancelled.
+        
+        The breaker stays half-open so the next call can probe instead.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def on_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            if self.state != CircuitState.CLOSED:
+                logger.info("Circuit breaker for %s closed", self.name)
+                self.consecutive_trips = 0
+            self.state = CircuitState.CLOSED
+            self.failure_count = 0
+            self._probe_in_flight = False
+    
+    def on_failure(self) -> None:
+        """Record a failed call, opening the breaker when the threshold is hit."""
+        with self._lock:
+            self.failure_count += 1
+            self._probe_in_flight = False
+            
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.failure_count >= self.failure_threshold
+            ):
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+                self.half_open_after = random.uniform(
+                    0,
+                    min(
+                        self.cool_down_cap,
+                        self.cool_down_base * 2 ** self.consecutive_trips
+                    )
+                )
+                self.consecutive_trips += 1
+                logger.warning(
+                    "Circuit breaker for %s opened after %s consecutive failures, "
+                    "probing again in %.1fs",
+                    self.name, self.failure_count, self.half_open_after
+                )
+
+
+class AdaptiveRateLimiter:
+    """Client-side token bucket that paces calls using throttling feedback.
+    
+    Follows the AWS SDK adaptive retry mode: the bucket is inactive until
+    the first throttling error, which cuts the fill rate by ``BETA``.
+    Successes then grow the fill rate back along a cubic curve centred on
+    the rate at which throttling last occurred, capped at twice the
+    measured send rate.
+    """
+    
+    BETA = 0.7
+    SCALE_CONSTANT = 0.4
+    MIN_FILL_RATE = 0.5
+    SMOOTHING = 0.8
+    MEASUREMENT_BUCKET = 0.5
+    
+    def __init__(self) -> None:
+        """Initialize adaptive rate limiter."""
+        self.fill_rate = self.MIN_FILL_RATE
+        self.max_capacity = 1.0
+        self.available_tokens = 0.0
+        self.last_update: Optional[float] = None
+        self.measured_tx_rate = 0.0
+        self.enabled = False
+        self._last_max_rate = 0.0
+        self._last_throttle_time = time.monotonic()
+        self._last_tx_bucket = math.floor(self._last_throttle_time * 2) / 2
+        self._request_count = 0
+        self._lock = threading.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, once throttling has been seen."""
+        while (wait := self._try_acquire()) > 0:
+            await asyncio.sleep(wait)
+    
+    def acquire_sync(self) -> None:
+        """Blocking variant of acquire() for callers outside the event loop."""
+        while (wait := self._try_acquire()) > 0:
+            time.sleep(wait)
+    
+    def _try_acquire(self) -> float:
+        """Take a token if one is available.
+        
+        Returns:
+            0.0 if the call may proceed, otherwise seconds until a token accrues
+        """
+        with self._lock:
+            if not self.enabled:
+                return 0.0
+            
+            self._refill()
+            if self.available_tokens >= 1:
+                self.available_tokens -= 1
+                return 0.0
+            
+            return (1 - self.available_tokens) / self.fill_rate
+    
+    def on_throttle(self) -> None:
+        """Record a throttling error, cutting the fill rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._update_measured_rate(now)
+            
+            rate = (
+                min(self.measured_tx_rate, self.fill_rate)
+                if self.enabled
+                else self.measured_tx_rate
+            )
+            self._last_max_rate = rate
+            self._last_throttle_time = now
+            self._update_fill_rate(rate * self.BETA)
+            self.enabled = True
+            logger.info("Throttled; limiting request rate to %.2f/s", self.fill_rate)
+    
+    def on_success(self) -> None:
+        """Record a successful call, growing the fill rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._update_measured_rate(now)
+            
+            if not self.enabled:
+                return
+            
+            k = (self._last_max_rate * (1 - self.BETA) / self.SCALE_CONSTANT) ** (1 / 3)
+            rate = (
+                self.SCALE_CONSTANT * (now - self._last_throttle_time - k) ** 3
+                + self._last_max_rate
+            )
+            self._update_fill_rate(min(rate, 2 * self.measured_tx_rate))
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        if self.last_update is not None:
+            self.available_tokens = min(
+                self.max_capacity,
+                self.available_tokens + (now - self.last_update) * self.fill_rate
+            )
+        self.last_update = now
+    
+    def _update_fill_rate(self, rate: float) -> None:
+        """Apply a new fill rate, shrinking the bucket to match."""
+        self._refill()
+        self.fill_rate = max(rate, self.MIN_FILL_RATE)
+        self.max_capacity = max(rate, 1.0)
+        self.available_tokens = min(self.available_tokens, self.max_capacity)
+    
+    def _update_measured_rate(self, now: float) -> None:
+        """Update the smoothed send rate over half-second buckets."""
+        bucket = math.floor(now * 2) / 2
+        self._request_count += 1
+        if bucket > self._last_tx_bucket:
+            current_rate = self._request_count / (bucket - self._last_tx_bucket)
+            self.measured_tx_rate = (
+                current_rate * self.SMOOTHING
+                + self.measured_tx_rate * (1 - self.SMOOTHING)
+            )
+            self._request_count = 0
+            self._last_tx_bucket = bucket
+
+
+class RetryBudget:
+    """Stops retrying once retries make up too much of recent traffic.
+    
+    Successful calls and retries are recorded over a sliding window. When
+    retries exceed ``threshold`` of the window, retrying is switched off for
+    ``cool_down`` seconds so a sustained outage does not turn into a retry
+    storm. The ratio is only trusted once ``min_samples`` events are in the
+    window.
+    """
+    
+    def __init__(
+        self,
+        window: float = 60.0,
+        threshold: float = 0.3,
+        cool_down: float = 30.0,
+        min_samples: int = 10
+    ):
+        """Initialize retry budget.
+        
+        Args:
+            window: Length of the sliding window in seconds
+            threshold: Maximum share of retries in the window
+            cool_down: Seconds to stay in no-retry mode
+            min_samples: Events needed in the window before the ratio applies
+        """
+        self.window = window
+        self.threshold = threshold
+        self.cool_down = cool_down
+        self.min_samples = min_samples
+        self.no_retry_until = 0.0
+        self._events: Deque[Tuple[float, bool]] = deque()
+        self._retries = 0
+        self._lock = threading.Lock()
+    
+    def record_success(self) -> None:
+        """Record a call that succeeded."""
+        self._record(False)
+    
+    def record_retry(self) -> None:
+        """Record a retry of a failed call."""
+        self._record(True)
+    
+    def retry_ratio(self) -> float:
+        """Get the share of retries among the events in the window.
+        
+        Returns:
+            Retry ratio, or 0.0 while there are fewer than min_samples events
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            total = len(self._events)
+            if total < self.min_samples:
+                return 0.0
+            return self._retries / max(1, total)
+    
+    def in_no_retry(self) -> bool:
+        """Check whether retries are currently switched off."""
+        return time.monotonic() < self.no_retry_until
+    
+    def enter_no_retry(self) -> None:
+        """Switch retries off for the cool-down period."""
+        self.no_retry_until = time.monotonic() + self.cool_down
+        logger.warning("Retry budget exhausted; retries paused for %.0fs", self.cool_down)
+    
+    def _record(self, is_retry: bool) -> None:
+        """Add an event to the window."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._events.append((now, is_retry))
+            if is_retry:
+                self._retries += 1
+    
+    def _expire(self, now: float) -> None:
+        """Drop events that have left the window."""
+        events = self._events
+        cutoff = now - self.window
+        while events and events[0][0] < cutoff:
+            if events.popleft()[1]:
+                self._retries -= 1
+
+
+JitterStrategy = Literal["none", "exponential", "full", "equal", "decorrelated"]
+
+
+def _no_backoff(config: "RetryConfig", attempt: int, prev_delay: float) -> float:
+    """Constant delay of ``base_delay``."""
+    return config.base_delay
+
+
+def _exponential_backoff(config: "RetryConfig", attempt: int, prev_delay: float) -> float:
+    """Exponential delay without jitter."""
+    return config.base_delay * (config.exponential_base ** attempt)
+
+
+def _full_jitter_backoff(config: "RetryConfig", attempt: int, prev_delay: float) -> float:
+    """Uniform delay between zero and the exponential delay."""
+    ceiling = min(_exponential_backoff(config, attempt, prev_delay), config.max_delay)
+    return random.uniform(0, ceiling)
+
+
+def _equal_jitter_backoff(config: "RetryConfig", attempt: int, prev_delay: float) -> float:
+    """Half the exponential delay plus a uniform jitter over the other half."""
+    half = min(_exponential_backoff(config, attempt, prev_delay), config.max_delay) / 2
+    return half + random.uniform(0, half)
+
+
+def _decorrelated_jitter_backoff(
+    config: "RetryConfig",
+    attempt: int,
+    prev_delay: float
+) -> float:
+    """Uniform delay between ``base_delay`` and three times the previous delay."""
+    return random.uniform(config.base_delay, max(config.base_delay, prev_delay) * 3)
+
+
+_BACKOFF_STRATEGIES: Dict[str, Callable[["RetryConfig", int, float], float]] = {
+    "none": _no_backoff,
+    "exponential": _exponential_backoff,
+    "full": _full_jitter_backoff,
+    "equal": _equal_jitter_backoff,
+    "decorrelated": _decorrelated_jitter_backoff,
+}
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -20,7 +433,12 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         jitter: bool = True,
-        retryable_exceptions: Optional[List[Type[Exception]]] = None
+        retryable_exceptions: Optional[List[Type[Exception]]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        jitter_strategy: Optional[JitterStrategy] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        total_timeout: Optional[float] = None
     ):
         """Initialize retry configuration.
         
@@ -31,17 +449,38 @@ class RetryConfig:
             exponential_base: Base for exponential backoff
             jitter: Whether to add random jitter to delays
             retryable_exceptions: List of exceptions that should trigger retries
+            circuit_breaker: Breaker shared by every handler using this config
+            jitter_strategy: Backoff algorithm; defaults to "decorrelated", or
+                "exponential" when jitter is disabled
+            rate_limiter: Limiter pacing every handler using this config
+            retry_budget: Budget capping retries for every handler using
+                this config
+            total_timeout: Seconds after the first attempt beyond which no
+                further retry is started; None for no limit
+            
+        Raises:
+            ValueError: If jitter_strategy is not a known strategy
         """
+        if jitter_strategy is None:
+            jitter_strategy = "decorrelated" if jitter else "exponential"
+        if jitter_strategy not in _BACKOFF_STRATEGIES:
+            raise ValueError(f"Unknown jitter strategy: {jitter_strategy}")
+        
         self.max_attempts = max_attempts
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.jitter_strategy = jitter_strategy
         self.retryable_exceptions = retryable_exceptions or [
             ConnectionError,
             TimeoutError,
             OSError,
         ]
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.retry_budget = retry_budget
+        self.total_timeout = total_timeout
 
 
 class RetryHandler:
@@ -54,25 +493,45 @@ class RetryHandler:
             config: Retry configuration
         """
         self.config = config or RetryConfig()
+        self._retryable_tuple: Tuple[Type[Exception], ...] = tuple(
+            self.config.retryable_exceptions
+        )
     
-    def calculate_delay(self, attempt: int) -> float:
+    @staticmethod
+    def bind(func: Callable) -> Callable[..., Awaitable[Any]]:
+        """Get an awaitable invoker for a function.
+        
+        Coroutine functions are returned unchanged; sync functions are wrapped
+        to run in a worker thread so they do not block the event loop.
+        
+        Args:
+            func: Function to invoke
+            
+        Returns:
+            Callable returning an awaitable of the function's result
+        """
+        if asyncio.iscoroutinefunction(func):
+            return func
+        return partial(asyncio.to_thread, func)
+    
+    def calculate_delay(self, attempt: int, prev_delay: Optional[float] = None) -> float:
         """Calculate delay for given attempt number.
         
         Args:
             attempt: Current attempt number (0-based)
+            prev_delay: Delay used before the previous attempt, which the
+                decorrelated strategy grows from; defaults to base_delay
             
         Returns:
             Delay in seconds
         """
-        delay = self.config.base_delay * (self.config.exponential_base ** attempt)
-        delay = min(delay, self.config.max_delay)
+        if prev_delay is None:
+            prev_delay = self.config.base_delay
         
-        if self.config.jitter:
-            # Add random jitter (±25%)
-            jitter_range = delay * 0.25
-            delay += random.uniform(-jitter_range, jitter_range)
+        backoff = _BACKOFF_STRATEGIES[self.config.jitter_strategy]
+        delay = backoff(self.config, attempt, prev_delay)
         
-        return max(0, delay)
+        return max(0, min(delay, self.config.max_delay))
     
     def should_retry(self, exception: Exception, attempt: int) -> bool:
         """Determine if an exception should trigger a retry.
@@ -87,22 +546,36 @@ class RetryHandler:
         if attempt >= self.config.max_attempts - 1:
             return False
         
+        if not self.is_retryable(exception):
+            return False
+        
+        budget = self.config.retry_budget
+        if budget is not None:
+            if budget.in_no_retry():
+                return False
+            if budget.retry_ratio() > budget.threshold:
+                budget.enter_no_retry()
+                return False
+        
+        return True
+    
+    def is_retryable(self, exception: Exception) -> bool:
+        """Determine if an exception indicates a transient service failure.
+        
+        Args:
+            exception: The exception that occurred
+            
+        Returns:
+            True if the exception is retryable, False otherwise
+        """
         # Check if exception type is retryable
-        for retryable_type in self.config.retryable_exceptions:
-            if isinstance(exception, retryable_type):
-                return True
+        if isinstance(exception, self._retryable_tuple):
+            return True
         
         # Check for specific AWS error codes that are retryable
         if hasattr(exception, 'response'):
             error_code = exception.response.get('Error', {}).get('Code', '')
-            retryable_codes = [
-                'ThrottlingException',
-                'ServiceUnavailable',
-                'InternalServerError',
-                'RequestTimeout',
-                'TooManyRequestsException'
-            ]
-            if error_code in retryable_codes:
+            if error_code in _RETRYABLE_ERROR_CODES:
                 return True
         
         return False
@@ -115,6 +588,59 @@ class RetryHandler:
     ) -> Any:
         """Execute function with retry logic.
         
+        Args:
+            func: Function to execute, or an invoker from bind()
+            *args: Positional arguments for function
+            **kwargs: Keyword arguments for function
+            
+        Returns:
+            Function result
+            
+        Raises:
+            CircuitOpenError: If the service's circuit breaker is open
+            Last exception if all retries failed
+        """
+        last_exception: Optional[Exception] = None
+        rate_limiter = self.config.rate_limiter
+        delay = self.config.base_delay
+        deadline = self._deadline()
+        invoker = self.bind(func)
+        
+        for attempt in range(self.config.max_attempts):
+            self._before_attempt()
+            try:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                result = await invoker(*args, **kwargs)
+            except Exception as e:
+                last_exception = e
+                next_delay = self._after_failure(e, attempt, delay, deadline)
+                if next_delay is None:
+                    raise
+                delay = next_delay
+                await asyncio.sleep(delay)
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but a
+                # half-open probe must not stay claimed
+                self._release_probe()
+                raise
+            else:
+                self._after_success()
+                return result
+        
+        # Only reached when max_attempts is below one
+        if last_exception is None:
+            raise ValueError("max_attempts must be at least 1")
+        raise last_exception
+    
+    def execute_with_retry_sync(
+        self,
+        func: Callable,
+        *args,
+        **kwargs
+    ) -> Any:
+        """Execute a sync function with retry logic, sleeping between attempts.
+        
         Args:
             func: Function to execute
             *args: Positional arguments for function
@@ -124,35 +650,120 @@ class RetryHandler:
             Function result
             
         Raises:
+            CircuitOpenError: If the service's circuit breaker is open
             Last exception if all retries failed
         """
-        last_exception = None
+        last_exception: Optional[Exception] = None
+        rate_limiter = self.config.rate_limiter
+        delay = self.config.base_delay
+        deadline = self._deadline()
         
         for attempt in range(self.config.max_attempts):
+            self._before_attempt()
             try:
-                if asyncio.iscoroutinefunction(func):
-                    return await func(*args, **kwargs)
-                else:
-                    return func(*args, **kwargs)
-                    
+                if rate_limiter is not None:
+                    rate_limiter.acquire_sync()
+                result = func(*args, **kwargs)
             except Exception as e:
                 last_exception = e
-                
-                if not self.should_retry(e, attempt):
-                    logger.error(f"Non-retryable error on attempt {attempt + 1}: {e}")
+                next_delay = self._after_failure(e, attempt, delay, deadline)
+                if next_delay is None:
                     raise
-                
-                if attempt < self.config.max_attempts - 1:
-                    delay = self.calculate_delay(attempt)
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s"
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"All {self.config.max_attempts} attempts failed")
+                delay = next_delay
+                time.sleep(delay)
+            except BaseException:
+                # Interrupted: no outcome to record, but a half-open probe
+                # must not stay claimed
+                self._release_probe()
+                raise
+            else:
+                self._after_success()
+                return result
         
-        # This should never be reached, but just in case
+        # Only reached when max_attempts is below one
+        if last_exception is None:
+            raise ValueError("max_attempts must be at least 1")
         raise last_exception
+    
+    def _deadline(self) -> Optional[float]:
+        """Get the monotonic time after which no retry may start."""
+        if self.config.total_timeout is None:
+            return None
+        return time.monotonic() + self.config.total_timeout
+    
+    def _before_attempt(self) -> None:
+        """Check the circuit breaker before an attempt.
+        
+        Raises:
+            CircuitOpenError: If the service's circuit breaker is open
+        """
+        # Checked before every attempt so an open breaker stops retrying
+        breaker = self.config.circuit_breaker
+        if breaker is not None:
+            breaker.before_call()
+    
+    def _release_probe(self) -> None:
+        """Release a half-open probe claimed by an attempt that did not finish."""
+        if self.config.circuit_breaker is not None:
+            self.config.circuit_breaker.release_probe()
+    
+    def _after_success(self) -> None:
+        """Record a successful attempt with the breaker, limiter and budget."""
+        config = self.config
+        if config.circuit_breaker is not None:
+            config.circuit_breaker.on_success()
+        if config.rate_limiter is not None:
+            config.rate_limiter.on_success()
+        if config.retry_budget is not None:
+            config.retry_budget.record_success()
+    
+    def _after_failure(
+        self,
+        exception: Exception,
+        attempt: int,
+        prev_delay: float,
+        deadline: Optional[float] = None
+    ) -> Optional[float]:
+        """Record a failed attempt and decide whether to retry it.
+        
+        Args:
+            exception: The exception raised by the attempt
+            attempt: Current attempt number (0-based)
+            prev_delay: Delay used before the previous attempt
+            deadline: Monotonic time after which no retry may start
+            
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        config = self.config
+        breaker = config.circuit_breaker
+        if breaker is not None:
+            if self.is_retryable(exception):
+                breaker.on_failure()
+            else:
+                # The service answered, so it counts as healthy
+                breaker.on_success()
+        if config.rate_limiter is not None and _is_throttling_error(exception):
+            config.rate_limiter.on_throttle()
+        
+        if not self.should_retry(exception, attempt):
+            logger.error("Non-retryable error on attempt %s: %s", attempt + 1, exception)
+            return None
+        
+        delay = self.calculate_delay(attempt, prev_delay)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            logger.error(
+                "Attempt %s failed: %s. Retry timeout of %.1fs exhausted",
+                attempt + 1, exception, config.total_timeout
+            )
+            return None
+        
+        if config.retry_budget is not None:
+            config.retry_budget.record_retry()
+        logger.warning(
+            "Attempt %s failed: %s. Retrying in %.2fs", attempt + 1, exception, delay
+        )
+        return delay
 
 
 def retry_on_failure(
@@ -161,7 +772,8 @@ def retry_on_failure(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     jitter: bool = True,
-    retryable_exceptions: Optional[List[Type[Exception]]] = None
+    retryable_exceptions: Optional[List[Type[Exception]]] = None,
+    jitter_strategy: Optional[JitterStrategy] = None
 ):
     """Decorator for adding retry logic to functions.
     
@@ -172,6 +784,7 @@ def retry_on_failure(
         exponential_base: Base for exponential backoff
         jitter: Whether to add random jitter to delays
         retryable_exceptions: List of exceptions that should trigger retries
+        jitter_strategy: Backoff algorithm, see RetryConfig
     """
     config = RetryConfig(
         max_attempts=max_attempts,
@@ -179,28 +792,22 @@ def retry_on_failure(
         max_delay=max_delay,
         exponential_base=exponential_base,
         jitter=jitter,
-        retryable_exceptions=retryable_exceptions
+        retryable_exceptions=retryable_exceptions,
+        jitter_strategy=jitter_strategy
     )
     
     retry_handler = RetryHandler(config)
     
     def decorator(func: Callable) -> Callable:
+        invoker = retry_handler.bind(func)
+        
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            return await retry_handler.execute_with_retry(func, *args, **kwargs)
+            return await retry_handler.execute_with_retry(invoker, *args, **kwargs)
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            # For sync functions, we need to run in an event loop
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            return loop.run_until_complete(
-                retry_handler.execute_with_retry(func, *args, **kwargs)
-            )
+            return retry_handler.execute_with_retry_sync(func, *args, **kwargs)
         
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -217,12 +824,11 @@ BEDROCK_RETRY_CONFIG = RetryConfig(
     max_delay=120.0,
     exponential_base=2.0,
     jitter=True,
-    retryable_exceptions=[
-        ConnectionError,
-        TimeoutError,
-        OSError,
-        Exception  # Catch-all for AWS SDK exceptions
-    ]
+    retryable_exceptions=list(_TRANSIENT_AWS_EXCEPTIONS),
+    circuit_breaker=CircuitBreaker("bedrock"),
+    total_timeout=90.0,
+    rate_limiter=AdaptiveRateLimiter(),
+    retry_budget=RetryBudget()
 )
 
 POLLY_RETRY_CONFIG = RetryConfig(
@@ -231,12 +837,11 @@ POLLY_RETRY_CONFIG = RetryConfig(
     max_delay=30.0,
     exponential_base=2.0,
     jitter=True,
-    retryable_exceptions=[
-        ConnectionError,
-        TimeoutError,
-        OSError,
-        Exception  # Catch-all for AWS SDK exceptions
-    ]
+    retryable_exceptions=list(_TRANSIENT_AWS_EXCEPTIONS),
+    circuit_breaker=CircuitBreaker("polly"),
+    total_timeout=30.0,
+    rate_limiter=AdaptiveRateLimiter(),
+    retry_budget=RetryBudget()
 )
 
 S3_RETRY_CONFIG = RetryConfig(
@@ -245,10 +850,8 @@ S3_RETRY_CONFIG = RetryConfig(
     max_delay=10.0,
     exponential_base=2.0,
     jitter=True,
-    retryable_exceptions=[
-        ConnectionError,
-        TimeoutError,
-        OSError,
-        Exception  # Catch-all for AWS SDK exceptions
-    ]
+    retryable_exceptions=list(_TRANSIENT_AWS_EXCEPTIONS),
+    circuit_breaker=CircuitBreaker("s3"),
+    total_timeout=15.0,
+    retry_budget=RetryBudget()
 )
\ No newline at end of file
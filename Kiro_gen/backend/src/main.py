@@ -12,6 +12,7 @@ from fastapi.responses import FileResponse, StreamingResponse
 import uvicorn
 
 from .config import settings
+from .aws_clients import aws_clients
 from .api.upload import upload_router
 from .api.jobs import jobs_router
 from .api.library import library_router
@@ -21,7 +22,7 @@ from .storage.library_manager import LibraryManager
 from .storage.local_manager import LocalStorageManager
 from .storage.s3_manager import S3StorageManager
 from .monitoring.cost_monitor import CostMonitor
-from .monitoring.logger import setup_logging
+from .monitoring.logger import setup_logging, shutdown_logging
 from .monitoring.metrics import MetricsCollector
 
 # Setup logging
@@ -91,6 +92,10 @@ async def lifespan(app: FastAPI):
         await cost_monitor.close()
     if metrics_collector:
         await metrics_collector.close()
+    # Release the pooled connections of the shared AWS clients
+    aws_clients.close()
+    # Drain queued log records before the process exits
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -159,7 +164,7 @@ async def get_metrics():
     if not hasattr(app.state, "metrics_collector") or not app.state.metrics_collector:
         raise HTTPException(status_code=503, detail="Metrics collector not available")
 
-    return await app.state.metrics_collector.get_metrics()
+    return app.state.metrics_collector.get_metrics()
 
 
 @app.get("/costs")
@@ -1,16 +1,32 @@
 """Cost monitoring and optimization for AWS services."""
 
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import asyncio
+import time
 
 logger = logging.getLogger(__name__)
 
+# Keys of CostMonitor's running service totals
+_TOTAL_KEYS = (
+    "bedrock_api_calls",
+    "bedrock_input_tokens",
+    "bedrock_output_tokens",
+    "bedrock_cost_usd",
+    "polly_api_calls",
+    "polly_characters",
+    "polly_cost_usd",
+    "s3_storage_gb_hours",
+    "s3_cost_usd",
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ServiceCost:
     """Cost information for a specific AWS service."""
     service_name: str
@@ -20,10 +36,10 @@ class ServiceCost:
     characters_processed: int = 0
     storage_gb_hours: float = 0.0
     estimated_cost_usd: float = 0.0
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated: float = field(default_factory=time.time)  # Unix timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCost:
     """Cost tracking for a specific job."""
     job_id: str
@@ -60,26 +76,62 @@ class CostMonitor:
         "standard": 0.023,  # per GB per month
         "intelligent_tiering": 0.0125  # per GB per month
     }
+    
+    # Rates precomputed from the tables above: USD per token and per GB-hour
+    _BEDROCK_RATES = {
+        model_key: (
+            pricing["input_per_1k_tokens"] / 1000.0,
+            pricing["output_per_1k_tokens"] / 1000.0
+        )
+        for model_key, pricing in BEDROCK_PRICING.items()
+    }
+    
+    _S3_RATES_PER_GB_HOUR = {
+        storage_class: price / (24 * 30)
+        for storage_class, price in S3_PRICING.items()
+    }
 
     def __init__(self):
         """Initialize cost monitor."""
-        self.job_costs: Dict[str, JobCost] = {}
+        # Ordered oldest first; jobs move to the end when they finish
+        self.job_costs: "OrderedDict[str, JobCost]" = OrderedDict()
         self.daily_costs: Dict[str, ServiceCost] = {}
         self.monthly_costs: Dict[str, ServiceCost] = {}
         self.cost_alerts: List[Dict[str, Any]] = []
         
+        # Running totals over all tracked jobs, kept in step with job_costs
+        # so the summary does not rescan every job
+        self._totals: Dict[str, float] = dict.fromkeys(_TOTAL_KEYS, 0)
+        self._total_cost = 0.0
+        self._completed_jobs = 0
+        self._failed_jobs = 0
+        
+        # Daily cost keys for the current local day, rebuilt at midnight
+        self._day_iso = ""
+        self._day_keys: Dict[str, str] = {}
+        self._day_ends_at = 0.0
+        
         # Cost thresholds for alerts
         self.daily_threshold_usd = 50.0
         self.monthly_threshold_usd = 500.0
         self.job_threshold_usd = 10.0
+        
+        # Retention for finished jobs; evicted jobs stay in the running totals
+        self.max_jobs = 10_000
+        self.job_retention = timedelta(days=7)
+        self._evicted_jobs = 0
 
     async def start_job_tracking(self, job_id: str) -> None:
         """Start cost tracking for a job."""
+        previous = self.job_costs.get(job_id)
+        if previous is not None:
+            self._discard_from_totals(previous)
+        
         self.job_costs[job_id] = JobCost(
             job_id=job_id,
             started_at=datetime.now()
         )
-        logger.info(f"Started cost tracking for job {job_id}")
+        logger.info("Started cost tracking for job %s", job_id)
 
     async def track_bedrock_usage(
         self,
@@ -95,26 +147,27 @@ class CostMonitor:
         
         job_cost = self.job_costs[job_id]
         
-        # Determine model pricing
-        model_key = "claude-3-5-sonnet" if "claude" in model_id.lower() else "nova-pro"
-        pricing = self.BEDROCK_PRICING.get(model_key, self.BEDROCK_PRICING["claude-3-5-sonnet"])
-        
-        # Calculate cost
-        input_cost = (input_tokens / 1000) * pricing["input_per_1k_tokens"]
-        output_cost = (output_tokens / 1000) * pricing["output_per_1k_tokens"]
-        total_cost = input_cost + output_cost
+        # Determine model pricing and calculate cost
+        input_rate, output_rate = _bedrock_rates(model_id)
+        total_cost = input_tokens * input_rate + output_tokens * output_rate
         
         # Update job cost
         job_cost.bedrock_cost.api_calls += api_calls
         job_cost.bedrock_cost.input_tokens += input_tokens
         job_cost.bedrock_cost.output_tokens += output_tokens
         job_cost.bedrock_cost.estimated_cost_usd += total_cost
-        job_cost.bedrock_cost.last_updated = datetime.now()
+        job_cost.bedrock_cost.last_updated = time.time()
+        
+        totals = self._totals
+        totals["bedrock_api_calls"] += api_calls
+        totals["bedrock_input_tokens"] += input_tokens
+        totals["bedrock_output_tokens"] += output_tokens
+        totals["bedrock_cost_usd"] += total_cost
         
         # Update daily/monthly aggregates
-        await self._update_daily_costs("bedrock", api_calls, input_tokens, output_tokens, 0, 0, total_cost)
+        self._update_daily_costs("bedrock", api_calls, input_tokens, output_tokens, 0, 0, total_cost)
         
-        logger.debug(f"Tracked Bedrock usage for job {job_id}: ${total_cost:.4f}")
+        logger.debug("Tracked Bedrock usage for job %s: $%.4f", job_id, total_cost)
 
     async def track_polly_usage(
         self,
@@ -137,12 +190,17 @@ class CostMonitor:
         job_cost.polly_cost.api_calls += api_calls
         job_cost.polly_cost.characters_processed += characters
         job_cost.polly_cost.estimated_cost_usd += total_cost
-        job_cost.polly_cost.last_updated = datetime.now()
+        job_cost.polly_cost.last_updated = time.time()
+        
+        totals = self._totals
+        totals["polly_api_calls"] += api_calls
+        totals["polly_characters"] += characters
+        totals["polly_cost_usd"] += total_cost
         
         # Update daily/monthly aggregates
-        await self._update_daily_costs("polly", api_calls, 0, 0, characters, 0, total_cost)
+        self._update_daily_costs("polly", api_calls, 0, 0, characters, 0, total_cost)
         
-        logger.debug(f"Tracked Polly usage for job {job_id}: ${total_cost:.4f}")
+        logger.debug("Tracked Polly usage for job %s: $%.4f", job_id, total_cost)
 
     async def track_s3_usage(
         self,
@@ -158,59 +216,62 @@ class CostMonitor:
         job_cost = self.job_costs[job_id]
         
         # Calculate cost (prorated for hours)
-        price_per_gb_month = self.S3_PRICING.get(storage_class, self.S3_PRICING["standard"])
-        total_cost = size_gb * (hours / (24 * 30)) * price_per_gb_month
+        gb_hours = size_gb * hours
+        rates = self._S3_RATES_PER_GB_HOUR
+        total_cost = gb_hours * rates.get(storage_class, rates["standard"])
         
         # Update job cost
-        job_cost.s3_cost.storage_gb_hours += size_gb * hours
+        job_cost.s3_cost.storage_gb_hours += gb_hours
         job_cost.s3_cost.estimated_cost_usd += total_cost
-        job_cost.s3_cost.last_updated = datetime.now()
+        job_cost.s3_cost.last_updated = time.time()
+        
+        totals = self._totals
+        totals["s3_storage_gb_hours"] += gb_hours
+        totals["s3_cost_usd"] += total_cost
         
         # Update daily/monthly aggregates
-        await self._update_daily_costs("s3", 0, 0, 0, 0, size_gb * hours, total_cost)
+        self._update_daily_costs("s3", 0, 0, 0, 0, gb_hours, total_cost)
         
-        logger.debug(f"Tracked S3 usage for job {job_id}: ${total_cost:.4f}")
+        logger.debug("Tracked S3 usage for job %s: $%.4f", job_id, total_cost)
 
     async def complete_job_tracking(self, job_id: str, result: Dict[str, Any]) -> None:
         """Complete cost tracking for a job."""
         if job_id not in self.job_costs:
-            logger.warning(f"Job {job_id} not found in cost tracking")
+            logger.warning("Job %s not found in cost tracking", job_id)
             return
         
         job_cost = self.job_costs[job_id]
         job_cost.completed_at = datetime.now()
-        job_cost.status = "completed"
+        self._set_job_status(job_cost, "completed")
         
         # Calculate total cost
-        job_cost.total_estimated_cost = (
-            job_cost.bedrock_cost.estimated_cost_usd +
-            job_cost.polly_cost.estimated_cost_usd +
-            job_cost.s3_cost.estimated_cost_usd
-        )
+        self._set_job_total(job_cost)
         
         # Check for cost alerts
         await self._check_cost_alerts(job_cost)
         
-        logger.info(f"Completed cost tracking for job {job_id}: ${job_cost.total_estimated_cost:.4f}")
+        self.job_costs.move_to_end(job_id)
+        self._evict_finished_jobs()
+        
+        logger.info("Completed cost tracking for job %s: $%.4f", job_id, job_cost.total_estimated_cost)
 
     async def error_job_tracking(self, job_id: str, error: str) -> None:
         """Mark job as failed in cost tracking."""
         if job_id not in self.job_costs:
-            logger.warning(f"Job {job_id} not found in cost tracking")
+            logger.warning("Job %s not found in cost tracking", job_id)
             return
         
         job_cost = self.job_costs[job_id]
         job_cost.completed_at = datetime.now()
-        job_cost.status = "failed"
+        self._set_job_status(job_cost, "failed")
         
         # Calculate total cost even for failed jobs
-        job_cost.total_estimated_cost = (
-            job_cost.bedrock_cost.estimated_cost_usd +
-            job_cost.polly_cost.estimated_cost_usd +
-            job_cost.s3_cost.estimated_cost_usd
-        )
+        self._set_job_total(job_cost)
         
-        logger.info(f"Error in job {job_id}, total cost: ${job_cost.total_estimated_cost:.4f}")
+        self.job_costs.move_to_end(job_id)
+        self._evict_finished_jobs()
+        
+        logger.info("Error in job %s, total cost: $%.4f", job_id, job_cost.total_estimated_cost)
 
     async def get_job_cost(self, job_id: str) -> Optional[JobCost]:
         """Get cost information for a specific job."""
@@ -218,19 +279,14 @@ class CostMonitor:
 
     async def get_cost_summary(self) -> Dict[str, Any]:
         """Get comprehensive cost summary."""
-        # Calculate totals
-        total_jobs = len(self.job_costs)
-        completed_jobs = len([j for j in self.job_costs.values() if j.status == "completed"])
-        failed_jobs = len([j for j in self.job_costs.values() if j.status == "failed"])
-        
-        total_cost = sum(j.total_estimated_cost for j in self.job_costs.values())
+        totals = self._totals
         
         # Daily costs
         today = datetime.now().date()
         daily_cost = sum(
             cost.estimated_cost_usd 
             for cost in self.daily_costs.values() 
-            if cost.last_updated.date() == today
+            if date.fromtimestamp(cost.last_updated) == today
         )
         
         # Monthly costs
@@ -238,33 +294,33 @@ class CostMonitor:
         monthly_cost = sum(
             cost.estimated_cost_usd 
             for cost in self.monthly_costs.values() 
-            if cost.last_updated.date() >= current_month
+            if date.fromtimestamp(cost.last_updated) >= current_month
         )
         
         return {
             "summary": {
-                "total_jobs": total_jobs,
-                "completed_jobs": completed_jobs,
-                "failed_jobs": failed_jobs,
-                "total_cost_usd": total_cost,
+                "total_jobs": len(self.job_costs) + self._evicted_jobs,
+                "completed_jobs": self._completed_jobs,
+                "failed_jobs": self._failed_jobs,
+                "total_cost_usd": self._total_cost,
                 "daily_cost_usd": daily_cost,
                 "monthly_cost_usd": monthly_cost
             },
             "service_breakdown": {
                 "bedrock": {
-                    "total_api_calls": sum(j.bedrock_cost.api_calls for j in self.job_costs.values()),
-                    "total_input_tokens": sum(j.bedrock_cost.input_tokens for j in self.job_costs.values()),
-                    "total_output_tokens": sum(j.bedrock_cost.output_tokens for j in self.job_costs.values()),
-                    "total_cost_usd": sum(j.bedrock_cost.estimated_cost_usd for j in self.job_costs.values())
+                    "total_api_calls": totals["bedrock_api_calls"],
+                    "total_input_tokens": totals["bedrock_input_tokens"],
+                    "total_output_tokens": totals["bedrock_output_tokens"],
+                    "total_cost_usd": totals["bedrock_cost_usd"]
                 },
                 "polly": {
-                    "total_api_calls": sum(j.polly_cost.api_calls for j in self.job_costs.values()),
-                    "total_characters": sum(j.polly_cost.characters_processed for j in self.job_costs.values()),
-                    "total_cost_usd": sum(j.polly_cost.estimated_cost_usd for j in self.job_costs.values())
+                    "total_api_calls": totals["polly_api_calls"],
+                    "total_characters": totals["polly_characters"],
+                    "total_cost_usd": totals["polly_cost_usd"]
                 },
                 "s3": {
-                    "total_storage_gb_hours": sum(j.s3_cost.storage_gb_hours for j in self.job_costs.values()),
-                    "total_cost_usd": sum(j.s3_cost.estimated_cost_usd for j in self.job_costs.values())
+                    "total_storage_gb_hours": totals["s3_storage_gb_hours"],
+                    "total_cost_usd": totals["s3_cost_usd"]
                 }
             },
             "alerts": self.cost_alerts[-10:],  # Last 10 alerts
@@ -275,7 +331,69 @@ class CostMonitor:
             }
         }
 
-    async def _update_daily_costs(
+    def _evict_finished_jobs(self) -> None:
+        """Drop the oldest finished jobs beyond max_jobs or past job_retention."""
+        excess = len(self.job_costs) - self.max_jobs
+        cutoff = datetime.now() - self.job_retention
+        
+        evicted = []
+        for job_id, job_cost in self.job_costs.items():
+            if job_cost.status == "running":
+                continue
+            # Finished jobs are in completion order, so stop at the first one kept
+            if excess <= 0 and job_cost.completed_at >= cutoff:
+                break
+            evicted.append(job_id)
+            excess -= 1
+        
+        for job_id in evicted:
+            del self.job_costs[job_id]
+        self._evicted_jobs += len(evicted)
+
+    def _set_job_status(self, job_cost: JobCost, status: str) -> None:
+        """Change a job's status, keeping the completed/failed counters in step."""
+        if job_cost.status == "completed":
+            self._completed_jobs -= 1
+        elif job_cost.status == "failed":
+            self._failed_jobs -= 1
+        
+        job_cost.status = status
+        
+        if status == "completed":
+            self._completed_jobs += 1
+        elif status == "failed":
+            self._failed_jobs += 1
+
+    def _set_job_total(self, job_cost: JobCost) -> None:
+        """Recalculate a job's total cost and apply the change to the running total."""
+        previous_total = job_cost.total_estimated_cost
+        job_cost.total_estimated_cost = (
+            job_cost.bedrock_cost.estimated_cost_usd +
+            job_cost.polly_cost.estimated_cost_usd +
+            job_cost.s3_cost.estimated_cost_usd
+        )
+        self._total_cost += job_cost.total_estimated_cost - previous_total
+
+    def _discard_from_totals(self, job_cost: JobCost) -> None:
+        """Remove a job's contribution from the running totals."""
+        totals = self._totals
+        totals["bedrock_api_calls"] -= job_cost.bedrock_cost.api_calls
+        totals["bedrock_input_tokens"] -= job_cost.bedrock_cost.input_tokens
+        totals["bedrock_output_tokens"] -= job_cost.bedrock_cost.output_tokens
+        totals["bedrock_cost_usd"] -= job_cost.bedrock_cost.estimated_cost_usd
+        totals["polly_api_calls"] -= job_cost.polly_cost.api_calls
+        totals["polly_characters"] -= job_cost.polly_cost.characters_processed
+        totals["polly_cost_usd"] -= job_cost.polly_cost.estimated_cost_usd
+        totals["s3_storage_gb_hours"] -= job_cost.s3_cost.storage_gb_hours
+        totals["s3_cost_usd"] -= job_cost.s3_cost.estimated_cost_usd
+        
+        self._total_cost -= job_cost.total_estimated_cost
+        if job_cost.status == "completed":
+            self._completed_jobs -= 1
+        elif job_cost.status == "failed":
+            self._failed_jobs -= 1
+
+    def _update_daily_costs(
         self,
         service: str,
         api_calls: int,
@@ -286,20 +404,34 @@ class CostMonitor:
         cost: float
     ) -> None:
         """Update daily cost aggregates."""
-        today = datetime.now().date().isoformat()
-        key = f"{service}_{today}"
+        now = time.time()
+        key = self._today_key(service, now)
         
-        if key not in self.daily_costs:
-            self.daily_costs[key] = ServiceCost(service)
+        daily_cost = self.daily_costs.get(key)
+        if daily_cost is None:
+            daily_cost = self.daily_costs[key] = ServiceCost(service)
         
-        daily_cost = self.daily_costs[key]
         daily_cost.api_calls += api_calls
         daily_cost.input_tokens += input_tokens
         daily_cost.output_tokens += output_tokens
         daily_cost.characters_processed += characters
         daily_cost.storage_gb_hours += storage_gb_hours
         daily_cost.estimated_cost_usd += cost
-        daily_cost.last_updated = datetime.now()
+        daily_cost.last_updated = now
+
+    def _today_key(self, service: str, now: float) -> str:
+        """Get the daily cost key for a service on the current local day."""
+        if now >= self._day_ends_at:
+            today = date.fromtimestamp(now)
+            tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            self._day_ends_at = tomorrow.timestamp()
+            self._day_iso = today.isoformat()
+            self._day_keys = {}
+        
+        key = self._day_keys.get(service)
+        if key is None:
+            key = self._day_keys[service] = f"{service}_{self._day_iso}"
+        return key
 
     async def _check_cost_alerts(self, job_cost: JobCost) -> None:
         """Check for cost threshold alerts."""
@@ -313,14 +445,14 @@ class CostMonitor:
                 "timestamp": datetime.now().isoformat()
             }
             self.cost_alerts.append(alert)
-            logger.warning(f"Job cost alert: {job_cost.job_id} exceeded ${self.job_threshold_usd}")
+            logger.warning("Job cost alert: %s exceeded $%s", job_cost.job_id, self.job_threshold_usd)
         
         # Daily alert
         today = datetime.now().date()
         daily_total = sum(
             cost.estimated_cost_usd 
             for cost in self.daily_costs.values() 
-            if cost.last_updated.date() == today
+            if date.fromtimestamp(cost.last_updated) == today
         )
         
         if daily_total > self.daily_threshold_usd:
@@ -332,9 +464,23 @@ class CostMonitor:
                 "timestamp": datetime.now().isoformat()
             }
             self.cost_alerts.append(alert)
-            logger.warning(f"Daily cost alert: ${daily_total:.2f} exceeded ${self.daily_threshold_usd}")
+            logger.warning("Daily cost alert: $%.2f exceeded $%s", daily_total, self.daily_threshold_usd)
 
     async def close(self) -> None:
         """Close cost monitor and save state."""
         logger.info("Closing cost monitor")
-        # Could save state to file or database here
\ No newline at end of file
+        # Could save state to file or database here
+
+
+@lru_cache(maxsize=32)
+def _bedrock_rates(model_id: str) -> Tuple[float, float]:
+    """Resolve a Bedrock model ID to its (input, output) price per token.
+    
+    Args:
+        model_id: Bedrock model or inference profile ID
+        
+    Returns:
+        Tuple of input and output prices in USD per token
+    """
+    model_key = "claude-4-5-sonnet" if "claude" in model_id.lower() else "nova-pro"
+    return CostMonitor._BEDROCK_RATES[model_key]
@@ -1,23 +1,49 @@
 """Structured logging configuration for Comic Audio Narrator."""
 
+import atexit
+import copy
+import functools
 import logging
 import logging.config
+import logging.handlers
 import json
+import queue
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, UTC
-from typing import Dict, Any
+from typing import Any, ClassVar, Dict, Iterator, Optional
 from pathlib import Path
 
+try:
+    import orjson  # Rust-backed JSON serializer
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..config import settings
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
     
+    # LogRecord attributes that are not copied into the entry as extra fields
+    _STANDARD_ATTRS: ClassVar[frozenset[str]] = frozenset({
+        'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+        'filename', 'module', 'lineno', 'funcName', 'created',
+        'msecs', 'relativeCreated', 'thread', 'threadName',
+        'processName', 'process', 'getMessage', 'exc_info',
+        'exc_text', 'stack_info'
+    })
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # isoformat() of a UTC datetime always ends in '+00:00'
+        timestamp = datetime.fromtimestamp(record.created, UTC).isoformat(
+            timespec="milliseconds"
+        )
         log_entry = {
-            "timestamp": datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            "timestamp": timestamp[:-6] + 'Z',
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -31,15 +57,19 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
         
         # Add extra fields from record
-        for key, value in record.__dict__.items():
-            if key not in {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                'filename', 'module', 'lineno', 'funcName', 'created',
-                'msecs', 'relativeCreated', 'thread', 'threadName',
-                'processName', 'process', 'getMessage', 'exc_info',
-                'exc_text', 'stack_info'
-            }:
-                log_entry[key] = value
+        log_entry.update({
+            key: value for key, value in record.__dict__.items()
+            if key not in self._STANDARD_ATTRS
+        })
+        
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(
+                    log_entry, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits; the stdlib handles these
+                pass
         
         return json.dumps(log_entry, default=str)
 
@@ -54,6 +84,26 @@ class PlainFormatter(logging.Formatter):
         )
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler feeding a listener in the same process.
+    
+    The stock handler renders the whole record, traceback included, into
+    msg before enqueueing. Records here never leave the process, so only
+    the message is rendered on the calling thread and exc_info is kept for
+    the formatters.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listener that performs handler I/O on behalf of the application loggers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging() -> None:
     """Setup logging configuration based on settings."""
     
@@ -83,7 +133,7 @@ def setup_logging() -> None:
                 "formatter": "default",
                 "stream": sys.stdout
             },
-            "file": {
+            "rotating_file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": settings.log_level,
                 "formatter": "default",
@@ -91,6 +141,15 @@ def setup_logging() -> None:
                 "maxBytes": 10485760,  # 10MB
                 "backupCount": 5
             },
+            # Batches writes (and the rollover size check made on each one);
+            # the buffer is flushed when full or when an error arrives
+            "file": {
+                "class": "logging.handlers.MemoryHandler",
+                "level": settings.log_level,
+                "capacity": 512,
+                "flushLevel": logging.ERROR,
+                "target": "rotating_file"
+            },
             "error_file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "ERROR",
@@ -141,9 +200,26 @@ def setup_logging() -> None:
         }
     }
     
+    # Drain records queued under a previous configuration before its
+    # handlers are closed
+    shutdown_logging()
+    
     # Apply configuration
     logging.config.dictConfig(config)
     
+    # Hand the configured handlers to a background listener so that logging
+    # calls only enqueue records and never wait on console or file I/O
+    global _queue_listener
+    root_logger = logging.getLogger()
+    queue_handler = _LocalQueueHandler(queue.Queue(-1))
+    _queue_listener = logging.handlers.QueueListener(
+        queue_handler.queue, *root_logger.handlers, respect_handler_level=True
+    )
+    for name in config["loggers"]:
+        logging.getLogger(name).handlers = [queue_handler]
+    root_logger.handlers = [queue_handler]
+    _queue_listener.start()
+    
     # Log startup message
     logger = logging.getLogger(__name__)
     logger.info(
@@ -156,29 +232,70 @@ def setup_logging() -> None:
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        # Write out records still held by buffering handlers
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+@functools.lru_cache(maxsize=512)
 def get_logger(name: str) -> logging.Logger:
     """Get logger with structured logging support."""
     return logging.getLogger(name)
 
 
+# Context fields of the current thread or asyncio task. The dict is replaced,
+# never mutated, so it can be passed straight to logging as extra. There is
+# no default: a shared default dict would be one mutable object seen by every
+# context, so readers pass a fresh empty dict to get() instead.
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context")
+
+
 class StructuredLogger:
-    """Helper class for structured logging with context."""
+    """Helper class for structured logging with context.
+    
+    Context fields belong to the current thread or asyncio task rather than
+    to the logger, so concurrent requests sharing a logger do not see each
+    other's fields.
+    """
     
     def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.context: Dict[str, Any] = {}
+    
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Context fields of the current thread or task."""
+        return _log_context.get({})
     
     def set_context(self, **kwargs) -> None:
         """Set context fields for all log messages."""
-        self.context.update(kwargs)
+        _log_context.set(_log_context.get({}) | kwargs)
     
     def clear_context(self) -> None:
         """Clear all context fields."""
-        self.context.clear()
+        _log_context.set({})
+    
+    @contextmanager
+    def push_context(self, **kwargs) -> Iterator[None]:
+        """Set context fields for the duration of a with block."""
+        token = _log_context.set(_log_context.get({}) | kwargs)
+        try:
+            yield
+        finally:
+            _log_context.reset(token)
     
     def _log_with_context(self, level: int, message: str, **kwargs) -> None:
         """Log message with context."""
-        extra = {**self.context, **kwargs}
+        context = _log_context.get({})
+        extra = context | kwargs if kwargs else context
         self.logger.log(level, message, extra=extra)
     
     def debug(self, message: str, **kwargs) -> None:
@@ -202,7 +319,14 @@ class StructuredLogger:
         self._log_with_context(logging.CRITICAL, message, **kwargs)
 
 
+@functools.lru_cache(maxsize=512)
 def get_structured_logger(name: str) -> StructuredLogger:
-    """Get structured logger for a module."""
+    """Get structured logger for a module.
+    
+    Callers asking for the same name share one instance. Context fields
+    are not per instance: they belong to the current thread or asyncio
+    task and are seen by every StructuredLogger, so clear_context() clears
+    them for all loggers in that thread or task.
+    """
     logger = logging.getLogger(name)
     return StructuredLogger(logger)
\ No newline at end of file
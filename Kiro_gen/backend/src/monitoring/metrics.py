@@ -2,16 +2,26 @@
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+import math
+from typing import Deque, Dict, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
-import time
+from collections import Counter, defaultdict, deque
 import psutil
 import threading
 
 logger = logging.getLogger(__name__)
 
+# Ring buffer sizes; the oldest samples are dropped once a buffer is full
+_JOB_RESPONSE_TIME_HISTORY = 2048
+_JOB_ERROR_HISTORY = 256
+_API_RESPONSE_TIME_HISTORY = 1000
+
+
+def _response_time_buffer() -> Deque[float]:
+    """Create a bounded buffer for a job's per-service response times."""
+    return deque(maxlen=_JOB_RESPONSE_TIME_HISTORY)
+
 
 @dataclass
 class JobMetrics:
@@ -28,14 +38,16 @@ class JobMetrics:
     
     # API metrics
     bedrock_api_calls: int = 0
-    bedrock_response_time_ms: List[float] = field(default_factory=list)
+    bedrock_response_time_ms: Deque[float] = field(default_factory=_response_time_buffer)
     polly_api_calls: int = 0
-    polly_response_time_ms: List[float] = field(default_factory=list)
+    polly_response_time_ms: Deque[float] = field(default_factory=_response_time_buffer)
     s3_api_calls: int = 0
-    s3_response_time_ms: List[float] = field(default_factory=list)
+    s3_response_time_ms: Deque[float] = field(default_factory=_response_time_buffer)
     
     # Error metrics
-    errors: List[Dict[str, Any]] = field(default_factory=list)
+    errors: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=_JOB_ERROR_HISTORY)
+    )
     retries: int = 0
     
     # Quality metrics
@@ -71,13 +83,29 @@ class MetricsCollector:
         self.system_metrics: deque = deque(maxlen=max_history_hours * 60)  # 1 per minute
         
         # Performance tracking
-        self.api_response_times = defaultdict(list)
+        self.api_response_times: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=_API_RESPONSE_TIME_HISTORY)
+        )
         self.error_counts = defaultdict(int)
         self.throughput_metrics = defaultdict(list)
         
+        # Running aggregates so get_metrics() does not rescan histories
+        self._api_stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "sum": 0.0, "min": math.inf, "max": 0.0}
+        )
+        self._status_counts: Counter = Counter({"running": 0, "completed": 0, "failed": 0})
+        self._total_panels = 0
+        self._completed_processing_seconds = 0.0
+        self._panels_per_second_sum = 0.0
+        
         # System monitoring
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
+        # Prime the CPU counter; later non-blocking reads report usage since
+        # the previous call
+        psutil.cpu_percent(interval=None)
         
         # Start system monitoring
         self.start_system_monitoring()
@@ -88,6 +116,7 @@ class MetricsCollector:
             return
         
         self._monitoring = True
+        self._stop_event.clear()
         self._monitor_thread = threading.Thread(target=self._system_monitor_loop, daemon=True)
         self._monitor_thread.start()
         logger.info("Started system metrics monitoring")
@@ -95,6 +124,7 @@ class MetricsCollector:
     def stop_system_monitoring(self) -> None:
         """Stop background system monitoring."""
         self._monitoring = False
+        self._stop_event.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
         logger.info("Stopped system metrics monitoring")
@@ -104,12 +134,12 @@ class MetricsCollector:
         while self._monitoring:
             try:
                 # Collect system metrics
-                cpu_percent = psutil.cpu_percent(interval=1)
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
                 disk = psutil.disk_usage('/')
                 
                 # Count active jobs
-                active_jobs = len([j for j in self.job_metrics.values() if j.status == "running"])
+                active_jobs = self._status_counts["running"]
                 
                 metrics = SystemMetrics(
                     timestamp=datetime.now(),
@@ -125,29 +155,39 @@ class MetricsCollector:
                 self.system_metrics.append(metrics)
                 
             except Exception as e:
-                logger.error(f"Error collecting system metrics: {e}")
+                logger.error("Error collecting system metrics: %s", e)
             
-            # Sleep for 60 seconds
-            time.sleep(60)
+            # Wait 60 seconds, waking early if monitoring is stopped
+            self._stop_event.wait(60)
 
-    async def start_job_tracking(self, job_id: str) -> None:
+    def start_job_tracking(self, job_id: str) -> None:
         """Start metrics tracking for a job."""
+        previous = self.job_metrics.get(job_id)
+        if previous is not None:
+            # Restarted job: drop the old run from the running aggregates
+            self._status_counts[previous.status] -= 1
+            self._total_panels -= previous.panels_processed
+            if previous.status == "completed":
+                self._completed_processing_seconds -= previous.processing_time_seconds
+        
         self.job_metrics[job_id] = JobMetrics(
             job_id=job_id,
             started_at=datetime.now()
         )
-        logger.debug(f"Started metrics tracking for job {job_id}")
+        self._status_counts["running"] += 1
+        logger.debug("Started metrics tracking for job %s", job_id)
 
-    async def update_job_progress(self, job_id: str, panels_processed: int, total_panels: int) -> None:
+    def update_job_progress(self, job_id: str, panels_processed: int, total_panels: int) -> None:
         """Update job progress metrics."""
         if job_id not in self.job_metrics:
-            await self.start_job_tracking(job_id)
+            self.start_job_tracking(job_id)
         
         metrics = self.job_metrics[job_id]
+        self._total_panels += panels_processed - metrics.panels_processed
         metrics.panels_processed = panels_processed
         metrics.total_panels = total_panels
 
-    async def track_api_call(
+    def track_api_call(
         self,
         job_id: str,
         service: str,
@@ -157,7 +197,7 @@ class MetricsCollector:
     ) -> None:
         """Track API call metrics."""
         if job_id not in self.job_metrics:
-            await self.start_job_tracking(job_id)
+            self.start_job_tracking(job_id)
         
         metrics = self.job_metrics[job_id]
         
@@ -182,38 +222,45 @@ class MetricsCollector:
             })
             self.error_counts[service] += 1
         
-        # Update global response time tracking
+        # Update global response time tracking (keeps the most recent calls)
         self.api_response_times[service].append(response_time_ms)
         
-        # Keep only recent response times (last 1000)
-        if len(self.api_response_times[service]) > 1000:
-            self.api_response_times[service] = self.api_response_times[service][-1000:]
+        stats = self._api_stats[service]
+        stats["count"] += 1
+        stats["sum"] += response_time_ms
+        if response_time_ms < stats["min"]:
+            stats["min"] = response_time_ms
+        if response_time_ms > stats["max"]:
+            stats["max"] = response_time_ms
 
-    async def track_retry(self, job_id: str, service: str, attempt: int) -> None:
+    def track_retry(self, job_id: str, service: str, attempt: int) -> None:
         """Track retry attempts."""
         if job_id not in self.job_metrics:
-            await self.start_job_tracking(job_id)
+            self.start_job_tracking(job_id)
         
         metrics = self.job_metrics[job_id]
         metrics.retries += 1
         
-        logger.debug(f"Retry tracked for job {job_id}, service {service}, attempt {attempt}")
+        logger.debug("Retry tracked for job %s, service %s, attempt %s", job_id, service, attempt)
 
-    async def complete_job_tracking(self, job_id: str, result: Dict[str, Any]) -> None:
+    def complete_job_tracking(self, job_id: str, result: Dict[str, Any]) -> None:
         """Complete metrics tracking for a job."""
         if job_id not in self.job_metrics:
-            logger.warning(f"Job {job_id} not found in metrics tracking")
+            logger.warning("Job %s not found in metrics tracking", job_id)
             return
         
         metrics = self.job_metrics[job_id]
+        if metrics.status == "completed":
+            self._completed_processing_seconds -= metrics.processing_time_seconds
         metrics.completed_at = datetime.now()
-        metrics.status = "completed"
+        self._set_job_status(metrics, "completed")
         
         # Calculate processing time
         if metrics.started_at:
             metrics.processing_time_seconds = (
                 metrics.completed_at - metrics.started_at
             ).total_seconds()
+        self._completed_processing_seconds += metrics.processing_time_seconds
         
         # Extract quality metrics from result
         if result:
@@ -225,18 +272,21 @@ class MetricsCollector:
         if metrics.processing_time_seconds > 0:
             panels_per_second = metrics.panels_processed / metrics.processing_time_seconds
             self.throughput_metrics['panels_per_second'].append(panels_per_second)
+            self._panels_per_second_sum += panels_per_second
         
-        logger.info(f"Completed metrics tracking for job {job_id}")
+        logger.info("Completed metrics tracking for job %s", job_id)
 
-    async def error_job_tracking(self, job_id: str, error: str) -> None:
+    def error_job_tracking(self, job_id: str, error: str) -> None:
         """Mark job as failed in metrics tracking."""
         if job_id not in self.job_metrics:
-            logger.warning(f"Job {job_id} not found in metrics tracking")
+            logger.warning("Job %s not found in metrics tracking", job_id)
             return
         
         metrics = self.job_metrics[job_id]
+        if metrics.status == "completed":
+            self._completed_processing_seconds -= metrics.processing_time_seconds
         metrics.completed_at = datetime.now()
-        metrics.status = "failed"
+        self._set_job_status(metrics, "failed")
         
         # Add error to metrics
         metrics.errors.append({
@@ -245,38 +295,38 @@ class MetricsCollector:
             "fatal": True
         })
         
-        logger.info(f"Error tracked for job {job_id}: {error}")
+        logger.info("Error tracked for job %s: %s", job_id, error)
 
-    async def get_metrics(self) -> Dict[str, Any]:
+    def get_metrics(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary."""
         now = datetime.now()
         
         # Job metrics summary
         total_jobs = len(self.job_metrics)
-        completed_jobs = len([j for j in self.job_metrics.values() if j.status == "completed"])
-        failed_jobs = len([j for j in self.job_metrics.values() if j.status == "failed"])
-        running_jobs = len([j for j in self.job_metrics.values() if j.status == "running"])
+        completed_jobs = self._status_counts["completed"]
+        failed_jobs = self._status_counts["failed"]
+        running_jobs = self._status_counts["running"]
         
         # Performance metrics
         avg_processing_time = 0.0
         avg_panels_per_second = 0.0
         
-        completed_job_metrics = [j for j in self.job_metrics.values() if j.status == "completed"]
-        if completed_job_metrics:
-            avg_processing_time = sum(j.processing_time_seconds for j in completed_job_metrics) / len(completed_job_metrics)
+        if completed_jobs:
+            avg_processing_time = self._completed_processing_seconds / completed_jobs
         
-        if self.throughput_metrics['panels_per_second']:
-            avg_panels_per_second = sum(self.throughput_metrics['panels_per_second']) / len(self.throughput_metrics['panels_per_second'])
+        throughput_samples = len(self.throughput_metrics['panels_per_second'])
+        if throughput_samples:
+            avg_panels_per_second = self._panels_per_second_sum / throughput_samples
         
         # API response time metrics
         api_metrics = {}
-        for service, response_times in self.api_response_times.items():
-            if response_times:
+        for service, stats in self._api_stats.items():
+            if stats["count"]:
                 api_metrics[service] = {
-                    "avg_response_time_ms": sum(response_times) / len(response_times),
-                    "min_response_time_ms": min(response_times),
-                    "max_response_time_ms": max(response_times),
-                    "total_calls": len(response_times),
+                    "avg_response_time_ms": stats["sum"] / stats["count"],
+                    "min_response_time_ms": stats["min"],
+                    "max_response_time_ms": stats["max"],
+                    "total_calls": stats["count"],
                     "error_count": self.error_counts.get(service, 0)
                 }
         
@@ -311,13 +361,19 @@ class MetricsCollector:
             "performance": {
                 "avg_processing_time_seconds": avg_processing_time,
                 "avg_panels_per_second": avg_panels_per_second,
-                "total_panels_processed": sum(j.panels_processed for j in self.job_metrics.values())
+                "total_panels_processed": self._total_panels
             },
             "api_metrics": api_metrics,
             "system_metrics": current_system,
             "error_summary": dict(self.error_counts)
         }
 
+    def _set_job_status(self, metrics: JobMetrics, status: str) -> None:
+        """Change a job's status, keeping the status counters in step."""
+        self._status_counts[metrics.status] -= 1
+        metrics.status = status
+        self._status_counts[status] += 1
+
     def get_current_timestamp(self) -> str:
         """Get current timestamp for health checks."""
         return datetime.now().isoformat()
@@ -1,10 +1,21 @@
 """PDF extraction utilities for comic processing using PyMuPDF"""
 
+import atexit
+import hashlib
 import io
+import multiprocessing
+import os
+import queue
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Deque, Iterator, List, Optional, Tuple, Union
 
 from PIL import Image
 
@@ -20,7 +31,21 @@ try:
 except ImportError:
     HAS_PYTESSERACT = False
 
+try:
+    import tesserocr  # Tesseract bindings that take raw pixel buffers
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+try:
+    import diskcache  # Process-safe on-disk key/value store
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+from ..config import settings
 from .models import ComicMetadata, Panel
+from .validation import get_file_stat
 
 
 class PDFExtractionError(Exception):
@@ -28,48 +53,403 @@ class PDFExtractionError(Exception):
     pass
 
 
+def _pixmap_image(pix: "fitz.Pixmap") -> Image.Image:
+    """Wrap an RGB pixmap as a PIL image sharing its sample buffer (no copy)"""
+    return Image.frombuffer(
+        "RGB", (pix.width, pix.height), pix.samples_mv,
+        "raw", "RGB", pix.stride, 1
+    )
+
+
+def worker_process_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the start method for PDF worker process pools
+
+    Forking a server process copies whatever locks its logging, metrics
+    and OCR threads hold at that moment, which can deadlock the child.
+    Workers are therefore started from a clean forkserver process, or
+    spawned where forkserver is unavailable.
+
+    Returns:
+        Multiprocessing context to pass to ProcessPoolExecutor
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _as_str(file_path: Union[str, Path]) -> str:
+    """Return a file path as the string PyMuPDF opens, without a Path round trip"""
+    return file_path if isinstance(file_path, str) else str(file_path)
+
+
+def _ocr_text(img: Image.Image) -> Optional[str]:
+    """
+    Extract text from an image using OCR
+
+    Args:
+        img: PIL Image object
+
+    Returns:
+        Extracted text or None if OCR is not available or extraction fails
+    """
+    if not HAS_PYTESSERACT:
+        return None
+
+    try:
+        # Use pytesseract to extract text
+        text = pytesseract.image_to_string(img)
+        
+        # Return None if no text was extracted
+        if not text or not text.strip():
+            return None
+        
+        return text.strip()
+
+    except Exception:
+        return None
+
+
+# Idle Tesseract APIs kept for the life of the process. Loading the
+# language data is expensive, so APIs are reused across pages and PDFs
+# rather than per thread; an API is not thread-safe, so each OCR run takes
+# one out of the pool and puts it back afterwards.
+_tesserocr_apis: "queue.SimpleQueue[tesserocr.PyTessBaseAPI]" = queue.SimpleQueue()
+
+
+def _acquire_tesserocr_api() -> "tesserocr.PyTessBaseAPI":
+    """Take an idle Tesseract API from the pool, creating one if none is idle"""
+    try:
+        return _tesserocr_apis.get_nowait()
+    except queue.Empty:
+        return tesserocr.PyTessBaseAPI()
+
+
+@atexit.register
+def _end_tesserocr_apis() -> None:
+    """Release the idle Tesseract APIs and their language data at exit"""
+    while True:
+        try:
+            api = _tesserocr_apis.get_nowait()
+        except queue.Empty:
+            return
+        api.End()
+
+
+# On-disk OCR results keyed by page pixels, shared by worker processes and
+# kept across runs in settings.ocr_cache_dir; opened lazily so each process
+# gets its own handle
+_ocr_cache = None
+_ocr_cache_lock = threading.Lock()
+
+
+def _get_ocr_cache() -> "diskcache.Cache":
+    """Open the OCR cache for this process on first use"""
+    global _ocr_cache
+    with _ocr_cache_lock:
+        if _ocr_cache is None:
+            _ocr_cache = diskcache.Cache(settings.ocr_cache_dir)
+        return _ocr_cache
+
+
+@lru_cache(maxsize=1)
+def _ocr_engine_id() -> str:
+    """
+    Identify the OCR engine and Tesseract version that _run_ocr() uses
+
+    Part of every OCR cache key, so upgrading or switching engines does not
+    serve text recognised by the old one.
+
+    Raises:
+        Exception: Whatever the engine raises when asked for its version
+    """
+    if HAS_TESSEROCR:
+        return f"tesserocr:{tesserocr.tesseract_version()}"
+    return f"pytesseract:{pytesseract.get_tesseract_version()}"
+
+
+def _run_ocr(pix: "fitz.Pixmap") -> str:
+    """
+    Run Tesseract over a rendered page
+
+    tesserocr is given the raw samples, copied once into the bytes object
+    it requires, with no image encoding. pytesseract needs a PIL image,
+    built as a zero-copy view of the samples, which it re-encodes to a
+    temporary file for the tesseract CLI.
+
+    Args:
+        pix: Rendered RGB page pixmap
+
+    Returns:
+        Raw OCR output
+
+    Raises:
+        Exception: Whatever the OCR engine raises
+    """
+    if HAS_TESSEROCR:
+        api = _acquire_tesserocr_api()
+        try:
+            api.SetImageBytes(pix.samples, pix.width, pix.height, 3, pix.stride)
+            return api.GetUTF8Text()
+        finally:
+            _tesserocr_apis.put(api)
+    
+    return pytesseract.image_to_string(_pixmap_image(pix))
+
+
+def _ocr_pixmap(pix: "fitz.Pixmap", use_cache: bool = False) -> Optional[str]:
+    """
+    Extract text from a rendered page using OCR
+
+    With use_cache and diskcache installed, results are looked up by a
+    BLAKE2b digest of the page pixels and the OCR engine version first, so
+    repeated pages and re-runs over the same PDF skip Tesseract. Failed OCR
+    runs are not cached.
+
+    Args:
+        pix: Rendered RGB page pixmap
+        use_cache: Consult and fill the on-disk OCR cache
+
+    Returns:
+        Extracted text or None if OCR is not available or extraction fails
+    """
+    if not (HAS_TESSEROCR or HAS_PYTESSERACT):
+        return None
+    
+    key = None
+    if use_cache and HAS_DISKCACHE:
+        try:
+            digest = hashlib.blake2b(pix.samples_mv, digest_size=16)
+            digest.update(
+                f"{pix.width}x{pix.height}:{pix.stride}:{_ocr_engine_id()}".encode()
+            )
+            key = digest.hexdigest()
+            cached = _get_ocr_cache().get(key)
+        except Exception:
+            cached = key = None
+        if cached is not None:
+            # Pages without text are cached as ""
+            return cached or None
+    
+    try:
+        text = _run_ocr(pix)
+    except Exception:
+        return None
+    
+    text = text.strip() if text else ""
+    if key is not None:
+        try:
+            _get_ocr_cache().set(key, text)
+        except Exception:
+            pass
+    
+    return text or None
+
+
+def _render_page(
+    pdf_path: str,
+    page_num: int,
+    zoom: float,
+    image_quality: str,
+    png_compress_level: int,
+    min_width: int,
+    min_height: int,
+    use_ocr_cache: bool = False,
+) -> Optional[dict]:
+    """
+    Render and OCR one PDF page.
+
+    Module-level so it can run in a worker process; the document is opened
+    inside the call because PyMuPDF documents cannot be pickled.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: Zero-based page number
+        zoom: Zoom factor relative to 72 DPI
+        image_quality: 'high' (PNG) or 'standard' (JPEG)
+        png_compress_level: zlib level (0-9) for PNG encoding
+        min_width: Minimum rendered width for the page to be kept
+        min_height: Minimum rendered height for the page to be kept
+        use_ocr_cache: Consult and fill the on-disk OCR cache
+
+    Returns:
+        Dictionary of panel fields, or None if the page is too small
+    """
+    pdf_document = fitz.open(pdf_path)
+    try:
+        rendered = _render_document_page(
+            pdf_document, page_num, zoom, image_quality, png_compress_level,
+            min_width, min_height
+        )
+        if rendered is None:
+            return None
+        
+        fields, pix, pdf_text = rendered
+        fields["extracted_text"] = _page_text(pix, pdf_text, use_ocr_cache)
+        return fields
+    finally:
+        pdf_document.close()
+
+
+def _render_document_page(
+    pdf_document: "fitz.Document",
+    page_num: int,
+    zoom: float,
+    image_quality: str,
+    png_compress_level: int,
+    min_width: int,
+    min_height: int,
+) -> Optional[Tuple[dict, "fitz.Pixmap", str]]:
+    """
+    Render one page of an open PDF document, without OCR.
+
+    Args:
+        pdf_document: Open PyMuPDF document
+        page_num: Zero-based page number
+        zoom: Zoom factor relative to 72 DPI
+        image_quality: 'high' (PNG) or 'standard' (JPEG)
+        png_compress_level: zlib level (0-9) for PNG encoding
+        min_width: Minimum rendered width for the page to be kept
+        min_height: Minimum rendered height for the page to be kept
+
+    Returns:
+        Tuple of (panel fields except extracted_text, rendered pixmap,
+        text layer of the page), or None if the page is too small
+    """
+    page = pdf_document[page_num]
+    
+    # Render page to image with specified zoom/DPI
+    mat = fitz.Matrix(zoom, zoom)
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    
+    # Validate image dimensions
+    if pix.width < min_width or pix.height < min_height:
+        return None
+    
+    # Encode from the pixmap samples without copying them. PNG goes through
+    # Pillow, whose filtered encoder at a low zlib level is both faster and
+    # smaller than MuPDF's writer on page-sized images.
+    if image_quality == "high":
+        img_format = "PNG"
+        buffer = io.BytesIO()
+        _pixmap_image(pix).save(
+            buffer, format="PNG", compress_level=png_compress_level
+        )
+        image_data = buffer.getvalue()
+    else:
+        img_format = "JPEG"
+        image_data = pix.tobytes("jpeg", jpg_quality=95)
+    
+    fields = {
+        "sequence_number": page_num + 1,
+        "image_data": image_data,
+        "image_format": img_format.lower(),
+        "image_resolution": {"width": pix.width, "height": pix.height},
+    }
+    return fields, pix, page.get_text()
+
+
+def _page_text(
+    pix: "fitz.Pixmap", pdf_text: str, use_ocr_cache: bool = False
+) -> Optional[str]:
+    """
+    Combine OCR text of a rendered page with its PDF text layer.
+
+    Only reads the pixmap, so it can run on a thread while the next page
+    is rendered.
+
+    Args:
+        pix: Rendered page pixmap
+        pdf_text: Text extracted directly from the PDF page
+        use_ocr_cache: Consult and fill the on-disk OCR cache
+
+    Returns:
+        Combined text, or None if the page has no text
+    """
+    # Extract text via OCR if available
+    extracted_text = _ocr_pixmap(pix, use_ocr_cache)
+    
+    # Also try to get text directly from PDF
+    if pdf_text and pdf_text.strip():
+        if extracted_text:
+            extracted_text = f"{pdf_text}\n{extracted_text}"
+        else:
+            extracted_text = pdf_text.strip()
+    
+    return extracted_text
+
+
 class PDFExtractor:
     """Extracts panels from PDF files as high-quality images using PyMuPDF"""
 
     # File validation constants
     MAX_FILE_SIZE_MB = 100
+    MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
     SUPPORTED_FORMATS = {".pdf"}
     MIN_IMAGE_WIDTH = 100
     MIN_IMAGE_HEIGHT = 100
 
-    def __init__(self, image_quality: str = "high"):
+    # Threads running OCR while the next page renders
+    OCR_THREADS = 2
+
+    def __init__(
+        self,
+        image_quality: str = "high",
+        parallel: bool = True,
+        png_compress_level: int = 1,
+        use_ocr_cache: bool = True,
+    ):
         """
         Initialize PDF extractor
 
         Args:
             image_quality: 'high' or 'standard' for image quality
+            parallel: Render multi-page PDFs across worker processes
+            png_compress_level: zlib level (0-9) for 'high' quality PNG pages;
+                low levels trade a little size for much faster encoding
+            use_ocr_cache: Reuse OCR results of identical pages from the
+                on-disk cache (requires the diskcache extra)
         """
         if image_quality not in ("high", "standard"):
             raise ValueError("image_quality must be 'high' or 'standard'")
+        if not 0 <= png_compress_level <= 9:
+            raise ValueError("png_compress_level must be between 0 and 9")
         self.image_quality = image_quality
+        self.png_compress_level = png_compress_level
+        self.use_ocr_cache = use_ocr_cache
+        self.parallel = parallel
         # DPI for rendering: 300 for high quality, 150 for standard
         self.dpi = 300 if image_quality == "high" else 150
         # Zoom factor for PyMuPDF (72 DPI is default)
         self.zoom = self.dpi / 72.0
 
-    def validate_file(self, file_path: Path) -> Tuple[bool, Optional[str]]:
+    def validate_file(
+        self,
+        file_path: Union[str, Path],
+        file_stat: Optional[os.stat_result] = None,
+    ) -> Tuple[bool, Optional[str]]:
         """
         Validate PDF file format and size
 
         Args:
             file_path: Path to the PDF file
+            file_stat: Stat result from get_file_stat(), if the caller has one
 
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not file_path.exists():
+        # A single stat answers both the existence and the size checks
+        if file_stat is None:
+            file_stat = get_file_stat(file_path)
+        if file_stat is None:
             return False, "File does not exist"
+        st_size = file_stat.st_size
 
-        if file_path.suffix.lower() not in self.SUPPORTED_FORMATS:
+        if os.path.splitext(os.fspath(file_path))[1].lower() not in self.SUPPORTED_FORMATS:
             return False, f"Unsupported file format. Supported formats: {self.SUPPORTED_FORMATS}"
 
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
+        if st_size > self.MAX_FILE_SIZE_BYTES:
+            file_size_mb = st_size / (1024 * 1024)
             return (
                 False,
                 f"File size {file_size_mb:.1f}MB exceeds maximum {self.MAX_FILE_SIZE_MB}MB",
@@ -77,26 +457,38 @@ class PDFExtractor:
 
         return True, None
 
-    def extract_panels(self, file_path, title: Optional[str] = None) -> Tuple[List[Panel], ComicMetadata]:
+    @contextmanager
+    def _open(self, file_path: Union[str, Path]) -> Iterator["fitz.Document"]:
         """
-        Extract all panels from a PDF file as images using PyMuPDF
+        Open a PDF document for the duration of a with block
 
         Args:
-            file_path: Path to the PDF file (string or Path object)
-            title: Optional title for the comic (extracted from filename if not provided)
+            file_path: Path to the PDF file
 
-        Returns:
-            Tuple of (panels list, comic metadata)
+        Yields:
+            Open PyMuPDF document, closed when the block exits
+        """
+        pdf_document = fitz.open(_as_str(file_path))
+        try:
+            yield pdf_document
+        finally:
+            pdf_document.close()
+
+    def _check_extractable(
+        self, file_path: Path, file_stat: Optional[os.stat_result] = None
+    ) -> None:
+        """
+        Raise if a file cannot be extracted
+
+        Args:
+            file_path: Path to the PDF file
+            file_stat: Stat result from get_file_stat(), if the caller has one
 
         Raises:
-            PDFExtractionError: If extraction fails
+            PDFExtractionError: If the file is invalid or PyMuPDF is missing
         """
-        # Convert string path to Path object if needed
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-            
         # Validate file
-        is_valid, error_msg = self.validate_file(file_path)
+        is_valid, error_msg = self.validate_file(file_path, file_stat)
         if not is_valid:
             raise PDFExtractionError(error_msg)
 
@@ -106,80 +498,199 @@ class PDFExtractor:
                 "PyMuPDF (fitz) is not installed. Install it with: pip install PyMuPDF"
             )
 
+    def extract_panels(
+        self,
+        file_path,
+        title: Optional[str] = None,
+        file_stat: Optional[os.stat_result] = None,
+    ) -> Tuple[List[Panel], ComicMetadata]:
+        """
+        Extract all panels from a PDF file as images using PyMuPDF
+
+        Args:
+            file_path: Path to the PDF file (string or Path object)
+            title: Optional title for the comic (extracted from filename if not provided)
+            file_stat: Stat result from get_file_stat(), to skip a second stat
+
+        Returns:
+            Tuple of (panels list, comic metadata)
+
+        Raises:
+            PDFExtractionError: If extraction fails
+        """
+        # Convert string path to Path object if needed
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+        
+        self._check_extractable(file_path, file_stat)
+
         try:
-            panels = []
-            
-            # Open PDF with PyMuPDF
-            pdf_document = fitz.open(str(file_path))
-            
-            if pdf_document.page_count == 0:
-                pdf_document.close()
-                raise PDFExtractionError("PDF contains no pages")
-            
-            # Process each page
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                
-                # Render page to image with specified zoom/DPI
-                mat = fitz.Matrix(self.zoom, self.zoom)
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                
-                # Convert to PIL Image
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                
-                # Validate image dimensions
-                if img.width < self.MIN_IMAGE_WIDTH or img.height < self.MIN_IMAGE_HEIGHT:
-                    continue
-                
-                # Convert to bytes
-                img_bytes = io.BytesIO()
-                img_format = "PNG" if self.image_quality == "high" else "JPEG"
-                img.save(img_bytes, format=img_format, quality=95 if img_format == "JPEG" else None)
-                image_data = img_bytes.getvalue()
-                
-                # Extract text via OCR if available
-                extracted_text = self._extract_text_from_image(img)
-                
-                # Also try to get text directly from PDF
-                pdf_text = page.get_text()
-                if pdf_text and pdf_text.strip():
-                    if extracted_text:
-                        extracted_text = f"{pdf_text}\n{extracted_text}"
-                    else:
-                        extracted_text = pdf_text.strip()
-                
-                # Create panel
-                panel = Panel(
-                    id=str(uuid.uuid4()),
-                    sequence_number=page_num + 1,
-                    image_data=image_data,
-                    image_format=img_format.lower(),
-                    image_resolution={"width": img.width, "height": img.height},
-                    extracted_text=extracted_text,
-                )
-                panels.append(panel)
-            
-            pdf_document.close()
+            with self._open(file_path) as pdf_document:
+                return self._extract_panels(pdf_document, file_path, title)
+        except PDFExtractionError:
+            raise
+        except Exception as e:
+            raise PDFExtractionError(f"Failed to read PDF: {str(e)}")
 
-            if not panels:
-                raise PDFExtractionError("No valid panels could be extracted from PDF")
+    def process(
+        self, file_path, title: Optional[str] = None
+    ) -> Tuple[List[Panel], ComicMetadata, dict]:
+        """
+        Extract panels and PDF information with a single document open
 
-            # Create metadata
-            comic_title = title or file_path.stem
-            metadata = ComicMetadata(
-                title=comic_title,
-                total_panels=len(panels),
-                extracted_at=datetime.now(),
-                image_quality=self.image_quality,
-            )
+        Args:
+            file_path: Path to the PDF file (string or Path object)
+            title: Optional title for the comic (extracted from filename if not provided)
+
+        Returns:
+            Tuple of (panels list, comic metadata, PDF information)
 
-            return panels, metadata
+        Raises:
+            PDFExtractionError: If extraction fails
+        """
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+        
+        self._check_extractable(file_path)
 
+        try:
+            with self._open(file_path) as pdf_document:
+                info = self._get_pdf_info(pdf_document)
+                panels, metadata = self._extract_panels(pdf_document, file_path, title)
+                return panels, metadata, info
         except PDFExtractionError:
             raise
         except Exception as e:
             raise PDFExtractionError(f"Failed to read PDF: {str(e)}")
 
+    def _extract_panels(
+        self, pdf_document: "fitz.Document", file_path: Path, title: Optional[str]
+    ) -> Tuple[List[Panel], ComicMetadata]:
+        """
+        Extract all panels from an open PDF document
+
+        Args:
+            pdf_document: Open PyMuPDF document
+            file_path: Path the document was opened from
+            title: Optional title for the comic (extracted from filename if not provided)
+
+        Returns:
+            Tuple of (panels list, comic metadata)
+
+        Raises:
+            PDFExtractionError: If the PDF has no usable pages
+        """
+        page_count = pdf_document.page_count
+        
+        if page_count == 0:
+            raise PDFExtractionError("PDF contains no pages")
+        
+        # Pages render and OCR independently, so multi-page PDFs are
+        # spread across processes; results come back in page order.
+        # Workers reopen the file because documents cannot be pickled.
+        workers = min(os.cpu_count() or 1, page_count)
+        if self.parallel and workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=worker_process_context()
+            ) as executor:
+                rendered = [
+                    fields
+                    for fields in executor.map(
+                        _render_page,
+                        repeat(pdf_document.name),
+                        range(page_count),
+                        repeat(self.zoom),
+                        repeat(self.image_quality),
+                        repeat(self.png_compress_level),
+                        repeat(self.MIN_IMAGE_WIDTH),
+                        repeat(self.MIN_IMAGE_HEIGHT),
+                        repeat(self.use_ocr_cache),
+                    )
+                    if fields is not None
+                ]
+        else:
+            rendered = self._render_pages(pdf_document, page_count)
+        
+        # Create panels
+        panels = [Panel(id=str(uuid.uuid4()), **fields) for fields in rendered]
+
+        if not panels:
+            raise PDFExtractionError("No valid panels could be extracted from PDF")
+
+        # Create metadata
+        comic_title = title or file_path.stem
+        metadata = ComicMetadata(
+            title=comic_title,
+            total_panels=len(panels),
+            extracted_at=datetime.now(),
+            image_quality=self.image_quality,
+        )
+
+        return panels, metadata
+
+    def _render_pages(self, pdf_document: "fitz.Document", page_count: int) -> List[dict]:
+        """
+        Render pages on this thread, overlapping OCR of earlier pages
+
+        PyMuPDF releases the GIL while rendering, as does tesserocr while
+        recognising (pytesseract runs the tesseract CLI in a subprocess),
+        so rendering page n+1 proceeds while page n is OCRed.
+
+        Args:
+            pdf_document: Open PyMuPDF document
+            page_count: Number of pages in the document
+
+        Returns:
+            Panel fields of the pages large enough to keep, in page order
+        """
+        pages = (
+            _render_document_page(
+                pdf_document,
+                page_num,
+                self.zoom,
+                self.image_quality,
+                self.png_compress_level,
+                self.MIN_IMAGE_WIDTH,
+                self.MIN_IMAGE_HEIGHT,
+            )
+            for page_num in range(page_count)
+        )
+        rendered = []
+        
+        if not (HAS_TESSEROCR or HAS_PYTESSERACT):
+            for page in pages:
+                if page is not None:
+                    fields, pix, pdf_text = page
+                    fields["extracted_text"] = _page_text(
+                        pix, pdf_text, self.use_ocr_cache
+                    )
+                    rendered.append(fields)
+            return rendered
+        
+        pending: Deque[Tuple[dict, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=self.OCR_THREADS) as ocr_pool:
+            for page in pages:
+                if page is None:
+                    continue
+                
+                fields, pix, pdf_text = page
+                pending.append((
+                    fields,
+                    ocr_pool.submit(_page_text, pix, pdf_text, self.use_ocr_cache),
+                ))
+                
+                # Bound the pixmaps held in memory while OCR catches up
+                if len(pending) > self.OCR_THREADS * 2:
+                    fields, future = pending.popleft()
+                    fields["extracted_text"] = future.result()
+                    rendered.append(fields)
+            
+            for fields, future in pending:
+                fields["extracted_text"] = future.result()
+                rendered.append(fields)
+        
+        return rendered
+
     def _extract_text_from_image(self, img: Image.Image) -> Optional[str]:
         """
         Extract text from an image using OCR
@@ -190,21 +701,7 @@ class PDFExtractor:
         Returns:
             Extracted text or None if OCR is not available or extraction fails
         """
-        if not HAS_PYTESSERACT:
-            return None
-
-        try:
-            # Use pytesseract to extract text
-            text = pytesseract.image_to_string(img)
-            
-            # Return None if no text was extracted
-            if not text or not text.strip():
-                return None
-            
-            return text.strip()
-
-        except Exception:
-            return None
+        return _ocr_text(img)
 
     def extract_images_from_pdf(self, file_path) -> List[bytes]:
         """
@@ -217,34 +714,41 @@ class PDFExtractor:
             file_path: Path to the PDF file
 
         Returns:
-            List of image data as bytes
+            List of image data as bytes, one per distinct embedded image
         """
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-        
         if not HAS_PYMUPDF:
             return []
         
-        images = []
         try:
-            pdf_document = fitz.open(str(file_path))
-            
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                image_list = page.get_images()
-                
-                for img_index, img_info in enumerate(image_list):
-                    xref = img_info[0]
-                    base_image = pdf_document.extract_image(xref)
-                    
-                    if base_image:
-                        image_data = base_image["image"]
-                        images.append(image_data)
-            
-            pdf_document.close()
-            
+            with self._open(file_path) as pdf_document:
+                return self._extract_images(pdf_document)
         except Exception:
-            pass
+            return []
+
+    def _extract_images(self, pdf_document: "fitz.Document") -> List[bytes]:
+        """
+        Extract embedded images from an open PDF document
+
+        Args:
+            pdf_document: Open PyMuPDF document
+
+        Returns:
+            List of image data as bytes, one per distinct embedded image
+        """
+        # Pages often reuse the same image object, so each xref is
+        # extracted once, in order of first appearance
+        xrefs = dict.fromkeys(
+            img_info[0]
+            for page in pdf_document
+            for img_info in page.get_images()
+        )
+        
+        images = []
+        for xref in xrefs:
+            base_image = pdf_document.extract_image(xref)
+            
+            if base_image:
+                images.append(base_image["image"])
         
         return images
 
@@ -258,31 +762,37 @@ class PDFExtractor:
         Returns:
             Dictionary with PDF information
         """
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-        
         if not HAS_PYMUPDF:
             return {"error": "PyMuPDF not installed"}
         
         try:
-            pdf_document = fitz.open(str(file_path))
-            
-            info = {
-                "page_count": pdf_document.page_count,
-                "metadata": pdf_document.metadata,
-                "is_encrypted": pdf_document.is_encrypted,
-                "is_pdf": pdf_document.is_pdf,
-            }
-            
-            # Get page dimensions
-            if pdf_document.page_count > 0:
-                first_page = pdf_document[0]
-                rect = first_page.rect
-                info["page_width"] = rect.width
-                info["page_height"] = rect.height
-            
-            pdf_document.close()
-            return info
-            
+            with self._open(file_path) as pdf_document:
+                return self._get_pdf_info(pdf_document)
         except Exception as e:
             return {"error": str(e)}
+
+    def _get_pdf_info(self, pdf_document: "fitz.Document") -> dict:
+        """
+        Get metadata and information from an open PDF document
+
+        Args:
+            pdf_document: Open PyMuPDF document
+
+        Returns:
+            Dictionary with PDF information
+        """
+        info = {
+            "page_count": pdf_document.page_count,
+            "metadata": pdf_document.metadata,
+            "is_encrypted": pdf_document.is_encrypted,
+            "is_pdf": pdf_document.is_pdf,
+        }
+        
+        # Get page dimensions
+        if pdf_document.page_count > 0:
+            first_page = pdf_document[0]
+            rect = first_page.rect
+            info["page_width"] = rect.width
+            info["page_height"] = rect.height
+        
+        return info
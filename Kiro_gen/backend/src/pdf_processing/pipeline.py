@@ -1,11 +1,15 @@
 """PDF panel extraction pipeline for processing comic PDFs."""
 
+import copy
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional
 from pathlib import Path
 
-from .extractor import PDFExtractor
+from .extractor import PDFExtractor, worker_process_context
 from .models import Panel, ComicMetadata
+from .validation import get_file_stat
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +41,9 @@ class PDFExtractionPipeline:
         """
         pdf_file = Path(pdf_path)
         
-        # Validate file exists
-        if not pdf_file.exists():
+        # Validate file exists; the stat result is reused by the extractor
+        file_stat = get_file_stat(pdf_path)
+        if file_stat is None:
             raise IOError(f"PDF file not found: {pdf_path}")
         
         # Validate file format
@@ -46,7 +51,7 @@ class PDFExtractionPipeline:
             raise ValueError(f"Invalid file format. Expected .pdf, got {pdf_file.suffix}")
         
         # Validate file size
-        file_size = pdf_file.stat().st_size
+        file_size = file_stat.st_size
         if file_size > self.max_file_size_bytes:
             raise ValueError(
                 f"PDF file too large: {file_size / 1024 / 1024:.1f}MB "
@@ -54,18 +59,14 @@ class PDFExtractionPipeline:
             )
         
         try:
-            # Extract panels
-            panels = self.extractor.extract_panels(pdf_path)
+            # Extract panels and metadata
+            panels, metadata = self.extractor.extract_panels(pdf_path, file_stat=file_stat)
             
             # Handle empty PDF
             if not panels:
                 logger.warning(f"No panels extracted from {pdf_path}")
                 raise ValueError("PDF contains no extractable panels")
             
-            # Extract metadata
-            metadata = self.extractor.extract_metadata(pdf_path)
-            metadata.total_panels = len(panels)
-            
             logger.info(f"Successfully extracted {len(panels)} panels from {pdf_path}")
             return panels, metadata
             
@@ -83,13 +84,38 @@ class PDFExtractionPipeline:
             List of (panels, metadata) tuples
         """
         results = []
-        for pdf_path in pdf_paths:
-            try:
-                panels, metadata = self.process_pdf(pdf_path)
-                results.append((panels, metadata))
-            except Exception as e:
-                logger.error(f"Skipping PDF {pdf_path}: {e}")
-                continue
+        workers = min(os.cpu_count() or 1, len(pdf_paths))
+        if workers <= 1:
+            for pdf_path in pdf_paths:
+                try:
+                    panels, metadata = self.process_pdf(pdf_path)
+                    results.append((panels, metadata))
+                except Exception as e:
+                    logger.error(f"Skipping PDF {pdf_path}: {e}")
+                    continue
+            
+            return results
+        
+        # PDFs are independent, so they are processed in parallel. Each worker
+        # renders its PDF's pages serially to avoid nesting process pools.
+        worker_pipeline = copy.copy(self)
+        worker_pipeline.extractor = copy.copy(self.extractor)
+        worker_pipeline.extractor.parallel = False
+        
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=worker_process_context()
+        ) as executor:
+            futures = [
+                executor.submit(worker_pipeline.process_pdf, pdf_path)
+                for pdf_path in pdf_paths
+            ]
+            # Collected in submission order so results follow pdf_paths
+            for pdf_path, future in zip(pdf_paths, futures):
+                try:
+                    panels, metadata = future.result()
+                    results.append((panels, metadata))
+                except Exception as e:
+                    logger.error(f"Skipping PDF {pdf_path}: {e}")
         
         return results
 
@@ -1,7 +1,27 @@
 """File validation utilities for PDF uploads"""
 
+import os
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
+
+
+def get_file_stat(file_path: Union[str, Path]) -> Optional[os.stat_result]:
+    """
+    Stat a file once so existence and size checks can share the result
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Stat result, or None if the file does not exist or cannot be
+        stat'ed (permission denied, symlink loop, invalid path)
+    """
+    # Matches Path.exists(), which reports any OSError or unrepresentable
+    # path as a missing file rather than raising
+    try:
+        return os.stat(file_path)
+    except (OSError, ValueError):
+        return None
 
 
 class FileValidator:
@@ -14,7 +34,10 @@ class FileValidator:
 
     @classmethod
     def validate_file(
-        cls, file_path: Path, mime_type: Optional[str] = None
+        cls,
+        file_path: Path,
+        mime_type: Optional[str] = None,
+        file_stat: Optional[os.stat_result] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
         Validate a file for PDF processing
@@ -22,12 +45,15 @@ class FileValidator:
         Args:
             file_path: Path to the file
             mime_type: Optional MIME type of the file
+            file_stat: Stat result from get_file_stat(), if the caller has one
 
         Returns:
             Tuple of (is_valid, error_message)
         """
         # Check file exists
-        if not file_path.exists():
+        if file_stat is None:
+            file_stat = get_file_stat(file_path)
+        if file_stat is None:
             return False, "File does not exist"
 
         # Check file extension
@@ -37,7 +63,7 @@ class FileValidator:
             return False, f"Unsupported file format. Supported formats: {supported}"
 
         # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_stat.st_size / (1024 * 1024)
         if file_size_mb > cls.MAX_FILE_SIZE_MB:
             return (
                 False,
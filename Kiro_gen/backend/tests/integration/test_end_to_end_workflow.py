@@ -425,7 +425,7 @@ class TestEndToEndWorkflow:
             )
             
             # Simulate metrics tracking
-            await mock_metrics_collector.track_api_call(
+            mock_metrics_collector.track_api_call(
                 job_id="test_job_tracking",
                 service="bedrock",
                 response_time_ms=1500.0,
@@ -447,7 +447,7 @@ class TestEndToEndWorkflow:
             )
             
             # Simulate metrics tracking
-            await mock_metrics_collector.track_api_call(
+            mock_metrics_collector.track_api_call(
                 job_id="test_job_tracking",
                 service="polly",
                 response_time_ms=800.0,
@@ -477,5 +477,5 @@ class TestEndToEndWorkflow:
         assert job_cost.polly_cost.characters_processed == 100
         
         # Verify metrics tracking
-        metrics = await mock_metrics_collector.get_metrics()
+        metrics = mock_metrics_collector.get_metrics()
         assert metrics["job_summary"]["total_jobs"] >= 1
\ No newline at end of file
@@ -8,6 +8,7 @@ from hypothesis import given, strategies as st, settings
 import pytest
 
 from src.bedrock_analysis.character_tracker import CharacterTracker
+from src.bedrock_analysis.narrative_generator import NarrativeGenerator
 from src.bedrock_analysis.models import VoiceProfile
 
 
@@ -209,3 +210,39 @@ def test_character_description_update_on_significant_change(character_data, pane
     # Verify all appearances after update use new description
     appearances = tracker.get_character_appearances(character.id)
     assert len(appearances) > 0
+
+
+@settings(deadline=None)
+@given(
+    character_data=character_data_strategy(),
+    new_description=st.text(min_size=1, max_size=200)
+)
+def test_character_introduction_uses_updated_description(character_data, new_description):
+    """Property: For any character whose description is updated, a repeated introduction SHALL use the new description.
+    
+    This property tests that cached character introductions are rebuilt after tracker updates.
+    """
+    tracker = CharacterTracker()
+    generator = NarrativeGenerator()
+    
+    character = tracker.register_character(
+        name=character_data['name'],
+        visual_description=character_data['visual_description'],
+        personality=character_data['personality'],
+        voice_profile=character_data['voice_profile'],
+        panel_number=1
+    )
+    
+    first_intro = generator._generate_character_introduction(character)
+    assert generator._generate_character_introduction(character) == first_intro
+    
+    tracker.record_appearance(
+        character_id=character.id,
+        panel_number=2,
+        visual_description=new_description
+    )
+    
+    updated_intro = generator._generate_character_introduction(character)
+    assert updated_intro == (
+        f"{character.name} appears, {new_description.lower()}. {character.personality}."
+    )
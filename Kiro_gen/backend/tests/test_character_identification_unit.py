@@ -273,6 +273,11 @@ class TestCharacterTracking:
         retrieved = tracker.get_character_by_name('Batman')
         assert retrieved is not None
         assert retrieved.id == character.id
+        assert tracker.get_character_by_name('BATMAN').id == character.id
+        assert tracker.get_character_by_name('Robin') is None
+
+        tracker.reset()
+        assert tracker.get_character_by_name('Batman') is None
 
     def test_record_character_appearance(self):
         """Test recording character appearance in panels."""
@@ -304,6 +309,27 @@ class TestCharacterTracking:
         assert appearances[1].panel_number == 3
         assert appearances[2].panel_number == 5
 
+    def test_visual_description_lower_follows_updates(self):
+        """Test lowercased visual description tracks description changes."""
+        tracker = CharacterTracker()
+
+        character = tracker.register_character(
+            name='Superhero',
+            visual_description='Hero in Red Cape',
+            personality='heroic',
+            voice_profile=VoiceProfile(
+                voice_id='Joanna',
+                gender='female',
+                age='adult',
+                tone='heroic'
+            ),
+            panel_number=1
+        )
+        assert character.visual_description_lower == 'hero in red cape'
+
+        tracker.record_appearance(character.id, 2, visual_description='Hero in Blue Suit')
+        assert character.visual_description_lower == 'hero in blue suit'
+
     def test_character_appearance_count(self):
         """Test counting character appearances."""
         tracker = CharacterTracker()
@@ -534,6 +560,43 @@ class TestCharacterTracking:
         assert summary['appearance_count'] == 3
         assert summary['first_introduced'] == 1
         assert len(summary['visual_signatures']) == 2
+        assert summary['voice_profile']['voice_id'] == 'Joanna'
+
+    def test_get_character_summary_reflects_voice_update(self):
+        """Test summary voice profile follows updates to the character's voice."""
+        tracker = CharacterTracker()
+
+        character = tracker.register_character(
+            name='Hero',
+            visual_description='A heroic character',
+            personality='heroic',
+            voice_profile=VoiceProfile(
+                voice_id='Joanna',
+                gender='female',
+                age='adult',
+                tone='heroic'
+            ),
+            panel_number=1
+        )
+        assert tracker.get_character_summary(character.id)['voice_profile']['voice_id'] == 'Joanna'
+
+        tracker.update_character_voice(
+            character.id,
+            VoiceProfile(voice_id='Matthew', gender='male', age='adult', tone='mysterious')
+        )
+        assert tracker.get_character_summary(character.id)['voice_profile']['voice_id'] == 'Matthew'
+
+        # Direct assignment bypassing the tracker is also picked up
+        character.voice_profile = VoiceProfile(
+            voice_id='Brian', gender='male', age='senior', tone='serious'
+        )
+        summary = tracker.get_character_summary(character.id)
+        assert summary['voice_profile'] == {
+            'voice_id': 'Brian',
+            'gender': 'male',
+            'age': 'senior',
+            'tone': 'serious',
+        }
 
     def test_tracker_reset(self):
         """Test resetting tracker for new comic."""
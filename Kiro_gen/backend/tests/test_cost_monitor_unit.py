@@ -0,0 +1,156 @@
+"""Unit tests for cost monitor.
+
+The summary is served from running totals; these tests check them
+against sums recomputed from every job the monitor has tracked.
+"""
+
+import pytest
+
+from src.monitoring.cost_monitor import CostMonitor
+
+
+def expected_summary(jobs):
+    """Recompute summary figures from job costs.
+
+    Args:
+        jobs: Latest JobCost of every job ever tracked, evicted ones included
+
+    Returns:
+        Tuple of (summary section, service breakdown)
+    """
+    jobs = list(jobs)
+    summary = {
+        "total_jobs": len(jobs),
+        "completed_jobs": sum(job.status == "completed" for job in jobs),
+        "failed_jobs": sum(job.status == "failed" for job in jobs),
+        "total_cost_usd": pytest.approx(sum(job.total_estimated_cost for job in jobs)),
+    }
+    breakdown = {
+        "bedrock": {
+            "total_api_calls": sum(job.bedrock_cost.api_calls for job in jobs),
+            "total_input_tokens": sum(job.bedrock_cost.input_tokens for job in jobs),
+            "total_output_tokens": sum(job.bedrock_cost.output_tokens for job in jobs),
+            "total_cost_usd": pytest.approx(
+                sum(job.bedrock_cost.estimated_cost_usd for job in jobs)
+            ),
+        },
+        "polly": {
+            "total_api_calls": sum(job.polly_cost.api_calls for job in jobs),
+            "total_characters": sum(job.polly_cost.characters_processed for job in jobs),
+            "total_cost_usd": pytest.approx(
+                sum(job.polly_cost.estimated_cost_usd for job in jobs)
+            ),
+        },
+        "s3": {
+            "total_storage_gb_hours": pytest.approx(
+                sum(job.s3_cost.storage_gb_hours for job in jobs)
+            ),
+            "total_cost_usd": pytest.approx(
+                sum(job.s3_cost.estimated_cost_usd for job in jobs)
+            ),
+        },
+    }
+    return summary, breakdown
+
+
+class TestCostMonitor:
+    """Test suite for CostMonitor"""
+
+    @pytest.fixture
+    def monitor(self):
+        """Create a cost monitor"""
+        return CostMonitor()
+
+    @pytest.fixture
+    def seen(self):
+        """Latest JobCost per job ID, kept after eviction"""
+        return {}
+
+    async def _check(self, monitor, seen):
+        """Assert the summary matches the recomputed job sums."""
+        seen.update(monitor.job_costs)
+        summary, breakdown = expected_summary(seen.values())
+        result = await monitor.get_cost_summary()
+        for key, value in summary.items():
+            assert result["summary"][key] == value, key
+        assert result["service_breakdown"] == breakdown
+
+    async def _use(self, monitor, job_id, scale=1):
+        """Record some usage of every service for a job."""
+        await monitor.track_bedrock_usage(job_id, "us.amazon.nova-pro-v1:0", 1000 * scale, 200 * scale)
+        await monitor.track_bedrock_usage(job_id, "anthropic.claude-sonnet", 500 * scale, 50 * scale, 2)
+        await monitor.track_polly_usage(job_id, "neural", 300 * scale)
+        await monitor.track_s3_usage(job_id, "intelligent_tiering", 0.5 * scale, hours=2)
+
+    async def test_job_lifecycle_matches_recomputed_totals(self, monitor, seen):
+        """Test the summary through complete, fail, restart and re-finish"""
+        await monitor.start_job_tracking("job-1")
+        await self._use(monitor, "job-1")
+        await self._check(monitor, seen)
+
+        await monitor.complete_job_tracking("job-1", {})
+        await self._check(monitor, seen)
+
+        # Usage on a job never started explicitly starts it
+        await self._use(monitor, "job-2", scale=3)
+        await monitor.error_job_tracking("job-2", "boom")
+        await self._check(monitor, seen)
+
+        # Completed then failed counts once, as failed
+        await monitor.error_job_tracking("job-1", "late failure")
+        await self._check(monitor, seen)
+
+        # Usage after finishing is counted, and picked up by the next finish
+        await self._use(monitor, "job-1")
+        await monitor.complete_job_tracking("job-1", {})
+        await self._check(monitor, seen)
+
+        # Restarting a job discards its earlier usage and status
+        await monitor.start_job_tracking("job-2")
+        await self._check(monitor, seen)
+        await self._use(monitor, "job-2", scale=2)
+        await monitor.complete_job_tracking("job-2", {})
+        await self._check(monitor, seen)
+
+        # Restarting a running job
+        await self._use(monitor, "job-3")
+        await monitor.start_job_tracking("job-3")
+        await self._use(monitor, "job-3", scale=5)
+        await self._check(monitor, seen)
+
+        result = await monitor.get_cost_summary()
+        assert result["summary"]["total_jobs"] == 3
+        assert result["summary"]["completed_jobs"] == 2
+        assert result["summary"]["failed_jobs"] == 0
+
+    async def test_evicted_jobs_stay_in_totals(self, monitor, seen):
+        """Test jobs evicted past max_jobs still count in the summary"""
+        monitor.max_jobs = 3
+
+        await self._use(monitor, "running")
+        for index in range(6):
+            job_id = f"job-{index}"
+            await self._use(monitor, job_id, scale=index + 1)
+            if index % 2:
+                await monitor.error_job_tracking(job_id, "boom")
+            else:
+                await monitor.complete_job_tracking(job_id, {})
+            await self._check(monitor, seen)
+
+        assert len(monitor.job_costs) == 3
+        assert "running" in monitor.job_costs
+        assert list(monitor.job_costs) == ["running", "job-4", "job-5"]
+
+        result = await monitor.get_cost_summary()
+        assert result["summary"]["total_jobs"] == 7
+        assert result["summary"]["completed_jobs"] == 3
+        assert result["summary"]["failed_jobs"] == 3
+
+    async def test_unknown_job_is_ignored(self, monitor, seen):
+        """Test finishing an untracked job leaves the summary unchanged"""
+        await monitor.complete_job_tracking("missing", {})
+        await monitor.error_job_tracking("missing", "boom")
+        await self._check(monitor, seen)
+
+        result = await monitor.get_cost_summary()
+        assert result["summary"]["total_jobs"] == 0
@@ -0,0 +1,169 @@
+"""Unit tests for fallback handler."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from src.error_handling import fallback_handler as fallback_module
+from src.error_handling.fallback_handler import FallbackHandler, content_key
+
+PRIMARY, HAIKU, NOVA_PRO, NOVA_LITE = fallback_module._BEDROCK_FALLBACK_MODELS
+
+
+class FakeAnalyzer:
+    """Analyzer whose outcome for each model is scripted by the test"""
+
+    def __init__(self, model_id, outcomes, calls):
+        self.model_id = model_id
+        self.outcomes = outcomes
+        self.calls = calls
+
+    async def analyze_panel_with_fallback(self, panel_data, context):
+        self.calls.append(self.model_id)
+        outcome = self.outcomes[self.model_id]
+        try:
+            if callable(outcome):
+                return await outcome()
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        except asyncio.CancelledError:
+            self.calls.append(f"cancelled {self.model_id}")
+            raise
+
+
+class TestBedrockFallback:
+    """Test suite for FallbackHandler.handle_bedrock_fallback"""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a fallback handler with an empty cache"""
+        return FallbackHandler()
+
+    @pytest.fixture
+    def calls(self):
+        """Record of model calls and cancellations"""
+        return []
+
+    @pytest.fixture
+    def script(self, calls):
+        """Install fake analyzers driven by a model to outcome mapping"""
+        outcomes = {}
+        with patch.object(
+            fallback_module,
+            "_get_bedrock_analyzer",
+            lambda model_id: FakeAnalyzer(model_id, outcomes, calls),
+        ):
+            yield outcomes
+
+    async def _fallback(self, handler, panel_data=b"panel"):
+        """Run a Bedrock fallback for the primary model."""
+        return await handler.handle_bedrock_fallback(
+            PRIMARY, panel_data, {"panel_number": 3}, RuntimeError("throttled")
+        )
+
+    async def test_first_success_wins(self, handler, script):
+        """Test that a full analysis is returned and counted"""
+        script.update({
+            HAIKU: RuntimeError("down"),
+            NOVA_PRO: {"model": NOVA_PRO},
+            NOVA_LITE: {"model": NOVA_LITE},
+        })
+
+        assert await self._fallback(handler) == {"model": NOVA_PRO}
+        assert handler.get_fallback_stats()["bedrock_fallbacks"] == 1
+
+    async def test_tie_goes_to_preferred_model(self, handler, script, monkeypatch):
+        """Test that models finishing in the same tick are taken in order"""
+        script.update({
+            HAIKU: {"model": HAIKU},
+            NOVA_PRO: {"model": NOVA_PRO},
+            NOVA_LITE: {"model": NOVA_LITE},
+        })
+        real_wait = asyncio.wait
+
+        class NewestFirst(set):
+            """Finished tasks iterating newest first, unlike wave order"""
+
+            def __iter__(self):
+                return iter(sorted(
+                    set.__iter__(self),
+                    key=lambda task: int(task.get_name().rsplit("-", 1)[-1]),
+                    reverse=True,
+                ))
+
+        async def wait(fs, **kwargs):
+            done, pending = await real_wait(fs, **kwargs)
+            return NewestFirst(done), pending
+
+        monkeypatch.setattr(fallback_module.asyncio, "wait", wait)
+
+        assert await self._fallback(handler) == {"model": HAIKU}
+
+    async def test_success_cancels_rest_of_wave(self, handler, script, calls):
+        """Test that a slower model in the wave is cancelled once one wins"""
+        async def slow():
+            await asyncio.sleep(10)
+
+        script.update({HAIKU: slow, NOVA_PRO: {"model": NOVA_PRO}})
+
+        assert await self._fallback(handler) == {"model": NOVA_PRO}
+        await asyncio.sleep(0)
+        assert f"cancelled {HAIKU}" in calls
+        assert NOVA_LITE not in calls
+
+    async def test_degraded_result_when_nothing_better(self, handler, script):
+        """Test that the preferred minimal analysis is used as a last model result"""
+        script.update({
+            HAIKU: {"model": HAIKU, "fallback_used": True},
+            NOVA_PRO: {"model": NOVA_PRO, "fallback_used": True},
+            NOVA_LITE: RuntimeError("down"),
+        })
+
+        assert await self._fallback(handler) == {"model": HAIKU, "fallback_used": True}
+        assert handler.get_fallback_stats()["bedrock_fallbacks"] == 1
+
+    async def test_cached_response_preferred_over_degraded(self, handler, script):
+        """Test that a cached analysis beats a minimal one"""
+        script.update({
+            HAIKU: RuntimeError("down"),
+            NOVA_PRO: {"fallback_used": True},
+            NOVA_LITE: RuntimeError("down"),
+        })
+        handler.cache_response("bedrock", content_key(b"panel"), {"cached": True})
+
+        assert await self._fallback(handler) == {"cached": True}
+        assert handler.get_fallback_stats()["bedrock_fallbacks"] == 0
+
+    async def test_simplified_analysis_when_all_fail(self, handler, script):
+        """Test that a simplified analysis is built when every model fails"""
+        script.update({model: RuntimeError("down") for model in (HAIKU, NOVA_PRO, NOVA_LITE)})
+
+        first = await self._fallback(handler)
+        second = await self._fallback(handler)
+
+        assert first["panel_id"] == "panel_3"
+        assert first["fallback_used"] is True
+        assert first == second
+        assert first["actions"] is not second["actions"]
+
+    async def test_cancellation_cancels_models_in_flight(self, handler, script, calls):
+        """Test that cancelling the caller cancels the wave in flight"""
+        async def slow():
+            await asyncio.sleep(10)
+            return {"model": "late"}
+
+        script.update({HAIKU: slow, NOVA_PRO: slow, NOVA_LITE: slow})
+
+        caller = asyncio.create_task(self._fallback(handler))
+        await asyncio.sleep(0.05)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert sorted(calls) == sorted([
+            HAIKU, NOVA_PRO, f"cancelled {HAIKU}", f"cancelled {NOVA_PRO}"
+        ])
+        assert handler.get_fallback_stats()["total_fallbacks"] == 0
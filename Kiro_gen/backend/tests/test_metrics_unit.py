@@ -0,0 +1,143 @@
+"""Unit tests for metrics collector.
+
+get_metrics() is served from running aggregates; these tests check them
+against values recomputed from the tracked jobs and call histories.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from src.monitoring.metrics import MetricsCollector
+
+
+def expected_metrics(collector):
+    """Recompute job summary, performance and API figures by scanning.
+
+    Args:
+        collector: Metrics collector to scan
+
+    Returns:
+        Tuple of (job summary, performance, API metrics)
+    """
+    jobs = list(collector.job_metrics.values())
+    completed = [job for job in jobs if job.status == "completed"]
+    throughput = collector.throughput_metrics["panels_per_second"]
+
+    job_summary = {
+        "total_jobs": len(jobs),
+        "completed_jobs": len(completed),
+        "failed_jobs": sum(job.status == "failed" for job in jobs),
+        "running_jobs": sum(job.status == "running" for job in jobs),
+        "success_rate": pytest.approx(len(completed) / len(jobs) if jobs else 0),
+    }
+    performance = {
+        "avg_processing_time_seconds": pytest.approx(
+            sum(job.processing_time_seconds for job in completed) / len(completed)
+            if completed else 0.0
+        ),
+        "avg_panels_per_second": pytest.approx(
+            sum(throughput) / len(throughput) if throughput else 0.0
+        ),
+        "total_panels_processed": sum(job.panels_processed for job in jobs),
+    }
+    api_metrics = {
+        service: {
+            "avg_response_time_ms": pytest.approx(sum(times) / len(times)),
+            "min_response_time_ms": min(times),
+            "max_response_time_ms": max(times),
+            "total_calls": len(times),
+            "error_count": collector.error_counts.get(service, 0),
+        }
+        for service, times in collector.api_response_times.items()
+        if times
+    }
+    return job_summary, performance, api_metrics
+
+
+class TestMetricsCollector:
+    """Test suite for MetricsCollector"""
+
+    @pytest.fixture
+    def collector(self):
+        """Create a metrics collector without its monitor thread running"""
+        collector = MetricsCollector()
+        collector.stop_system_monitoring()
+        return collector
+
+    def _check(self, collector):
+        """Assert get_metrics() matches the recomputed values."""
+        job_summary, performance, api_metrics = expected_metrics(collector)
+        metrics = collector.get_metrics()
+        assert metrics["job_summary"] == job_summary
+        assert metrics["performance"] == performance
+        assert metrics["api_metrics"] == api_metrics
+
+    def _run(self, collector, job_id, panels, seconds):
+        """Record progress and calls for a job that has run for some seconds."""
+        collector.update_job_progress(job_id, panels // 2, panels)
+        collector.update_job_progress(job_id, panels, panels)
+        collector.track_api_call(job_id, "bedrock", 100.0 + panels)
+        collector.track_api_call(job_id, "polly", 40.0 * panels, success=False, error="throttled")
+        collector.track_retry(job_id, "polly", 1)
+        collector.job_metrics[job_id].started_at -= timedelta(seconds=seconds)
+
+    def test_transitions_match_recomputed_values(self, collector):
+        """Test aggregates through restart and complete-then-fail transitions"""
+        collector.start_job_tracking("job-1")
+        self._run(collector, "job-1", panels=10, seconds=5)
+        self._check(collector)
+
+        collector.complete_job_tracking("job-1", {"audio_duration": 12.5})
+        self._check(collector)
+
+        # Progress on an untracked job starts it
+        self._run(collector, "job-2", panels=4, seconds=2)
+        collector.error_job_tracking("job-2", "boom")
+        self._check(collector)
+
+        # Completed then failed leaves the completed aggregates
+        collector.error_job_tracking("job-1", "late failure")
+        self._check(collector)
+
+        # Failed then completed
+        collector.complete_job_tracking("job-2", {})
+        self._check(collector)
+
+        # Completed twice counts the latest processing time only
+        collector.job_metrics["job-2"].started_at -= timedelta(seconds=3)
+        collector.complete_job_tracking("job-2", {})
+        self._check(collector)
+
+        # Restarting completed, failed and running jobs drops the old runs
+        collector.start_job_tracking("job-2")
+        self._check(collector)
+        collector.start_job_tracking("job-1")
+        self._check(collector)
+        self._run(collector, "job-3", panels=6, seconds=1)
+        collector.start_job_tracking("job-3")
+        self._check(collector)
+
+        self._run(collector, "job-1", panels=8, seconds=4)
+        collector.complete_job_tracking("job-1", {})
+        self._check(collector)
+
+        summary = collector.get_metrics()["job_summary"]
+        assert summary["completed_jobs"] == 1
+        assert summary["failed_jobs"] == 0
+        assert summary["running_jobs"] == 2
+        assert collector.get_metrics()["performance"]["total_panels_processed"] == 8
+
+    def test_progress_can_go_backwards(self, collector):
+        """Test panel totals follow the latest progress report"""
+        collector.update_job_progress("job-1", 5, 10)
+        collector.update_job_progress("job-1", 3, 10)
+        self._check(collector)
+        assert collector.get_metrics()["performance"]["total_panels_processed"] == 3
+
+    def test_unknown_job_is_ignored(self, collector):
+        """Test finishing an untracked job leaves the metrics unchanged"""
+        collector.complete_job_tracking("missing", {})
+        collector.error_job_tracking("missing", "boom")
+        self._check(collector)
+        assert collector.get_metrics()["job_summary"]["total_jobs"] == 0
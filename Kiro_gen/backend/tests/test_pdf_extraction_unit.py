@@ -1,12 +1,15 @@
 """Unit tests for PDF extraction pipeline."""
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
 from src.pdf_processing.pipeline import PDFExtractionPipeline
 from src.pdf_processing.models import Panel, ComicMetadata
+from src.pdf_processing.validation import FileValidator, get_file_stat
 
 
 @pytest.fixture
@@ -78,6 +81,78 @@ def test_process_pdf_file_too_large(pipeline):
             pipeline.process_pdf(f.name)
 
 
+def test_process_pdf_batch_parallel_keeps_order(pipeline, tmp_path):
+    """Test parallel batch results follow pdf_paths and skip bad files."""
+    fitz = pytest.importorskip("fitz")
+    pdf_paths = []
+    for name, page_count in (("first", 1), ("second", 2), ("third", 3)):
+        doc = fitz.open()
+        for page_num in range(page_count):
+            doc.new_page().insert_text((72, 72), f"{name} page {page_num}")
+        doc.save(str(tmp_path / f"{name}.pdf"))
+        doc.close()
+        pdf_paths.append(str(tmp_path / f"{name}.pdf"))
+    pdf_paths.insert(1, str(tmp_path / "missing.pdf"))
+    
+    with patch("src.pdf_processing.pipeline.os.cpu_count", return_value=4):
+        results = pipeline.process_pdf_batch(pdf_paths)
+    
+    assert [metadata.title for _, metadata in results] == ["first", "second", "third"]
+    assert [len(panels) for panels, _ in results] == [1, 2, 3]
+
+
+def test_get_file_stat_existing(sample_pdf_path):
+    """Test stat of an existing file."""
+    file_stat = get_file_stat(sample_pdf_path)
+    
+    assert file_stat is not None
+    assert file_stat.st_size == Path(sample_pdf_path).stat().st_size
+
+
+def test_get_file_stat_unstatable(tmp_path):
+    """Test missing and unstat-able paths give None rather than raising."""
+    loop = tmp_path / "loop.pdf"
+    loop.symlink_to(loop)
+    
+    assert get_file_stat(tmp_path / "missing.pdf") is None
+    assert get_file_stat(tmp_path / "missing" / "nested.pdf") is None
+    assert get_file_stat(loop) is None
+    assert get_file_stat("comic\0.pdf") is None
+
+
+def test_file_validator_uses_given_stat(sample_pdf_path):
+    """Test FileValidator does not stat again when given a stat result."""
+    file_stat = os.stat(sample_pdf_path)
+    
+    with patch("src.pdf_processing.validation.get_file_stat") as stat:
+        assert FileValidator.validate_file(
+            Path(sample_pdf_path), file_stat=file_stat
+        ) == (True, None)
+    
+    stat.assert_not_called()
+
+
+def test_process_pdf_stats_once(pipeline, tmp_path):
+    """Test the pipeline's stat result is passed through to the extractor."""
+    fitz = pytest.importorskip("fitz")
+    pdf_path = str(tmp_path / "comic.pdf")
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Hello")
+    doc.save(pdf_path)
+    doc.close()
+    
+    with patch(
+        "src.pdf_processing.pipeline.get_file_stat", wraps=get_file_stat
+    ) as pipeline_stat, patch(
+        "src.pdf_processing.extractor.get_file_stat"
+    ) as extractor_stat:
+        panels, _ = pipeline.process_pdf(pdf_path)
+    
+    assert len(panels) == 1
+    pipeline_stat.assert_called_once_with(pdf_path)
+    extractor_stat.assert_not_called()
+
+
 def test_validate_panel_sequence_empty(pipeline):
     """Test validation with empty panel list."""
     assert pipeline.validate_panel_sequence([]) is False
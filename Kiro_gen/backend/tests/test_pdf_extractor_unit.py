@@ -0,0 +1,204 @@
+"""Unit tests for PDF extractor."""
+
+import queue
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import patch
+
+fitz = pytest.importorskip("fitz")
+
+from src.pdf_processing import extractor
+from src.pdf_processing.extractor import PDFExtractor
+
+
+@pytest.fixture
+def multi_page_pdf(tmp_path):
+    """Create a PDF whose pages differ in text and drawing."""
+    pdf_path = tmp_path / "comic.pdf"
+    doc = fitz.open()
+    for page_num in range(4):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_num} caption")
+        page.draw_rect(
+            fitz.Rect(100, 100 + 40 * page_num, 300, 300),
+            color=(1, 0, 0),
+            fill=(0, 0, 1),
+        )
+    doc.save(str(pdf_path))
+    doc.close()
+    return pdf_path
+
+
+class TestPDFExtractor:
+    """Test suite for PDFExtractor"""
+
+    def test_parallel_matches_serial(self, multi_page_pdf):
+        """Test that pages rendered across processes keep serial order and text"""
+        serial, _ = PDFExtractor(
+            image_quality="standard", parallel=False, use_ocr_cache=False
+        ).extract_panels(multi_page_pdf)
+
+        with patch("src.pdf_processing.extractor.os.cpu_count", return_value=4):
+            parallel, _ = PDFExtractor(
+                image_quality="standard", parallel=True, use_ocr_cache=False
+            ).extract_panels(multi_page_pdf)
+
+        assert len(parallel) == len(serial) == 4
+        for expected, panel in zip(serial, parallel):
+            assert panel.sequence_number == expected.sequence_number
+            assert panel.extracted_text == expected.extracted_text
+            assert panel.image_data == expected.image_data
+        assert [p.sequence_number for p in parallel] == [1, 2, 3, 4]
+        assert "Page 2 caption" in parallel[2].extracted_text
+
+    def test_workers_are_not_forked(self):
+        """Test that worker pools never fork the threaded server process"""
+        assert extractor.worker_process_context().get_start_method() in (
+            "forkserver", "spawn"
+        )
+
+
+class TestTesserocrPool:
+    """Test suite for the pooled Tesseract APIs"""
+
+    @pytest.fixture
+    def fake_tesserocr(self, monkeypatch):
+        """Stub tesserocr with an API class that counts instances"""
+        class FakeAPI:
+            created = 0
+
+            def __init__(self):
+                FakeAPI.created += 1
+                self.ended = False
+
+            def SetImageBytes(self, data, width, height, bpp, stride):
+                self.size = (width, height)
+
+            def GetUTF8Text(self):
+                return "BOOM"
+
+            def End(self):
+                self.ended = True
+
+        monkeypatch.setattr(extractor, "HAS_TESSEROCR", True)
+        monkeypatch.setattr(
+            extractor, "tesserocr", SimpleNamespace(PyTessBaseAPI=FakeAPI), raising=False
+        )
+        monkeypatch.setattr(extractor, "_tesserocr_apis", queue.SimpleQueue())
+        return FakeAPI
+
+    @pytest.fixture
+    def pix(self):
+        """Create a small RGB pixmap"""
+        return fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+
+    def test_api_is_reused_across_calls(self, fake_tesserocr, pix):
+        """Test that one API serves successive OCR runs"""
+        assert extractor._run_ocr(pix) == "BOOM"
+        assert extractor._run_ocr(pix) == "BOOM"
+        assert fake_tesserocr.created == 1
+
+    def test_concurrent_runs_use_separate_apis(self, fake_tesserocr):
+        """Test that an API in use is not handed to another caller"""
+        first = extractor._acquire_tesserocr_api()
+        second = extractor._acquire_tesserocr_api()
+        assert first is not second
+        assert fake_tesserocr.created == 2
+
+    def test_idle_apis_are_ended(self, fake_tesserocr, pix):
+        """Test that pooled APIs are released at exit"""
+        extractor._run_ocr(pix)
+        api = extractor._acquire_tesserocr_api()
+        extractor._tesserocr_apis.put(api)
+
+        extractor._end_tesserocr_apis()
+
+        assert api.ended
+        assert extractor._tesserocr_apis.empty()
+
+
+class TestValidateFile:
+    """Test suite for PDFExtractor.validate_file"""
+
+    @pytest.fixture
+    def pdf_extractor(self):
+        """Create a PDF extractor"""
+        return PDFExtractor(parallel=False)
+
+    def test_missing_file(self, pdf_extractor, tmp_path):
+        """Test that a missing file is reported as not existing"""
+        assert pdf_extractor.validate_file(tmp_path / "missing.pdf") == (
+            False, "File does not exist"
+        )
+
+    def test_symlink_loop(self, pdf_extractor, tmp_path):
+        """Test that a path that cannot be stat'ed is reported, not raised"""
+        loop = tmp_path / "loop.pdf"
+        loop.symlink_to(loop)
+        assert pdf_extractor.validate_file(loop) == (False, "File does not exist")
+
+    def test_embedded_null_byte(self, pdf_extractor):
+        """Test that an unrepresentable path is reported, not raised"""
+        assert pdf_extractor.validate_file("comic\0.pdf") == (
+            False, "File does not exist"
+        )
+
+    def test_valid_pdf(self, pdf_extractor, multi_page_pdf):
+        """Test that an existing PDF within the size limit is valid"""
+        assert pdf_extractor.validate_file(str(multi_page_pdf)) == (True, None)
+
+
+class TestOCRCache:
+    """Test suite for the on-disk OCR cache, with diskcache stubbed"""
+
+    class FakeCache:
+        """In-memory stand-in for diskcache.Cache"""
+
+        def __init__(self):
+            self.entries = {}
+
+        def get(self, key):
+            return self.entries.get(key)
+
+        def set(self, key, value):
+            self.entries[key] = value
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Install an empty stub cache and a fixed engine version"""
+        cache = self.FakeCache()
+        monkeypatch.setattr(extractor, "HAS_DISKCACHE", True)
+        monkeypatch.setattr(extractor, "_ocr_cache", cache)
+        monkeypatch.setattr(extractor, "_ocr_engine_id", lambda: "tesserocr:5.3.0")
+        return cache
+
+    @pytest.fixture
+    def pix(self):
+        """Create a small RGB pixmap"""
+        return fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+
+    def test_hit_skips_ocr(self, cache, pix):
+        """Test that a cached page is not OCRed again"""
+        with patch.object(extractor, "_run_ocr", return_value=" BOOM \n") as run_ocr:
+            assert extractor._ocr_pixmap(pix, use_cache=True) == "BOOM"
+            assert extractor._ocr_pixmap(pix, use_cache=True) == "BOOM"
+        assert run_ocr.call_count == 1
+        assert list(cache.entries.values()) == ["BOOM"]
+
+    def test_failed_ocr_is_not_stored(self, cache, pix):
+        """Test that an OCR failure is retried rather than cached"""
+        with patch.object(extractor, "_run_ocr", side_effect=RuntimeError) as run_ocr:
+            assert extractor._ocr_pixmap(pix, use_cache=True) is None
+            assert extractor._ocr_pixmap(pix, use_cache=True) is None
+        assert run_ocr.call_count == 2
+        assert cache.entries == {}
+
+    def test_engine_version_is_part_of_key(self, cache, pix, monkeypatch):
+        """Test that a different engine version does not reuse cached text"""
+        with patch.object(extractor, "_run_ocr", return_value="BOOM") as run_ocr:
+            extractor._ocr_pixmap(pix, use_cache=True)
+            monkeypatch.setattr(extractor, "_ocr_engine_id", lambda: "tesserocr:5.4.0")
+            extractor._ocr_pixmap(pix, use_cache=True)
+        assert run_ocr.call_count == 2
+        assert len(cache.entries) == 2
@@ -0,0 +1,104 @@
+"""Unit tests for the Bedrock response cache."""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.bedrock_analysis import analyzer as analyzer_module
+from src.bedrock_analysis.analyzer import BedrockPanelAnalyzer
+from src.bedrock_analysis.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache"""
+
+    def test_get_returns_cached_value(self):
+        """Test that a cached value is returned and counted as a hit"""
+        cache = ResponseCache(max_size=2, ttl_seconds=60)
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entry_expires_after_ttl(self):
+        """Test that an entry older than the TTL is dropped"""
+        cache = ResponseCache(max_size=2, ttl_seconds=10)
+        with patch("src.bedrock_analysis.response_cache.time.monotonic", return_value=100.0):
+            cache.set("a", "value")
+        with patch("src.bedrock_analysis.response_cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == "value"
+        with patch("src.bedrock_analysis.response_cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the least recently used entry is evicted when full"""
+        cache = ResponseCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_make_key_separates_parts(self):
+        """Test that part boundaries are part of the key"""
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+        assert ResponseCache.make_key(b"img", "p") == ResponseCache.make_key(b"img", "p")
+
+
+class TestAnalyzerResponseCache:
+    """Test suite for response caching in BedrockPanelAnalyzer"""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        """Replace the shared response cache with an empty one"""
+        cache = ResponseCache(max_size=8, ttl_seconds=60)
+        monkeypatch.setattr(analyzer_module, "_response_cache", cache)
+        return cache
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Bedrock client"""
+        return Mock()
+
+    @pytest.fixture
+    def analyzer(self, client):
+        """Create an analyzer with a mocked client"""
+        with patch("src.bedrock_analysis.analyzer.aws_clients") as mock_aws:
+            mock_aws.bedrock = client
+            return BedrockPanelAnalyzer()
+
+    @staticmethod
+    def _reply(text):
+        """Build a Converse response carrying text."""
+        return {"output": {"message": {"content": [{"text": text}]}}}
+
+    def test_cache_hit_skips_invoke(self, analyzer, client, cache):
+        """Test that an identical request is served without calling Bedrock"""
+        client.converse.return_value = self._reply(json.dumps({"mood": "tense"}))
+
+        first = analyzer._call_bedrock_vision(b"image", "prompt")
+        second = analyzer._call_bedrock_vision(b"image", "prompt")
+
+        assert first == second == {"mood": "tense"}
+        assert first is not second
+        assert client.converse.call_count == 1
+        assert cache.hits == 1
+
+    def test_unparseable_response_is_not_cached(self, analyzer, client, cache):
+        """Test that a malformed reply falls back and is asked for again"""
+        client.converse.side_effect = [
+            self._reply("not json"),
+            self._reply(json.dumps({"mood": "calm"})),
+        ]
+
+        first = analyzer._call_bedrock_vision(b"image", "prompt")
+        second = analyzer._call_bedrock_vision(b"image", "prompt")
+
+        assert first == analyzer._create_fallback_analysis()
+        assert second == {"mood": "calm"}
+        assert client.converse.call_count == 2
@@ -0,0 +1,90 @@
+"""Unit tests for retry handler."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.error_handling.retry_handler import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryConfig,
+    RetryHandler,
+)
+
+
+class TestCircuitBreakerProbe:
+    """Test suite for the half-open probe of CircuitBreaker"""
+
+    @pytest.fixture
+    def breaker(self):
+        """Create a breaker that opens after one failure and cools down at once."""
+        return CircuitBreaker("test", failure_threshold=1, cool_down_base=0.01)
+
+    @pytest.fixture
+    def handler(self, breaker):
+        """Create a handler using the breaker without retrying."""
+        return RetryHandler(RetryConfig(
+            max_attempts=1,
+            base_delay=0,
+            circuit_breaker=breaker,
+        ))
+
+    async def _open(self, handler, breaker):
+        """Trip the breaker and wait out its cool-down."""
+        async def fail():
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await handler.execute_with_retry(fail)
+        assert breaker.state == CircuitState.OPEN
+        await asyncio.sleep(0.02)
+
+    async def test_cancelled_probe_is_released(self, handler, breaker):
+        """Test that cancelling a probe lets the next call probe"""
+        await self._open(handler, breaker)
+
+        probe = asyncio.create_task(handler.execute_with_retry(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        assert breaker.state == CircuitState.HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        async def succeed():
+            return "ok"
+
+        assert await handler.execute_with_retry(succeed) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    async def test_probe_in_flight_rejects_other_calls(self, handler, breaker):
+        """Test that only one probe runs while the breaker is half-open"""
+        await self._open(handler, breaker)
+
+        probe = asyncio.create_task(handler.execute_with_retry(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(CircuitOpenError):
+                await handler.execute_with_retry(asyncio.sleep, 0)
+        finally:
+            probe.cancel()
+
+    def test_interrupted_sync_probe_is_released(self, handler, breaker):
+        """Test that a sync probe interrupted by a BaseException is released"""
+        def fail():
+            raise ConnectionError("down")
+
+        def interrupt():
+            raise KeyboardInterrupt
+
+        with pytest.raises(ConnectionError):
+            handler.execute_with_retry_sync(fail)
+        time.sleep(0.02)
+
+        with pytest.raises(KeyboardInterrupt):
+            handler.execute_with_retry_sync(interrupt)
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        assert handler.execute_with_retry_sync(lambda: "ok") == "ok"
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,169 @@
+"""Unit tests for scene tracking.
+
+Queries served from the tracker's indexes are compared against a
+brute-force scan of every registered scene and scene change.
+"""
+
+import pytest
+from src.bedrock_analysis.scene_tracker import SceneTracker
+
+
+# (location, first panel, last panel), deliberately out of panel order
+# with ties on the first panel
+SCENES = [
+    ("Rooftop", 7, 9),
+    ("Alley", 2, 4),
+    ("rooftop", 7, 7),
+    ("Lab", 1, 12),
+    ("Street", 4, 4),
+    ("Harbor", 2, 10),
+    ("Diner", 15, 16),
+]
+
+
+def introduced_by(tracker, panel_number):
+    """Scenes introduced by a panel, by first panel then registration order."""
+    return sorted(
+        (s for s in tracker.scenes.values() if s.first_introduced <= panel_number),
+        key=lambda s: s.first_introduced,
+    )
+
+
+def changes_between(tracker, start_panel, end_panel):
+    """Scene changes in a panel range, by panel then recording order."""
+    return sorted(
+        (c for c in tracker.scene_changes if start_panel <= c.panel_number <= end_panel),
+        key=lambda c: c.panel_number,
+    )
+
+
+class TestSceneTracker:
+    """Tests for SceneTracker class."""
+
+    @pytest.fixture
+    def tracker(self):
+        """Create a tracker with scenes registered out of panel order."""
+        tracker = SceneTracker()
+        for location, first_panel, last_panel in SCENES:
+            scene = tracker.register_scene(location, f"{location} view", first_panel)
+            scene.last_seen = last_panel
+        return tracker
+
+    def test_registration_out_of_order(self, tracker):
+        """Test scenes are indexed by first panel, ties in registration order."""
+        introduced = tracker.get_introduced_scenes(100)
+
+        assert [s.location for s in introduced] == [
+            "Lab", "Alley", "Harbor", "Street", "Rooftop", "rooftop", "Diner"
+        ]
+        assert [s.id for s in tracker.get_all_scenes()] == [
+            f"scene_{i}" for i in range(len(SCENES))
+        ]
+
+    def test_point_queries_match_scan(self, tracker):
+        """Test per-panel queries against a brute-force scan."""
+        for panel in range(0, 18):
+            assert tracker.get_introduced_scenes(panel) == introduced_by(tracker, panel)
+            assert tracker.get_new_scenes_in_panel(panel) == [
+                s for s in tracker.scenes.values() if s.first_introduced == panel
+            ]
+            for scene_id, scene in tracker.scenes.items():
+                assert tracker.is_scene_introduced(scene_id, panel) == (
+                    scene.first_introduced <= panel
+                )
+
+    def test_range_queries_match_scan(self, tracker):
+        """Test panel range queries against a brute-force scan."""
+        for start in range(0, 18):
+            for end in range(start, 18):
+                assert tracker.get_scenes_in_panel_range(start, end) == [
+                    s for s in introduced_by(tracker, end) if s.last_seen >= start
+                ]
+
+    def test_location_lookup_keeps_first_scene(self, tracker):
+        """Test location lookup is case-insensitive and keeps the first scene."""
+        assert tracker.get_scene_by_location("ROOFTOP").id == "scene_0"
+        assert tracker.get_scene_by_location("harbor").location == "Harbor"
+        assert tracker.get_scene_by_location("Moon") is None
+
+    def test_scene_changes_in_and_out_of_order(self, tracker):
+        """Test scene change range queries whatever order panels are seen in."""
+        for scene_id, panel in [
+            ("scene_3", 1), ("scene_1", 2), ("scene_5", 2), ("scene_4", 4),
+            ("scene_1", 3), ("scene_0", 7), ("scene_3", 5), ("scene_3", 6),
+        ]:
+            tracker.set_scene_for_panel(scene_id, panel)
+
+        # Staying on the same scene records no change
+        assert len(tracker.scene_changes) == 7
+        assert [c.panel_number for c in tracker.get_scene_changes()] == [1, 2, 2, 4, 3, 7, 5]
+        for start in range(0, 9):
+            for end in range(start, 9):
+                assert tracker.get_scene_changes_in_range(start, end) == changes_between(
+                    tracker, start, end
+                )
+        assert [c.to_scene_id for c in tracker.get_scene_changes_in_range(2, 2)] == [
+            "scene_1", "scene_5"
+        ]
+
+    def test_set_scene_for_unknown_scene(self, tracker):
+        """Test unknown scene IDs are ignored."""
+        assert tracker.set_scene_for_panel("scene_99", 3) is None
+        assert tracker.get_scene_changes() == []
+
+    def test_snapshots_invalidated(self, tracker):
+        """Test cached snapshots are rebuilt after registration and changes."""
+        scenes = tracker.get_all_scenes()
+        changes = tracker.get_scene_changes()
+        assert tracker.get_all_scenes() is scenes
+        assert tracker.get_scene_changes() is changes
+
+        tracker.register_scene("Bridge", "Bridge view", 3)
+        assert tracker.get_all_scenes() is not scenes
+        assert len(tracker.get_all_scenes()) == len(SCENES) + 1
+        assert tracker.get_scene_changes() is changes
+
+        scenes = tracker.get_all_scenes()
+        tracker.set_scene_for_panel("scene_0", 7)
+        assert tracker.get_scene_changes() is not changes
+        assert len(tracker.get_scene_changes()) == 1
+        assert tracker.get_all_scenes() is scenes
+
+        # Repeating the current scene changes nothing
+        changes = tracker.get_scene_changes()
+        tracker.set_scene_for_panel("scene_0", 8)
+        assert tracker.get_scene_changes() is changes
+
+    def test_add_color_to_palette_dedups(self, tracker):
+        """Test palette colors are added once, in order."""
+        scene = tracker.register_scene("Park", "Park view", 3, color_palette=["green"])
+
+        assert tracker.add_color_to_palette(scene.id, "blue")
+        assert tracker.add_color_to_palette(scene.id, "green")
+        assert tracker.add_color_to_palette(scene.id, "blue")
+        assert scene.color_palette == ["green", "blue"]
+        assert not tracker.add_color_to_palette("scene_99", "red")
+
+    def test_reset_clears_every_index(self, tracker):
+        """Test reset leaves no scene reachable through any query."""
+        tracker.set_scene_for_panel("scene_1", 2)
+        tracker.get_all_scenes()
+        tracker.get_scene_changes()
+
+        tracker.reset()
+
+        assert tracker.get_all_scenes() == []
+        assert tracker.get_scene_changes() == []
+        assert tracker.get_introduced_scenes(100) == []
+        assert tracker.get_scenes_in_panel_range(0, 100) == []
+        assert tracker.get_new_scenes_in_panel(2) == []
+        assert tracker.get_scene_changes_in_range(0, 100) == []
+        assert tracker.get_scene_by_location("Alley") is None
+        assert tracker.get_current_scene() is None
+
+        scene = tracker.register_scene("Alley", "Alley again", 5)
+        assert scene.id == "scene_0"
+        assert tracker.get_introduced_scenes(100) == [scene]
+        assert tracker.get_scene_by_location("alley") is scene
+        assert tracker.add_color_to_palette(scene.id, "grey")
+        assert scene.color_palette == ["grey"]